@@ -8,8 +8,10 @@ import sys
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from app.data.models import Base
 from app.data.models import Blog
+from app.data.models import BlogWrite
 from app.data.models import Tag
 from app.data.models import Contact
+from app.data.models import RevokedToken
 from app.data.models import User
 
 config = context.config
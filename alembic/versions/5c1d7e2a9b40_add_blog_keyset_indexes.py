@@ -0,0 +1,35 @@
+"""Add blog keyset pagination indexes
+
+Revision ID: 5c1d7e2a9b40
+Revises: 2389e0745e2c
+Create Date: 2026-10-18 09:12:04.311842
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '5c1d7e2a9b40'
+down_revision = '2389e0745e2c'
+branch_labels = None
+depends_on = None
+
+
+SORT_FIELDS = ['publication_dt', 'updated_dt', 'title', 'reading_time']
+
+
+def upgrade():
+    for field in SORT_FIELDS:
+        op.create_index(
+            f'ix_blog_published_{field}_id',
+            'blog',
+            [field, 'id'],
+            unique=False,
+            postgresql_where=sa.text("status = 'published'"),
+        )
+
+
+def downgrade():
+    for field in reversed(SORT_FIELDS):
+        op.drop_index(f'ix_blog_published_{field}_id', table_name='blog')
@@ -0,0 +1,43 @@
+"""Add blog full-text search vector
+
+Revision ID: 8e3f0b6d4a21
+Revises: 5c1d7e2a9b40
+Create Date: 2026-10-18 10:47:26.905113
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = '8e3f0b6d4a21'
+down_revision = '5c1d7e2a9b40'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column('blog', sa.Column(
+        'search_vector',
+        postgresql.TSVECTOR(),
+        sa.Computed(
+            "setweight(to_tsvector('english', coalesce(title, '')), 'A') || "
+            "setweight(to_tsvector('english', coalesce(excerpt, '')), 'B') || "
+            "setweight(to_tsvector('english', coalesce(content, '')), 'C')",
+            persisted=True,
+        ),
+        nullable=True,
+    ))
+    op.create_index(
+        'ix_blog_search_vector',
+        'blog',
+        ['search_vector'],
+        unique=False,
+        postgresql_using='gin',
+    )
+
+
+def downgrade():
+    op.drop_index('ix_blog_search_vector', table_name='blog')
+    op.drop_column('blog', 'search_vector')
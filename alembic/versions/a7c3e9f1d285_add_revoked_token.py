@@ -0,0 +1,35 @@
+"""Add revoked_token
+
+Revision ID: a7c3e9f1d285
+Revises: f3b8d1a6c072
+Create Date: 2026-10-19 01:02:48.930415
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'a7c3e9f1d285'
+down_revision = 'f3b8d1a6c072'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('revoked_token',
+    sa.Column('key', sa.String(length=64), nullable=False),
+    sa.Column('reason', sa.String(length=20), nullable=False),
+    sa.Column('expires_at', sa.DateTime(), nullable=False),
+    sa.Column('expiry_bucket', sa.Integer(), nullable=False),
+    sa.Column('revoked_dt', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('key')
+    )
+    op.create_index(op.f('ix_revoked_token_expiry_bucket'), 'revoked_token', ['expiry_bucket'], unique=False)
+    op.create_index(op.f('ix_revoked_token_revoked_dt'), 'revoked_token', ['revoked_dt'], unique=False)
+
+
+def downgrade():
+    op.drop_index(op.f('ix_revoked_token_revoked_dt'), table_name='revoked_token')
+    op.drop_index(op.f('ix_revoked_token_expiry_bucket'), table_name='revoked_token')
+    op.drop_table('revoked_token')
@@ -0,0 +1,43 @@
+"""Add blog_write
+
+Revision ID: c249cdb88ed6
+Revises: a7c3e9f1d285
+Create Date: 2026-10-19 02:16:21.030087
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = 'c249cdb88ed6'
+down_revision = 'a7c3e9f1d285'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    blog_write = op.create_table('blog_write',
+    sa.Column('id', sa.BigInteger(), nullable=False),
+    sa.Column('blog_ids', postgresql.ARRAY(sa.UUID()), nullable=False),
+    sa.Column('slugs', postgresql.ARRAY(sa.String(length=255)), nullable=False),
+    sa.Column('tag_ids', postgresql.ARRAY(sa.UUID()), nullable=False),
+    sa.Column('bulk', sa.Boolean(), nullable=False),
+    sa.Column('written_dt', sa.DateTime(), nullable=False),
+    sa.Column('processed_dt', sa.DateTime(), nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_blog_write_pending', 'blog_write', ['id'], unique=False, postgresql_where=sa.text('processed_dt IS NULL'))
+    # Writes made before the log existed may not have reached derived data;
+    # one pending bulk write brings it up to date and starts the generation
+    op.execute(
+        blog_write.insert().values(
+            blog_ids=[], slugs=[], tag_ids=[], bulk=True, written_dt=sa.func.timezone('UTC', sa.func.now())
+        )
+    )
+
+
+def downgrade():
+    op.drop_index('ix_blog_write_pending', table_name='blog_write', postgresql_where=sa.text('processed_dt IS NULL'))
+    op.drop_table('blog_write')
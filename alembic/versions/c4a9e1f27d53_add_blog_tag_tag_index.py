@@ -0,0 +1,26 @@
+"""Add blog_tag (tag_id, blog_id) index
+
+Revision ID: c4a9e1f27d53
+Revises: 8e3f0b6d4a21
+Create Date: 2026-10-18 21:02:41.538120
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c4a9e1f27d53'
+down_revision = '8e3f0b6d4a21'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index(
+        'ix_blog_tag_tag_id_blog_id', 'blog_tag', ['tag_id', 'blog_id'], unique=False
+    )
+
+
+def downgrade():
+    op.drop_index('ix_blog_tag_tag_id_blog_id', table_name='blog_tag')
@@ -0,0 +1,185 @@
+"""Add blog content summary columns
+
+Revision ID: d81f4b2c6e90
+Revises: c4a9e1f27d53
+Create Date: 2026-10-18 22:14:09.772310
+
+"""
+import hashlib
+import math
+import re
+import unicodedata
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = 'd81f4b2c6e90'
+down_revision = 'c4a9e1f27d53'
+branch_labels = None
+depends_on = None
+
+
+BATCH_SIZE = 500
+
+blog = sa.table(
+    'blog',
+    sa.column('id', postgresql.UUID(as_uuid=True)),
+    sa.column('content', sa.Text()),
+    sa.column('excerpt', sa.Text()),
+    sa.column('seo_description', sa.String(255)),
+    sa.column('reading_time', sa.Integer()),
+    sa.column('word_count', sa.Integer()),
+    sa.column('content_hash', sa.String(64)),
+    sa.column('outline', postgresql.JSONB()),
+)
+
+
+# Frozen copy of app.data.content.summarize_content as of this revision, so
+# the backfill does not change (or break) when the application code does
+WORDS_PER_MINUTE = 200
+EXCERPT_LENGTH = 280
+SEO_DESCRIPTION_LENGTH = 160
+
+_HEADING = re.compile(r"[ ]{0,3}(#{1,6})[ \t]+(.+?)(?:[ \t]+#+)?[ \t]*$")
+_RULE = re.compile(r"[ \t]*(?:[-*_][ \t]*){3,}$")
+_LINK_DEFINITION = re.compile(r"[ ]{0,3}\[[^\]]+\]:")
+_LINE_MARKER = re.compile(r"[ \t]*(?:>[ \t]?|[-*+][ \t]+|\d+[.)][ \t]+)+")
+_IMAGE = re.compile(r"!\[[^\]]*\]\([^)]*\)")
+_LINK = re.compile(r"\[([^\]]+)\](?:\([^)]*\)|\[[^\]]*\])")
+_HTML_TAG = re.compile(r"<[^>]+>")
+_INLINE_CODE = re.compile(r"`+([^`]*)`+")
+_EMPHASIS = re.compile(
+    r"(\*\*|\*|~~)(?=\S)(.+?)(?<=\S)\1|(?<!\w)(__|_)(?=\S)(.+?)(?<=\S)\3(?!\w)"
+)
+
+
+def _strip_inline(text):
+    if "](" in text:
+        text = _IMAGE.sub("", text)
+    if "[" in text:
+        text = _LINK.sub(r"\1", text)
+    if "`" in text:
+        text = _INLINE_CODE.sub(r"\1", text)
+    if "<" in text:
+        text = _HTML_TAG.sub("", text)
+    if "*" in text or "_" in text or "~~" in text:
+        previous = None
+        while previous != text:
+            previous, text = text, _EMPHASIS.sub(lambda m: m.group(2) or m.group(4), text)
+    return text
+
+
+def _split_markdown(content):
+    body, headings = [], []
+    fence = None
+    for line in content.splitlines():
+        stripped = line.strip()
+        if fence is not None:
+            if stripped.startswith(fence) and not stripped.strip(fence[0]):
+                fence = None
+            continue
+        if not stripped:
+            continue
+        first = stripped[0]
+        if first in "`~" and stripped.startswith(("```", "~~~")):
+            fence = stripped[:len(stripped) - len(stripped.lstrip(first))]
+            continue
+        if first == "#":
+            match = _HEADING.match(line)
+            if match:
+                headings.append((len(match.group(1)), match.group(2)))
+                continue
+        if first in "-*_" and _RULE.match(line):
+            continue
+        if first == "[" and _LINK_DEFINITION.match(line):
+            continue
+        if first in ">-*+0123456789":
+            line = _LINE_MARKER.sub("", line, count=1)
+        body.append(line)
+    return body, headings
+
+
+def _truncate(text, length):
+    if len(text) <= length:
+        return text
+    cut = text[:length - 1].rsplit(" ", 1)[0].rstrip(" ,;:.-\u2013\u2014")
+    return cut + "\u2026"
+
+
+def _outline(headings):
+    seen = {}
+    items = []
+    for level, text in headings:
+        text = " ".join(_strip_inline(text).split())
+        if not text:
+            continue
+        anchor = unicodedata.normalize("NFKC", text).lower()
+        anchor = re.sub(r"[^\w\- ]", "", anchor).strip().replace(" ", "-")
+        count = seen.get(anchor, 0)
+        seen[anchor] = count + 1
+        items.append({"level": level, "text": text, "anchor": f"{anchor}-{count}" if count else anchor})
+    return items
+
+
+def summarize_content(content):
+    body, headings = _split_markdown(content)
+    text = " ".join(_strip_inline(" ".join(body)).split())
+    items = _outline(headings)
+    words = len(text.split()) + sum(len(item["text"].split()) for item in items)
+    excerpt = _truncate(text, EXCERPT_LENGTH) or None
+    return {
+        'reading_time': max(1, math.ceil(words / WORDS_PER_MINUTE)),
+        'word_count': words,
+        'content_hash': hashlib.sha256(content.encode("utf-8")).hexdigest(),
+        'outline': items,
+        'excerpt': excerpt,
+        'seo_description': _truncate(excerpt, SEO_DESCRIPTION_LENGTH) if excerpt else None,
+    }
+
+
+def backfill():
+    """Summarize existing posts; hand-written excerpts and descriptions are kept."""
+    connection = op.get_bind()
+    update = (
+        blog.update()
+        .where(blog.c.id == sa.bindparam('blog_id'))
+        .values(
+            reading_time=sa.bindparam('reading_time'),
+            word_count=sa.bindparam('word_count'),
+            content_hash=sa.bindparam('content_hash'),
+            outline=sa.bindparam('outline', type_=postgresql.JSONB()),
+            excerpt=sa.func.coalesce(sa.func.nullif(blog.c.excerpt, ''), sa.bindparam('excerpt')),
+            seo_description=sa.func.coalesce(
+                sa.func.nullif(blog.c.seo_description, ''), sa.bindparam('seo_description')
+            ),
+        )
+    )
+
+    last_id = None
+    while True:
+        query = sa.select(blog.c.id, blog.c.content).order_by(blog.c.id).limit(BATCH_SIZE)
+        if last_id is not None:
+            query = query.where(blog.c.id > last_id)
+        rows = connection.execute(query).all()
+        if not rows:
+            break
+
+        params = [dict(summarize_content(row.content), blog_id=row.id) for row in rows]
+        connection.execute(update, params)
+        last_id = rows[-1].id
+
+
+def upgrade():
+    op.add_column('blog', sa.Column('word_count', sa.Integer(), nullable=True))
+    op.add_column('blog', sa.Column('content_hash', sa.String(length=64), nullable=True))
+    op.add_column('blog', sa.Column('outline', postgresql.JSONB(), nullable=True))
+    backfill()
+
+
+def downgrade():
+    op.drop_column('blog', 'outline')
+    op.drop_column('blog', 'content_hash')
+    op.drop_column('blog', 'word_count')
@@ -0,0 +1,24 @@
+"""Add related_blog score
+
+Revision ID: e5a2c9d7f314
+Revises: d81f4b2c6e90
+Create Date: 2026-10-18 23:05:52.104871
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e5a2c9d7f314'
+down_revision = 'd81f4b2c6e90'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column('related_blog', sa.Column('score', sa.Float(), nullable=True))
+
+
+def downgrade():
+    op.drop_column('related_blog', 'score')
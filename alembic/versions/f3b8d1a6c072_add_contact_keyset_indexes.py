@@ -0,0 +1,31 @@
+"""Add contact keyset pagination indexes
+
+Revision ID: f3b8d1a6c072
+Revises: e5a2c9d7f314
+Create Date: 2026-10-19 00:21:37.518204
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'f3b8d1a6c072'
+down_revision = 'e5a2c9d7f314'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # The single-column indexes are prefixes of the new ones
+    op.create_index('ix_contact_status_submission_dt_id', 'contact', ['status', 'submission_dt', 'id'], unique=False)
+    op.create_index('ix_contact_submission_dt_id', 'contact', ['submission_dt', 'id'], unique=False)
+    op.drop_index('ix_contact_status', table_name='contact')
+    op.drop_index('ix_contact_submission_dt', table_name='contact')
+
+
+def downgrade():
+    op.create_index('ix_contact_submission_dt', 'contact', ['submission_dt'], unique=False)
+    op.create_index('ix_contact_status', 'contact', ['status'], unique=False)
+    op.drop_index('ix_contact_submission_dt_id', table_name='contact')
+    op.drop_index('ix_contact_status_submission_dt_id', table_name='contact')
@@ -1,12 +1,16 @@
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 from jose import jwt, JWTError
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from app.core.config import settings
-from app.data.repositories.session import SessionLocal
+from app.data.repositories.session import AsyncSessionLocal, SessionLocal
 from app.data.models.user import User
 from app.api.schemas.auth import TokenPayload
+from app.domain.services.auth.auth_cache import AuthenticatedUser, auth_cache
 from app.domain.services.auth.auth_service import AuthService
+from app.domain.services.auth.token_revocation import family_key, token_revocations
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/admin/auth/login")
 
@@ -19,40 +23,70 @@ def get_db():
         db.close()
 
 
-def get_auth_service(db: Session = Depends(get_db)) -> AuthService:
+async def get_async_db():
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
+def get_auth_service(db: AsyncSession = Depends(get_async_db)) -> AuthService:
     return AuthService(db)
 
 
 async def get_current_user(
-    db: Session = Depends(get_db), token: str = Depends(oauth2_scheme)
-) -> User:
-    try:
-        payload = jwt.decode(
-            token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM]
-        )
-        token_data = TokenPayload(**payload)
+    db: AsyncSession = Depends(get_async_db), token: str = Depends(oauth2_scheme)
+) -> AuthenticatedUser:
+    """
+    Authenticate the bearer token.
+
+    Verified tokens and user snapshots are cached (see AuthCache), so a
+    repeat request neither decodes the token nor queries the database. The
+    token's family is checked against the revocation list, whose Bloom
+    filter keeps that check in process for tokens that were not revoked.
+    """
+    token_data = auth_cache.get_claims(token)
+    if token_data is None:
+        try:
+            payload = jwt.decode(
+                token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM]
+            )
+            token_data = TokenPayload(**payload)
 
-        if token_data.type != "access":
+            if token_data.type != "access":
+                raise HTTPException(
+                    status_code=status.HTTP_401_UNAUTHORIZED,
+                    detail="Invalid token type",
+                )
+
+        except JWTError:
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Invalid token type",
+                detail="Could not validate credentials",
             )
+        auth_cache.set_claims(token, token_data)
 
-    except JWTError:
+    # Signed out or reused token families; almost always answered in process
+    if token_data.fam and await token_revocations.is_revoked(family_key(token_data.fam)):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Could not validate credentials",
+            detail="Token has been revoked",
         )
 
-    user = db.query(User).filter(User.id == token_data.sub).first()
-    if not user:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="User not found",
-        )
+    user_id = int(token_data.sub)
+    user = auth_cache.get_user(user_id)
+    if user is None:
+        result = await db.scalars(select(User).where(User.id == user_id))
+        db_user = result.first()
+        if not db_user:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="User not found",
+            )
+        user = AuthenticatedUser.from_user(db_user)
+        auth_cache.set_user(user)
+
     if not user.is_active:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Inactive user",
         )
-    return user
+    return user
\ No newline at end of file
@@ -0,0 +1,163 @@
+"""
+RSS 2.0, Atom and sitemap rendering for published blogs.
+
+Each document is written as a head, the entries for any number of row
+batches, and a tail, so routes can stream it while rows arrive from a
+server-side cursor. Rows carry FEED_COLUMNS (slug, title, excerpt,
+publication_dt, updated_dt); datetimes are naive UTC.
+"""
+import re
+from datetime import datetime, timezone
+from email.utils import format_datetime
+from typing import Callable, Iterable, Optional
+from urllib.parse import quote
+from xml.sax.saxutils import escape
+
+from app.core.config import settings
+
+# Characters XML 1.0 does not allow, even escaped
+_INVALID_XML_CHARS = re.compile(r"[\x00-\x08\x0b\x0c\x0e-\x1f\ufffe\uffff]")
+
+_ATTRIBUTE_ENTITIES = {'"': "&quot;"}
+
+# Most URLs the sitemap protocol allows in one file
+SITEMAP_MAX_URLS = 50000
+
+
+def _text(value: Optional[str]) -> str:
+    return escape(_INVALID_XML_CHARS.sub("", value or ""))
+
+
+def _attribute(value: str) -> str:
+    return escape(_INVALID_XML_CHARS.sub("", value), _ATTRIBUTE_ENTITIES)
+
+
+def _utc(value: datetime) -> datetime:
+    return value.replace(tzinfo=timezone.utc)
+
+
+def rfc822(value: datetime) -> str:
+    return format_datetime(_utc(value), usegmt=True)
+
+
+def rfc3339(value: datetime) -> str:
+    return _utc(value).replace(microsecond=0).isoformat().replace("+00:00", "Z")
+
+
+def site_url() -> str:
+    return settings.SITE_URL.rstrip("/") + "/"
+
+
+def feed_url(path: str) -> str:
+    return settings.SITE_URL.rstrip("/") + path
+
+
+def post_url(slug: str) -> str:
+    return f"{settings.SITE_URL.rstrip('/')}/blog/{quote(slug)}"
+
+
+def _published(row) -> datetime:
+    return row.publication_dt or row.updated_dt
+
+
+class FeedDocument:
+    """How one XML document renders: head, entries per row batch, and tail."""
+
+    def __init__(
+        self,
+        media_type: str,
+        head: Callable[[str, Optional[datetime]], str],
+        entries: Callable[[Iterable], str],
+        tail: str,
+        max_items: int,
+    ):
+        self.media_type = media_type
+        self.head = head
+        self.entries = entries
+        self.tail = tail
+        self.max_items = max_items
+
+
+def _rss_head(self_url: str, updated: Optional[datetime]) -> str:
+    last_build = f"<lastBuildDate>{rfc822(updated)}</lastBuildDate>" if updated else ""
+    return (
+        '<?xml version="1.0" encoding="UTF-8"?>\n'
+        '<rss version="2.0" xmlns:atom="http://www.w3.org/2005/Atom"><channel>'
+        f"<title>{_text(settings.SITE_NAME)}</title>"
+        f"<link>{_text(site_url())}</link>"
+        f"<description>{_text(settings.SITE_DESCRIPTION)}</description>"
+        f'<atom:link href="{_attribute(self_url)}" rel="self" type="application/rss+xml"/>'
+        f"{last_build}\n"
+    )
+
+
+def _rss_items(rows: Iterable) -> str:
+    items = []
+    for row in rows:
+        url = _text(post_url(row.slug))
+        items.append(
+            f"<item><title>{_text(row.title)}</title><link>{url}</link>"
+            f'<guid isPermaLink="true">{url}</guid>'
+            f"<pubDate>{rfc822(_published(row))}</pubDate>"
+            f"<description>{_text(row.excerpt)}</description></item>\n"
+        )
+    return "".join(items)
+
+
+def _atom_head(self_url: str, updated: Optional[datetime]) -> str:
+    # Atom requires <updated>; an empty feed falls back to the current time
+    updated = updated or datetime.utcnow()
+    return (
+        '<?xml version="1.0" encoding="UTF-8"?>\n'
+        '<feed xmlns="http://www.w3.org/2005/Atom">'
+        f"<id>{_text(site_url())}</id>"
+        f"<title>{_text(settings.SITE_NAME)}</title>"
+        f"<subtitle>{_text(settings.SITE_DESCRIPTION)}</subtitle>"
+        f"<updated>{rfc3339(updated)}</updated>"
+        f'<link href="{_attribute(site_url())}"/>'
+        f'<link href="{_attribute(self_url)}" rel="self" type="application/atom+xml"/>'
+        f"<author><name>{_text(settings.SITE_NAME)}</name></author>\n"
+    )
+
+
+def _atom_entries(rows: Iterable) -> str:
+    entries = []
+    for row in rows:
+        url = post_url(row.slug)
+        entries.append(
+            f"<entry><id>{_text(url)}</id><title>{_text(row.title)}</title>"
+            f'<link href="{_attribute(url)}"/>'
+            f"<published>{rfc3339(_published(row))}</published>"
+            f"<updated>{rfc3339(row.updated_dt)}</updated>"
+            f"<summary>{_text(row.excerpt)}</summary></entry>\n"
+        )
+    return "".join(entries)
+
+
+def _sitemap_head(self_url: str, updated: Optional[datetime]) -> str:
+    lastmod = f"<lastmod>{rfc3339(updated)}</lastmod>" if updated else ""
+    return (
+        '<?xml version="1.0" encoding="UTF-8"?>\n'
+        '<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">'
+        f"<url><loc>{_text(site_url())}</loc>{lastmod}</url>\n"
+    )
+
+
+def _sitemap_urls(rows: Iterable) -> str:
+    return "".join(
+        f"<url><loc>{_text(post_url(row.slug))}</loc><lastmod>{rfc3339(row.updated_dt)}</lastmod></url>\n"
+        for row in rows
+    )
+
+
+# Feeds carry the newest posts only; the sitemap lists every post, up to the
+# protocol limit less the site root
+RSS = FeedDocument(
+    "application/rss+xml", _rss_head, _rss_items, "</channel></rss>\n", settings.FEED_MAX_ITEMS
+)
+ATOM = FeedDocument(
+    "application/atom+xml", _atom_head, _atom_entries, "</feed>\n", settings.FEED_MAX_ITEMS
+)
+SITEMAP = FeedDocument(
+    "application/xml", _sitemap_head, _sitemap_urls, "</urlset>\n", SITEMAP_MAX_URLS - 1
+)
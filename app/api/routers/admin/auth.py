@@ -1,10 +1,11 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Request
+from fastapi import APIRouter, Depends, HTTPException, status, Request, Response
 from fastapi.security import OAuth2PasswordRequestForm
 from pydantic import BaseModel
 from app.api.deps import get_auth_service
 from app.domain.services.auth.auth_service import AuthService
 from app.api.schemas.user import TokenResponse
 from app.core.rate_limiting import limiter
+from app.core.security import PasswordHasherBusyError
 
 router = APIRouter()
 
@@ -22,7 +23,14 @@ async def login_for_access_token(
     OAuth2 compatible token login, get an access token for future requests
     Rate limited to 10 attempts per hour per IP address
     """
-    user = auth_service.authenticate_user(form_data.username, form_data.password)
+    try:
+        user = await auth_service.authenticate_user(form_data.username, form_data.password)
+    except PasswordHasherBusyError:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Too many login attempts in progress, try again shortly",
+            headers={"Retry-After": "1"},
+        )
     if not user:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -30,7 +38,25 @@ async def login_for_access_token(
             headers={"WWW-Authenticate": "Bearer"},
         )
 
-    return auth_service.login(user.id)
+    return await auth_service.login(user.id)
+
+@router.post("/logout", status_code=status.HTTP_204_NO_CONTENT)
+@limiter.limit("60/hour")
+async def logout(
+    request: Request,
+    refresh_request: RefreshTokenRequest,
+    auth_service: AuthService = Depends(get_auth_service)
+):
+    """Revoke the refresh token and every token issued since its login"""
+    try:
+        await auth_service.logout(refresh_request.refresh_token)
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid refresh token",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
 
 @router.post("/refresh", response_model=TokenResponse)
 @limiter.limit("60/hour")
@@ -39,9 +65,14 @@ async def refresh_token(
     refresh_request: RefreshTokenRequest,
     auth_service: AuthService = Depends(get_auth_service)
 ):
-    """Refresh access token using a valid refresh token"""
+    """
+    Refresh access token using a valid refresh token.
+
+    The refresh token is rotated: the one sent is revoked and a new one is
+    returned. Sending a rotated token again revokes its whole family.
+    """
     try:
-        new_tokens = auth_service.refresh_tokens(refresh_request.refresh_token)
+        new_tokens = await auth_service.refresh_tokens(refresh_request.refresh_token)
         return new_tokens
     except Exception as e:
         raise HTTPException(
@@ -0,0 +1,164 @@
+import csv
+import io
+from datetime import datetime
+from typing import AsyncIterator, Iterable, Literal, Optional
+
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.deps import get_async_db, get_current_user
+from app.api.schemas.contact import (
+    ContactDTO,
+    ContactListResponseDTO,
+    ContactStatusUpdateDTO,
+    ContactStatusUpdateResultDTO,
+)
+from app.core.rate_limiting import limiter
+from app.data.repositories.session import AsyncSessionLocal
+from app.domain.services.contact_service import ContactService
+from app.domain.services.pagination import InvalidCursorError
+
+# Every route here requires a signed-in admin
+router = APIRouter(dependencies=[Depends(get_current_user)])
+
+ContactStatus = Literal["new", "read", "replied", "archived"]
+
+# Field names of exported records, matching ContactDTO
+EXPORT_FIELDS = ["uuid", "submission_date", "status", "name", "email", "subject", "message", "ip_address"]
+
+# Spreadsheets run cells starting with these as formulas
+_FORMULA_PREFIXES = ("=", "+", "-", "@", "\t", "\r")
+
+
+def get_contact_service() -> ContactService:
+    """Dependency to get contact service instance."""
+    return ContactService()
+
+
+@router.get("", response_model=ContactListResponseDTO)
+@limiter.limit("60/minute")
+async def list_contacts(
+    request: Request,
+    status: Optional[ContactStatus] = Query(default=None, description="Only submissions with this status"),
+    limit: int = Query(default=50, ge=1, le=200, description="Items per page"),
+    cursor: Optional[str] = Query(default=None, description="next_cursor of the previous page"),
+    db: AsyncSession = Depends(get_async_db),
+    contact_service: ContactService = Depends(get_contact_service)
+):
+    """
+    List contact submissions, newest first.
+
+    Pages are keyset-paginated on (submission_date, uuid): pass next_cursor
+    back as **cursor** to get the following page, which stays as cheap as the
+    first one however deep it is.
+    """
+    try:
+        contacts, next_cursor = await contact_service.list_contacts(db, status, limit, cursor)
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    return ContactListResponseDTO(
+        items=[
+            ContactDTO(
+                uuid=contact.id,
+                name=contact.name,
+                email=contact.email,
+                subject=contact.subject,
+                message=contact.message,
+                submission_date=contact.submission_dt,
+                ip_address=contact.ip_address,
+                status=contact.status,
+            )
+            for contact in contacts
+        ],
+        next_cursor=next_cursor,
+    )
+
+
+@router.patch("/status", response_model=ContactStatusUpdateResultDTO)
+@limiter.limit("60/minute")
+async def update_contact_status(
+    request: Request,
+    status_update: ContactStatusUpdateDTO,
+    db: AsyncSession = Depends(get_async_db),
+    contact_service: ContactService = Depends(get_contact_service)
+):
+    """
+    Set the status of up to 1000 submissions with a single UPDATE.
+
+    Returns how many submissions changed; unknown ids and submissions that
+    already have the status are not counted.
+    """
+    updated = await contact_service.update_status(db, status_update.ids, status_update.status)
+    return ContactStatusUpdateResultDTO(updated=updated)
+
+
+def _csv_cell(value) -> str:
+    if value is None:
+        return ""
+    if isinstance(value, datetime):
+        return value.isoformat()
+    value = str(value)
+    if value.startswith(_FORMULA_PREFIXES):
+        return "'" + value
+    return value
+
+
+def _csv_rows(rows: Iterable) -> str:
+    output = io.StringIO()
+    writer = csv.writer(output)
+    for row in rows:
+        writer.writerow([_csv_cell(value) for value in row])
+    return output.getvalue()
+
+
+def _ndjson_rows(rows: Iterable) -> bytes:
+    return b"".join(
+        orjson.dumps(
+            dict(zip(EXPORT_FIELDS, (str(row.id), *row[1:]))),
+            option=orjson.OPT_APPEND_NEWLINE,
+        )
+        for row in rows
+    )
+
+
+async def _export(
+    export_format: str, status: Optional[str], contact_service: ContactService
+) -> AsyncIterator[bytes]:
+    """
+    Yield the export one cursor batch at a time. The generator opens its own
+    session, as it keeps reading after the route has returned.
+    """
+    if export_format == "csv":
+        yield _csv_rows([EXPORT_FIELDS]).encode("utf-8")
+    async with AsyncSessionLocal() as db:
+        async for rows in contact_service.iter_export(db, status):
+            if export_format == "csv":
+                yield _csv_rows(rows).encode("utf-8")
+            else:
+                yield _ndjson_rows(rows)
+
+
+@router.get("/export", response_class=StreamingResponse)
+@limiter.limit("10/minute")
+async def export_contacts(
+    request: Request,
+    format: Literal["csv", "ndjson"] = Query(default="csv", description="csv or ndjson"),
+    status: Optional[ContactStatus] = Query(default=None, description="Only submissions with this status"),
+    contact_service: ContactService = Depends(get_contact_service)
+):
+    """
+    Download submissions, oldest first, as CSV or newline-delimited JSON.
+
+    Rows are read from a server-side cursor and streamed batch by batch, so
+    memory use does not grow with the number of submissions.
+    """
+    media_type = "text/csv" if format == "csv" else "application/x-ndjson"
+    filename = f"contacts-{datetime.utcnow():%Y%m%d}.{format}"
+    return StreamingResponse(
+        _export(format, status, contact_service),
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
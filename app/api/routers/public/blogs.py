@@ -1,14 +1,47 @@
-from fastapi import APIRouter, Depends, Query, HTTPException, Request
-from sqlalchemy.orm import Session
+import hashlib
+from datetime import timezone
+from email.utils import format_datetime
+
+from fastapi import APIRouter, Depends, Query, HTTPException, Request, Response
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List, Optional
 
-from app.api.deps import get_db
-from app.api.schemas.blog import BlogListResponseDTO, BlogListItemDTO, TagDTO
+from app.api.deps import get_async_db
+from app.api.serialization import render_blog_list
+from app.api.schemas.blog import BlogDetailDTO, BlogListResponseDTO, RelatedBlogDTO, TagDTO
+from app.core.cache import create_response_cache
+from app.data.events import BlogWriteEvent, on_blog_write, on_related_write
 from app.domain.services.blog_service import BlogService
+from app.domain.services.pagination import InvalidCursorError
 from app.core.rate_limiting import limiter
 
 router = APIRouter()
 
+# Serialized listing responses, dropped whenever a blog, tag or blog tag changes
+# in any process (writes by scripts arrive through the blog write subscriber)
+blog_list_cache = create_response_cache("blog-list")
+if blog_list_cache is not None:
+    on_blog_write(blog_list_cache.invalidate)
+
+# Serialized blog details keyed by slug. Each entry starts with a header line
+# holding the ETag and the post's updated_dt as Last-Modified. Entries are
+# dropped on writes from any process, so a changed post gets a new ETag and
+# If-None-Match with the old one is answered in full. Details also list the
+# related posts, so recomputing those drops the affected entries too.
+blog_detail_cache = create_response_cache("blog-detail")
+
+
+@on_related_write
+@on_blog_write
+def _invalidate_blog_details(write: BlogWriteEvent) -> None:
+    if blog_detail_cache is None:
+        return
+    # Tag edits show up in every detail, and Core writes may not name slugs
+    if write.bulk or write.tag_ids or (write.blog_ids and not write.slugs):
+        blog_detail_cache.invalidate()
+    else:
+        blog_detail_cache.invalidate_keys(write.slugs)
+
 
 def get_blog_service() -> BlogService:
     """Dependency to get blog service instance."""
@@ -21,11 +54,14 @@ async def list_published_blogs(
     request: Request,
     page: int = Query(default=1, ge=1, description="Page number"),
     page_size: int = Query(default=10, ge=1, le=50, description="Items per page"),
-    tags: Optional[str] = Query(default=None, description="Comma-separated tag UUIDs"),
+    tags: Optional[str] = Query(default=None, description="Comma-separated tag UUIDs or names"),
+    tag_match: str = Query(default="any", description="Match any or all of the tags (any/all)"),
     search_term: Optional[str] = Query(default=None, description="Search in title/content"),
     sort_by: str = Query(default="publication_dt", description="Sort field"),
     sort_dir: str = Query(default="desc", description="Sort direction (asc/desc)"),
-    db: Session = Depends(get_db),
+    cursor: Optional[str] = Query(default=None, description="Keyset cursor from next_cursor/prev_cursor"),
+    include_total: bool = Query(default=True, description="Count matching blogs"),
+    db: AsyncSession = Depends(get_async_db),
     blog_service: BlogService = Depends(get_blog_service)
 ):
     """
@@ -33,55 +69,141 @@ async def list_published_blogs(
 
     - **page**: Page number (default: 1)
     - **page_size**: Items per page (default: 10, max: 50)
-    - **tags**: Comma-separated tag UUIDs for filtering
-    - **search_term**: Search in title, content, and excerpt
-    - **sort_by**: Field to sort by (publication_dt, title, updated_dt, reading_time)
+    - **tags**: Comma-separated tag UUIDs or tag names for filtering
+    - **tag_match**: any (default) keeps blogs with at least one of the tags,
+      all keeps blogs carrying every tag
+    - **search_term**: Full-text search in title, excerpt, and content
+    - **sort_by**: Field to sort by (publication_dt, title, updated_dt, reading_time,
+      or relevance when searching)
     - **sort_dir**: Sort direction (asc or desc)
+    - **cursor**: Keyset cursor from a previous response; replaces **page** and
+      keeps deep pages as cheap as the first one
+    - **include_total**: Set to false to skip counting; total and total_pages
+      are then null
+
+    Responses are cached by their normalized parameters until the next blog
+    or tag write; the X-Cache header tells whether one was served from cache.
     """
     try:
         tag_uuids = []
         if tags:   tag_uuids = [tag.strip() for tag in tags.split(",") if tag.strip()]
 
-        result = blog_service.get_published_blogs(
-            db=db,
+        params = BlogService.normalize_listing_params(
             page=page,
             page_size=page_size,
             tag_uuids=tag_uuids if tag_uuids else None,
             search_term=search_term,
             sort_by=sort_by,
-            sort_dir=sort_dir
+            sort_dir=sort_dir,
+            cursor=cursor,
+            include_total=include_total,
+            tag_match=tag_match
         )
 
-        blog_items = []
-        for blog in result["items"]:
-            tag_dtos = [
-                TagDTO(
-                    uuid=tag.id,
-                    name=tag.name,
-                    color_code=tag.color_code
-                )
+        cache_key = generation = None
+        if blog_list_cache is not None:
+            cache_key = blog_list_cache.key(params)
+            generation = blog_list_cache.generation
+            cached = await blog_list_cache.get(cache_key)
+            if cached is not None:
+                return Response(content=cached, media_type="application/json", headers={"X-Cache": "HIT"})
+
+        result = await blog_service.get_published_blogs(db=db, **params)
+
+        # Rows go straight to JSON; the bytes match BlogListResponseDTO's rendering
+        body = render_blog_list(result)
+        if cache_key is not None:
+            await blog_list_cache.set(cache_key, body, generation)
+        return Response(content=body, media_type="application/json", headers={"X-Cache": "MISS"})
+
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"Internal server error: {str(e)}"
+        )
+
+
+def _detail_response(request: Request, etag: str, last_modified: str, body: bytes, cache_status: str) -> Response:
+    headers = {"ETag": etag, "Last-Modified": last_modified, "X-Cache": cache_status}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+@router.get("/blogs/{slug}", response_model=BlogDetailDTO)
+@limiter.limit("60/minute")
+async def get_published_blog(
+    request: Request,
+    slug: str,
+    db: AsyncSession = Depends(get_async_db),
+    blog_service: BlogService = Depends(get_blog_service)
+):
+    """
+    Get a published blog with its tags by slug.
+
+    Responses are cached per slug until the blog, its tags or its related
+    posts change in any process, and carry an ETag (If-None-Match is answered
+    with 304) and the post's updated_dt as Last-Modified.
+    """
+    slug = slug.strip()
+    try:
+        generation = None
+        if blog_detail_cache is not None:
+            generation = blog_detail_cache.generation
+            cached = await blog_detail_cache.get(slug)
+            if cached is not None:
+                header, body = cached.split(b"\n", 1)
+                etag, last_modified = header.decode("ascii").split(" ", 1)
+                return _detail_response(request, etag, last_modified, body, "HIT")
+
+        blog = await blog_service.get_blog_by_slug(db, slug)
+        if blog is None:
+            raise HTTPException(status_code=404, detail="Blog not found")
+        related = await blog_service.get_related_blogs(db, blog.id)
+
+        response = BlogDetailDTO(
+            uuid=blog.id,
+            title=blog.title,
+            slug=blog.slug,
+            content=blog.content,
+            excerpt=blog.excerpt,
+            publication_date=blog.publication_dt,
+            updated_date=blog.updated_dt,
+            reading_time=blog.reading_time,
+            word_count=blog.word_count,
+            featured_image=blog.featured_image,
+            seo_description=blog.seo_description,
+            outline=blog.outline or [],
+            tags=[
+                TagDTO(uuid=tag.id, name=tag.name, color_code=tag.color_code)
                 for tag in blog.tags
+            ],
+            related=[
+                RelatedBlogDTO(
+                    uuid=post.id,
+                    title=post.title,
+                    slug=post.slug,
+                    excerpt=post.excerpt,
+                    publication_date=post.publication_dt,
+                    reading_time=post.reading_time,
+                )
+                for post in related
             ]
-
-            blog_dto = BlogListItemDTO(
-                uuid=blog.id,
-                title=blog.title,
-                slug=blog.slug,
-                excerpt=blog.excerpt,
-                publication_date=blog.publication_dt,
-                reading_time=blog.reading_time,
-                tags=tag_dtos
-            )
-            blog_items.append(blog_dto)
-
-        return BlogListResponseDTO(
-            items=blog_items,
-            total=result["total"],
-            page=result["page"],
-            page_size=result["page_size"],
-            total_pages=result["total_pages"]
         )
 
+        body = response.model_dump_json(by_alias=True).encode("utf-8")
+        etag = f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+        # updated_dt is stored as naive UTC
+        last_modified = format_datetime(blog.updated_dt.replace(tzinfo=timezone.utc), usegmt=True)
+        if blog_detail_cache is not None:
+            header = f"{etag} {last_modified}\n".encode("ascii")
+            await blog_detail_cache.set(slug, header + body, generation)
+        return _detail_response(request, etag, last_modified, body, "MISS")
+
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=500,
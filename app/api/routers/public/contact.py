@@ -0,0 +1,40 @@
+from datetime import datetime
+
+from fastapi import APIRouter, HTTPException, Request, status
+
+from app.api.schemas.contact import ContactAcceptedDTO, ContactCreateDTO
+from app.core.rate_limiting import limiter
+from app.domain.services.contact_buffer import ContactBufferFullError, contact_buffer
+
+router = APIRouter()
+
+
+@router.post("/contact", response_model=ContactAcceptedDTO, status_code=status.HTTP_202_ACCEPTED)
+@limiter.limit("5/minute")
+async def submit_contact(request: Request, submission: ContactCreateDTO):
+    """
+    Accept a contact form submission.
+
+    The submission is queued and written to the database in a batch shortly
+    after, so the response (202) does not wait for the commit. When the
+    queue is full the request is answered with 503 and Retry-After.
+    """
+    now = datetime.utcnow()
+    try:
+        await contact_buffer.submit({
+            "name": submission.name,
+            "email": submission.email,
+            "subject": submission.subject,
+            "message": submission.message,
+            "submission_dt": now,
+            "created_dt": now,
+            "ip_address": request.client.host if request.client else None,
+            "status": "new",
+        })
+    except ContactBufferFullError:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Too many messages are being submitted, try again shortly",
+            headers={"Retry-After": "5"},
+        )
+    return ContactAcceptedDTO()
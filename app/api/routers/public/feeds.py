@@ -0,0 +1,182 @@
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import AsyncIterator, Dict, Optional, Tuple
+
+from fastapi import APIRouter, Depends, Request, Response
+from fastapi.responses import StreamingResponse
+from sqlalchemy import Row
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.deps import get_async_db
+from app.api.feeds import ATOM, RSS, SITEMAP, FeedDocument, feed_url, rfc822
+from app.core.cache import create_response_cache
+from app.core.rate_limiting import limiter
+from app.data.events import on_blog_write
+from app.data.repositories.session import AsyncSessionLocal
+from app.domain.services.blog_service import BlogService
+
+router = APIRouter()
+
+# Rendered documents keyed by route name, dropped on every blog or tag write
+# in any process. Each entry starts with a header line holding its ETag and
+# Last-Modified.
+feed_cache = create_response_cache("feeds")
+if feed_cache is not None:
+    on_blog_write(feed_cache.invalidate)
+
+
+def get_blog_service() -> BlogService:
+    """Dependency to get blog service instance."""
+    return BlogService()
+
+
+def _validators(row: Row) -> Tuple[Optional[str], Optional[str]]:
+    """
+    ETag and Last-Modified of the feeds.
+
+    The ETag is the newest blog write's id, which changes on every write,
+    removals included. Last-Modified is the later of that write and the
+    newest published update; max(updated_dt) alone would stay put when the
+    newest post is deleted or unpublished.
+    """
+    etag = f'W/"{row.write_id}"' if row.write_id is not None else None
+    # Both are stored as naive UTC
+    changed = max((dt for dt in (row.updated_dt, row.written_dt) if dt is not None), default=None)
+    return etag, rfc822(changed) if changed else None
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    """Weak comparison of an If-None-Match list against an ETag."""
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(tag.strip().removeprefix("W/") == opaque for tag in if_none_match.split(","))
+
+
+def _not_modified(request: Request, etag: Optional[str], last_modified: Optional[str]) -> bool:
+    """
+    Whether If-None-Match matches the ETag or, without If-None-Match,
+    If-Modified-Since is at or after Last-Modified (both have second resolution).
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        return etag is not None and _etag_matches(if_none_match, etag)
+
+    since = request.headers.get("if-modified-since")
+    if not since or not last_modified:
+        return False
+    try:
+        return parsedate_to_datetime(last_modified) <= parsedate_to_datetime(since)
+    except (TypeError, ValueError):
+        return False
+
+
+def _headers(etag: Optional[str], last_modified: Optional[str], cache_status: str) -> Dict[str, str]:
+    headers = {"X-Cache": cache_status}
+    if etag:
+        headers["ETag"] = etag
+    if last_modified:
+        headers["Last-Modified"] = last_modified
+    return headers
+
+
+async def _render(
+    name: str,
+    document: FeedDocument,
+    self_url: str,
+    updated: Optional[datetime],
+    etag: Optional[str],
+    last_modified: Optional[str],
+    generation: Optional[int],
+    blog_service: BlogService,
+) -> AsyncIterator[bytes]:
+    """
+    Yield the document one row batch at a time, caching it once complete.
+
+    The generator opens its own session: it keeps reading from the cursor
+    after the route has returned.
+    """
+    chunks = [document.head(self_url, updated).encode("utf-8")]
+    yield chunks[0]
+    async with AsyncSessionLocal() as db:
+        async for rows in blog_service.iter_feed_entries(db, document.max_items):
+            chunks.append(document.entries(rows).encode("utf-8"))
+            yield chunks[-1]
+    chunks.append(document.tail.encode("utf-8"))
+    yield chunks[-1]
+
+    if feed_cache is not None:
+        header = f"{etag or ''} {last_modified or ''}\n".encode("ascii")
+        await feed_cache.set(name, header + b"".join(chunks), generation)
+
+
+async def _feed_response(
+    request: Request, name: str, document: FeedDocument, db: AsyncSession, blog_service: BlogService
+) -> Response:
+    generation = None
+    if feed_cache is not None:
+        generation = feed_cache.generation
+        cached = await feed_cache.get(name)
+        if cached is not None:
+            header, body = cached.split(b"\n", 1)
+            etag, last_modified = header.decode("ascii").split(" ", 1)
+            etag, last_modified = etag or None, last_modified or None
+            headers = _headers(etag, last_modified, "HIT")
+            if _not_modified(request, etag, last_modified):
+                return Response(status_code=304, headers=headers)
+            return Response(content=body, media_type=document.media_type, headers=headers)
+
+    validators = await blog_service.get_feed_validators(db)
+    etag, last_modified = _validators(validators)
+    headers = _headers(etag, last_modified, "MISS")
+    if _not_modified(request, etag, last_modified):
+        return Response(status_code=304, headers=headers)
+
+    # Not request.url: its host comes from the Host header, and the document is cached
+    self_url = feed_url(request.url.path)
+    return StreamingResponse(
+        _render(name, document, self_url, validators.updated_dt, etag, last_modified, generation, blog_service),
+        media_type=document.media_type,
+        headers=headers,
+    )
+
+
+@router.get("/feed.xml", response_class=Response)
+@limiter.limit("60/minute")
+async def rss_feed(
+    request: Request,
+    db: AsyncSession = Depends(get_async_db),
+    blog_service: BlogService = Depends(get_blog_service)
+):
+    """
+    RSS 2.0 feed of the newest published blogs.
+
+    The document is streamed as rows are read and cached until the next blog
+    or tag write. The ETag changes with every blog write, and Last-Modified
+    is the later of the newest write and the latest updated_dt of any
+    published blog. If-None-Match, or else If-Modified-Since, is answered
+    with 304.
+    """
+    return await _feed_response(request, "rss", RSS, db, blog_service)
+
+
+@router.get("/atom.xml", response_class=Response)
+@limiter.limit("60/minute")
+async def atom_feed(
+    request: Request,
+    db: AsyncSession = Depends(get_async_db),
+    blog_service: BlogService = Depends(get_blog_service)
+):
+    """Atom feed of the newest published blogs, served like /feed.xml."""
+    return await _feed_response(request, "atom", ATOM, db, blog_service)
+
+
+@router.get("/sitemap.xml", response_class=Response)
+@limiter.limit("60/minute")
+async def sitemap(
+    request: Request,
+    db: AsyncSession = Depends(get_async_db),
+    blog_service: BlogService = Depends(get_blog_service)
+):
+    """Sitemap of the site root and every published blog, served like /feed.xml."""
+    return await _feed_response(request, "sitemap", SITEMAP, db, blog_service)
@@ -0,0 +1,44 @@
+from typing import Optional, Tuple
+
+from fastapi import APIRouter, Request, Response
+
+from app.api.schemas.tag import TagListItemDTO, TagListResponseDTO
+from app.core.rate_limiting import limiter
+from app.domain.services.tag_catalog import tag_catalog
+
+router = APIRouter()
+
+# (catalog version, serialized body) of the last rendered tag list
+_rendered: Optional[Tuple[str, bytes]] = None
+
+
+@router.get("/tags", response_model=TagListResponseDTO)
+@limiter.limit("60/minute")
+async def list_tags(request: Request):
+    """
+    List every tag with its number of published blogs, ordered by name.
+
+    Served from the in-memory tag catalog without touching the database.
+    The ETag changes whenever a tag or a count changes; If-None-Match is
+    answered with 304.
+    """
+    global _rendered
+    snapshot = tag_catalog.snapshot()
+    if _rendered is None or _rendered[0] != snapshot.version:
+        response = TagListResponseDTO(
+            items=[
+                TagListItemDTO(
+                    uuid=tag.id,
+                    name=tag.name,
+                    color_code=tag.color_code,
+                    post_count=tag.post_count
+                )
+                for tag in snapshot.tags
+            ]
+        )
+        _rendered = (snapshot.version, response.model_dump_json().encode("utf-8"))
+
+    etag = f'"{snapshot.version}"'
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers={"ETag": etag})
+    return Response(content=_rendered[1], media_type="application/json", headers={"ETag": etag})
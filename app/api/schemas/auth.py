@@ -9,6 +9,8 @@ class TokenPayload(BaseModel):
     exp: int  # Expiration time
     iat: int  # Issued at time
     type: str  # Token type (access or refresh)
+    jti: Optional[str] = None  # Unique token id
+    fam: Optional[str] = None  # Token family, shared by a login's rotated refresh tokens
 
 
 class TokenResponse(BaseModel):
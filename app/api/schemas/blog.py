@@ -35,15 +35,40 @@ class BlogListResponseDTO(BaseModel):
     """Data Transfer Object for paginated blog list response"""
     
     items: List[BlogListItemDTO]
-    total: int
+    total: Optional[int] = None
     page: int
     page_size: int
-    total_pages: int
+    total_pages: Optional[int] = None
+    next_cursor: Optional[str] = None
+    prev_cursor: Optional[str] = None
 
     class Config:
         from_attributes = True
 
 
+class OutlineItemDTO(BaseModel):
+    """Data Transfer Object for one heading in a blog's outline"""
+
+    level: int
+    text: str
+    anchor: str
+
+
+class RelatedBlogDTO(BaseModel):
+    """Data Transfer Object for a related post in blog detail responses"""
+
+    uuid: UUID
+    title: str
+    slug: str
+    excerpt: Optional[str] = None
+    publication_date: Optional[datetime] = Field(None, alias="publication_dt")
+    reading_time: Optional[int] = None
+
+    class Config:
+        from_attributes = True
+        populate_by_name = True
+
+
 class BlogDetailDTO(BaseModel):
     """Data Transfer Object for detailed blog response"""
     
@@ -55,9 +80,12 @@ class BlogDetailDTO(BaseModel):
     publication_date: Optional[datetime] = Field(None, alias="publication_dt")
     updated_date: datetime = Field(alias="updated_dt")
     reading_time: Optional[int] = None
+    word_count: Optional[int] = None
     featured_image: Optional[str] = None
     seo_description: Optional[str] = None
+    outline: List[OutlineItemDTO] = []
     tags: List[TagDTO] = []
+    related: List[RelatedBlogDTO] = []
 
     class Config:
         from_attributes = True
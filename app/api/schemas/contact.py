@@ -0,0 +1,64 @@
+from datetime import datetime
+from typing import List, Literal, Optional
+from uuid import UUID
+
+from pydantic import BaseModel, EmailStr, Field, field_validator
+
+
+class ContactCreateDTO(BaseModel):
+    """Data Transfer Object for a contact form submission"""
+
+    name: str = Field(min_length=1, max_length=100)
+    email: EmailStr = Field(max_length=255)
+    subject: str = Field(min_length=1, max_length=255)
+    message: str = Field(min_length=1, max_length=5000)
+
+    class Config:
+        str_strip_whitespace = True
+
+    @field_validator("name", "subject", "message")
+    @classmethod
+    def reject_nul(cls, value: str) -> str:
+        # Postgres text cannot store NUL, so the row would fail when written
+        if "\x00" in value:
+            raise ValueError("must not contain NUL characters")
+        return value
+
+
+class ContactAcceptedDTO(BaseModel):
+    """Data Transfer Object returned once a submission is queued for storage"""
+
+    status: str = "accepted"
+
+
+class ContactDTO(BaseModel):
+    """Data Transfer Object for a stored contact submission"""
+
+    uuid: UUID
+    name: str
+    email: str
+    subject: str
+    message: str
+    submission_date: datetime
+    ip_address: Optional[str] = None
+    status: str
+
+
+class ContactListResponseDTO(BaseModel):
+    """Data Transfer Object for a page of contact submissions"""
+
+    items: List[ContactDTO]
+    next_cursor: Optional[str] = None
+
+
+class ContactStatusUpdateDTO(BaseModel):
+    """Data Transfer Object for setting the status of several submissions"""
+
+    ids: List[UUID] = Field(min_length=1, max_length=1000)
+    status: Literal["new", "read", "replied", "archived"]
+
+
+class ContactStatusUpdateResultDTO(BaseModel):
+    """Data Transfer Object for the outcome of a bulk status update"""
+
+    updated: int
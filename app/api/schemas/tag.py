@@ -0,0 +1,21 @@
+from pydantic import BaseModel
+from typing import List, Optional
+from uuid import UUID
+
+
+class TagListItemDTO(BaseModel):
+    """Data Transfer Object for a tag with its published post count"""
+
+    uuid: UUID
+    name: str
+    color_code: Optional[str] = None
+    post_count: int
+
+    class Config:
+        from_attributes = True
+
+
+class TagListResponseDTO(BaseModel):
+    """Data Transfer Object for the tag listing response"""
+
+    items: List[TagListItemDTO]
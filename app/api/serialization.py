@@ -0,0 +1,58 @@
+"""
+Fast JSON rendering for hot read endpoints.
+
+These functions write ORM rows straight to JSON bytes with orjson, skipping
+DTO construction and validation. Their output must stay byte-for-byte equal
+to the matching response model's ``model_dump_json(by_alias=True)``: same key
+order, the field aliases, and orjson's formatting of UUIDs, naive datetimes
+and strings, which matches pydantic's.
+"""
+from typing import Any, Dict, Iterable
+from uuid import UUID
+
+import orjson
+
+from app.data.models.blog import Blog
+from app.data.models.tag import Tag
+
+
+def _default(value: Any) -> Any:
+    # asyncpg returns its own UUID subclass, which orjson only handles via default
+    if isinstance(value, UUID):
+        return str(value)
+    raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
+
+
+def _tag(tag: Tag) -> Dict[str, Any]:
+    # Key order of TagDTO
+    return {"uuid": tag.id, "name": tag.name, "color_code": tag.color_code}
+
+
+def _blog_list_item(blog: Blog) -> Dict[str, Any]:
+    # Key order and aliases of BlogListItemDTO
+    return {
+        "uuid": blog.id,
+        "title": blog.title,
+        "slug": blog.slug,
+        "excerpt": blog.excerpt,
+        "publication_dt": blog.publication_dt,
+        "reading_time": blog.reading_time,
+        "tags": [_tag(tag) for tag in blog.tags],
+    }
+
+
+def render_blog_list(result: Dict[str, Any]) -> bytes:
+    """Render a BlogService listing result as a BlogListResponseDTO body."""
+    items: Iterable[Blog] = result["items"]
+    return orjson.dumps(
+        {
+            "items": [_blog_list_item(blog) for blog in items],
+            "total": result["total"],
+            "page": result["page"],
+            "page_size": result["page_size"],
+            "total_pages": result["total_pages"],
+            "next_cursor": result["next_cursor"],
+            "prev_cursor": result["prev_cursor"],
+        },
+        default=_default,
+    )
@@ -0,0 +1,88 @@
+"""
+In-process warm-up requests.
+
+Requesting the hot routes through the full ASGI stack, before real traffic
+arrives, compiles their SQL statements, prepares them on pooled
+connections, builds the response models' serializers and fills the
+response caches.
+"""
+import asyncio
+import logging
+from typing import Dict, List, Tuple
+
+import orjson
+
+from app.core.startup import warming_up
+
+logger = logging.getLogger(__name__)
+
+WARMUP_PATHS = ["/api/tags", "/api/blogs", "/feed.xml", "/atom.xml", "/sitemap.xml"]
+# Details of this many posts from the first listing page are warmed too
+WARMUP_DETAILS = 5
+
+
+async def asgi_get(app, path: str) -> Tuple[int, bytes]:
+    """
+    GET ``path`` from an ASGI app without a server; returns status and body.
+    The request runs with ``warming_up`` set, so rate limits and request
+    metrics leave it out.
+    """
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode("utf-8"),
+        "query_string": b"",
+        "root_path": "",
+        "headers": [(b"host", b"localhost"), (b"user-agent", b"warmup")],
+        "client": ("127.0.0.1", 0),
+        "server": ("localhost", 80),
+    }
+    status = 500
+    body: List[bytes] = []
+    requested = False
+    finished = asyncio.Event()
+
+    async def receive():
+        nonlocal requested
+        if not requested:
+            requested = True
+            return {"type": "http.request", "body": b"", "more_body": False}
+        # Streaming responses listen for a disconnect; send one once done
+        await finished.wait()
+        return {"type": "http.disconnect"}
+
+    async def send(message):
+        nonlocal status
+        if message["type"] == "http.response.start":
+            status = message["status"]
+        elif message["type"] == "http.response.body":
+            body.append(message.get("body", b""))
+            if not message.get("more_body", False):
+                finished.set()
+
+    token = warming_up.set(True)
+    try:
+        await app(scope, receive, send)
+    finally:
+        warming_up.reset(token)
+    return status, b"".join(body)
+
+
+async def warm_up(app) -> Dict[str, int]:
+    """Request WARMUP_PATHS and the newest posts' details; returns the status per path."""
+    statuses = {}
+    paths = list(WARMUP_PATHS)
+    while paths:
+        path = paths.pop(0)
+        status, body = await asgi_get(app, path)
+        statuses[path] = status
+        if status >= 400:
+            logger.warning("Warm-up request %s answered %d", path, status)
+        elif path == "/api/blogs":
+            items = orjson.loads(body).get("items", [])
+            paths.extend(f"/api/blogs/{item['slug']}" for item in items[:WARMUP_DETAILS])
+    return statuses
@@ -0,0 +1,242 @@
+import asyncio
+import hashlib
+import json
+import logging
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Iterable, Optional
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class TTLCache:
+    """
+    Small in-process LRU cache whose entries expire after a fixed time-to-live.
+
+    Once ``maxsize`` entries are held the least recently used one is evicted.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 256,
+        ttl: float = 60.0,
+        timer: Callable[[], float] = time.monotonic,
+    ):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._timer = timer
+        self._data: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Optional[Any] = None) -> Any:
+        """Return a live entry and mark it as recently used."""
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                return default
+
+            expires_at, value = item
+            if expires_at <= self._timer():
+                del self._data[key]
+                return default
+
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """Store an entry, evicting the least recently used one when full."""
+        expires_at = self._timer() + (self.ttl if ttl is None else ttl)
+        with self._lock:
+            self._data[key] = (expires_at, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def pop(self, key: Hashable, default: Optional[Any] = None) -> Any:
+        """Remove an entry and return its value."""
+        with self._lock:
+            item = self._data.pop(key, None)
+        return default if item is None else item[1]
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class CacheBackend(ABC):
+    """Byte store behind a ResponseCache."""
+
+    @abstractmethod
+    async def get(self, key: str) -> Optional[bytes]:
+        """Return the cached bytes for a key, or None."""
+
+    @abstractmethod
+    async def set(self, key: str, value: bytes, ttl: float) -> None:
+        """Store bytes for a key for ``ttl`` seconds."""
+
+    @abstractmethod
+    def delete(self, keys: Iterable[str]) -> None:
+        """Drop the given keys. Called from synchronous write hooks."""
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Drop every entry. Called from synchronous write hooks."""
+
+
+class InMemoryCacheBackend(CacheBackend):
+    """Per-process backend with LRU and TTL eviction."""
+
+    def __init__(self, maxsize: int = 512, ttl: float = 300.0):
+        self._cache = TTLCache(maxsize=maxsize, ttl=ttl)
+
+    async def get(self, key: str) -> Optional[bytes]:
+        return self._cache.get(key)
+
+    async def set(self, key: str, value: bytes, ttl: float) -> None:
+        self._cache.set(key, value, ttl)
+
+    def delete(self, keys: Iterable[str]) -> None:
+        for key in keys:
+            self._cache.pop(key)
+
+    def clear(self) -> None:
+        self._cache.clear()
+
+
+class RedisCacheBackend(CacheBackend):
+    """
+    Backend shared by every worker through Redis.
+
+    Every entry is a key of its own under the namespace prefix, stored with
+    SET ... PX so Redis expires it, and its maxmemory policy (allkeys-lru)
+    evicts entries one at a time. Clearing scans the prefix and unlinks what
+    it finds.
+
+    delete and clear use a blocking client. Write hooks of async sessions
+    call them on the event loop, so there they run on the default executor.
+    """
+
+    SCAN_COUNT = 500
+
+    def __init__(self, url: str, namespace: str):
+        import redis
+        import redis.asyncio
+
+        self._client = redis.asyncio.from_url(url)
+        self._sync_client = redis.from_url(url)
+        self._prefix = f"response-cache:{namespace}:"
+
+    async def get(self, key: str) -> Optional[bytes]:
+        return await self._client.get(self._prefix + key)
+
+    async def set(self, key: str, value: bytes, ttl: float) -> None:
+        await self._client.set(self._prefix + key, value, px=max(int(ttl * 1000), 1))
+
+    def delete(self, keys: Iterable[str]) -> None:
+        names = [self._prefix + key for key in keys]
+        if names:
+            self._off_loop(self._sync_client.unlink, *names)
+
+    def clear(self) -> None:
+        self._off_loop(self._unlink_prefix)
+
+    def _unlink_prefix(self) -> None:
+        batch = []
+        for name in self._sync_client.scan_iter(match=self._prefix + "*", count=self.SCAN_COUNT):
+            batch.append(name)
+            if len(batch) >= self.SCAN_COUNT:
+                self._sync_client.unlink(*batch)
+                batch = []
+        if batch:
+            self._sync_client.unlink(*batch)
+
+    def _off_loop(self, function: Callable, *args) -> None:
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # A worker thread or a script: blocking is fine here
+            function(*args)
+            return
+        loop.run_in_executor(None, function, *args).add_done_callback(self._log_failure)
+
+    def _log_failure(self, future: "asyncio.Future") -> None:
+        if not future.cancelled() and future.exception() is not None:
+            logger.error("Response cache invalidation %s failed", self._prefix, exc_info=future.exception())
+
+
+class ResponseCache:
+    """
+    Cache of serialized responses keyed on normalized request parameters.
+
+    Backend failures are logged and treated as misses, so an unavailable
+    shared cache slows responses down instead of failing them.
+
+    Every invalidation bumps ``generation``. Callers read it before building a
+    response and pass it to ``set``, which drops the response if a write was
+    committed in the meantime, since it may predate that write.
+    """
+
+    def __init__(self, namespace: str, backend: CacheBackend, ttl: float):
+        self.namespace = namespace
+        self.backend = backend
+        self.ttl = ttl
+        self.generation = 0
+
+    def key(self, params: Dict[str, Any]) -> str:
+        """Stable key for a set of parameters, independent of their order."""
+        encoded = json.dumps(params, sort_keys=True, default=str, separators=(",", ":"))
+        return hashlib.sha1(encoded.encode("utf-8")).hexdigest()
+
+    async def get(self, key: str) -> Optional[bytes]:
+        try:
+            return await self.backend.get(key)
+        except Exception:
+            logger.warning("Response cache %s read failed", self.namespace, exc_info=True)
+            return None
+
+    async def set(self, key: str, value: bytes, generation: Optional[int] = None) -> None:
+        if generation is not None and generation != self.generation:
+            return
+        try:
+            await self.backend.set(key, value, self.ttl)
+        except Exception:
+            logger.warning("Response cache %s write failed", self.namespace, exc_info=True)
+
+    def invalidate_keys(self, keys: Iterable[str]) -> None:
+        """Drop the responses stored under the given keys."""
+        self.generation += 1
+        try:
+            self.backend.delete(keys)
+        except Exception:
+            logger.exception("Response cache %s invalidation failed", self.namespace)
+
+    def invalidate(self, *args) -> None:
+        """Drop every cached response; usable directly as a write-hook listener."""
+        self.generation += 1
+        try:
+            self.backend.clear()
+        except Exception:
+            logger.exception("Response cache %s invalidation failed", self.namespace)
+
+
+def create_response_cache(namespace: str) -> Optional[ResponseCache]:
+    """Build the response cache selected by RESPONSE_CACHE_BACKEND, or None when disabled."""
+    if settings.RESPONSE_CACHE_BACKEND == "none":
+        return None
+    if settings.RESPONSE_CACHE_BACKEND == "memory":
+        backend = InMemoryCacheBackend(
+            maxsize=settings.RESPONSE_CACHE_SIZE, ttl=settings.RESPONSE_CACHE_TTL_SECONDS
+        )
+    elif settings.RESPONSE_CACHE_BACKEND == "redis":
+        backend = RedisCacheBackend(settings.REDIS_URL, namespace)
+    else:
+        raise ValueError(f"Unknown RESPONSE_CACHE_BACKEND: {settings.RESPONSE_CACHE_BACKEND}")
+    return ResponseCache(namespace, backend, ttl=settings.RESPONSE_CACHE_TTL_SECONDS)
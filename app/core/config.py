@@ -17,18 +17,121 @@ class Settings(BaseSettings):
     REFRESH_TOKEN_EXPIRE_DAYS: int = 14
     ALGORITHM: str = "HS256"
 
+    # Revoked refresh tokens and token families: "postgres" (shared by every
+    # worker) or "memory" (one process). Revocations are grouped into buckets
+    # of this many seconds by expiry and dropped a bucket at a time
+    TOKEN_REVOCATION_BACKEND: str = "postgres"
+    TOKEN_REVOCATION_BUCKET_SECONDS: int = 3600
+    # Longest before a worker's Bloom filter sees other workers' revocations
+    TOKEN_REVOCATION_SYNC_SECONDS: int = 5
+    TOKEN_REVOCATION_BLOOM_CAPACITY: int = 100000
+    TOKEN_REVOCATION_BLOOM_ERROR_RATE: float = 0.001
+
+    # Verified access tokens and user snapshots kept by get_current_user. User
+    # changes in any process (scripts included) drop the snapshot, through the
+    # write subscriber for other processes
+    AUTH_CACHE_SIZE: int = 1024
+    AUTH_CACHE_TTL_SECONDS: int = 60
+
     CORS_ORIGINS: Union[str, List[str]] = ""
 
+    # "memory://" counts per process; use redis:// when running several workers
+    RATE_LIMIT_STORAGE_URI: str = "memory://"
+    RATE_LIMIT_STRATEGY: str = "sliding-window-counter"  # or fixed-window, moving-window
+    RATE_LIMIT_KEY_PREFIX: str = "personal_website"
+
     POSTGRES_SERVER: str = "localhost"
     POSTGRES_USER: str = "postgres"
     POSTGRES_PASSWORD: str = "postgres"
     POSTGRES_DB: str = "personal_website"
     SQLALCHEMY_DATABASE_URI: Optional[PostgresDsn] = None
+    SQLALCHEMY_ASYNC_DATABASE_URI: Optional[str] = None
+
+    # Connection budget of each worker process, split between its two engines:
+    # the sync engine (background jobs, scripts) gets the DB_SYNC_* part and
+    # the async engine (requests) the rest. workers * (DB_POOL_SIZE +
+    # DB_MAX_OVERFLOW + 1 for the write subscriber) must stay below
+    # max_connections
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_SYNC_POOL_SIZE: int = 1
+    DB_SYNC_MAX_OVERFLOW: int = 3
+    DB_POOL_TIMEOUT_SECONDS: int = 30
+    DB_POOL_RECYCLE_SECONDS: int = 1800
+    DB_POOL_PRE_PING: bool = True
+    DB_STATEMENT_TIMEOUT_MS: int = 30000  # 0 disables the timeout
+    DB_ECHO: bool = False
+    # Open each engine's pool_size connections before serving
+    DB_POOL_PREFILL: bool = True
+
+    # After startup, request the hot routes in process to fill statement and
+    # response caches; /ready answers 503 until this has finished
+    STARTUP_WARMUP: bool = True
+
+    BLOG_TOTAL_CACHE_SIZE: int = 256
+    BLOG_TOTAL_CACHE_TTL_SECONDS: int = 60
+
+    # Serialized API responses: "memory" (per process), "redis" (shared) or "none"
+    RESPONSE_CACHE_BACKEND: str = "memory"
+    RESPONSE_CACHE_SIZE: int = 512
+    RESPONSE_CACHE_TTL_SECONDS: int = 300
+    REDIS_URL: str = "redis://localhost:6379/0"
+
+    # Longest a worker keeps serving tags before picking up other processes' writes
+    TAG_CATALOG_TTL_SECONDS: int = 60
+
+    # Blog writes reach other processes through the blog_write log and NOTIFY;
+    # the log lock is contended and the log polled this often
+    BLOG_WRITE_POLL_SECONDS: int = 5
+    BLOG_WRITE_LOG_RETENTION_HOURS: int = 24
 
     ELASTICSEARCH_HOST: str = "localhost"
     ELASTICSEARCH_PORT: int = 9200
     ELASTICSEARCH_URL: Optional[str] = None
 
+    # Engine behind search_term: "postgres" (full-text search), "opensearch" or "memory"
+    SEARCH_BACKEND: str = "postgres"
+    SEARCH_INDEX_NAME: str = "blogs"
+
+    # Public site the feeds and sitemap link to; posts live at SITE_URL/blog/<slug>
+    SITE_URL: str = "http://localhost:3000"
+    SITE_NAME: str = "Personal Website"
+    SITE_DESCRIPTION: str = "Articles and notes"
+    FEED_MAX_ITEMS: int = 50  # newest posts in RSS and Atom; the sitemap lists all
+    FEED_BATCH_SIZE: int = 500  # rows fetched per server-side cursor round trip
+
+    # Related posts kept per post, and how much tag overlap counts against
+    # content similarity (0 = content only, 1 = tags only)
+    RELATED_POSTS_COUNT: int = 5
+    RELATED_POSTS_TAG_WEIGHT: float = 0.3
+    RELATED_POSTS_MIN_SCORE: float = 0.05
+    RELATED_POSTS_MAX_TERMS: int = 4096  # TF-IDF vocabulary size; memory is posts x terms x 4 bytes
+
+    # Contact submissions are queued in memory and written in batches of up to
+    # CONTACT_BATCH_SIZE, at the latest CONTACT_FLUSH_INTERVAL_MS after arriving.
+    # A full queue makes submissions wait CONTACT_ENQUEUE_TIMEOUT_MS, then get a 503
+    CONTACT_BUFFER_SIZE: int = 1000
+    CONTACT_BATCH_SIZE: int = 100
+    CONTACT_FLUSH_INTERVAL_MS: int = 500
+    CONTACT_ENQUEUE_TIMEOUT_MS: int = 250
+    CONTACT_DRAIN_TIMEOUT_SECONDS: int = 10  # shutdown waits this long for queued writes
+    # Attempts per batch while the database is unreachable (backoff up to 30 s each)
+    CONTACT_WRITE_MAX_ATTEMPTS: int = 8
+
+    # bcrypt runs on this many threads; logins beyond workers + queue get a 503
+    PASSWORD_HASH_WORKERS: int = 2
+    PASSWORD_HASH_MAX_QUEUE: int = 16
+
+    METRICS_EXPORTER: str = "none"  # none, console or otlp
+    METRICS_EXPORT_INTERVAL_MS: int = 60000
+    OTEL_EXPORTER_OTLP_ENDPOINT: Optional[str] = None
+
+    TRACING_EXPORTER: str = "none"  # none, console, otlp or file
+    TRACING_FILE_PATH: str = "traces.jsonl"
+    # Flag statements run this many times in one request (likely N+1 loads);
+    # 0 disables, unset means 2 in development and 0 elsewhere
+    SQL_REPEAT_THRESHOLD: Optional[int] = None
+
     S3_BUCKET_NAME: Optional[str] = None
     AWS_ACCESS_KEY_ID: Optional[str] = None
     AWS_SECRET_ACCESS_KEY: Optional[str] = None
@@ -46,8 +149,31 @@ class Settings(BaseSettings):
     def validate_db_connection(self) -> "Settings":
         if not self.SQLALCHEMY_DATABASE_URI:
             self.SQLALCHEMY_DATABASE_URI = f"postgresql://{self.POSTGRES_USER}:{self.POSTGRES_PASSWORD}@{self.POSTGRES_SERVER}/{self.POSTGRES_DB}"
+        if not self.SQLALCHEMY_ASYNC_DATABASE_URI:
+            # Same database through the asyncpg driver
+            _, location = str(self.SQLALCHEMY_DATABASE_URI).split("://", 1)
+            self.SQLALCHEMY_ASYNC_DATABASE_URI = f"postgresql+asyncpg://{location}"
+        return self
+
+    @model_validator(mode="after")
+    def validate_db_pool_budget(self) -> "Settings":
+        if not 0 < self.DB_SYNC_POOL_SIZE < self.DB_POOL_SIZE:
+            raise ValueError("DB_SYNC_POOL_SIZE must be at least 1 and below DB_POOL_SIZE")
+        # A negative DB_MAX_OVERFLOW leaves both engines unlimited
+        if self.DB_MAX_OVERFLOW >= 0 and not 0 <= self.DB_SYNC_MAX_OVERFLOW <= self.DB_MAX_OVERFLOW:
+            raise ValueError("DB_SYNC_MAX_OVERFLOW must be between 0 and DB_MAX_OVERFLOW")
         return self
 
+    @property
+    def DB_ASYNC_POOL_SIZE(self) -> int:
+        return self.DB_POOL_SIZE - self.DB_SYNC_POOL_SIZE
+
+    @property
+    def DB_ASYNC_MAX_OVERFLOW(self) -> int:
+        if self.DB_MAX_OVERFLOW < 0:
+            return self.DB_MAX_OVERFLOW
+        return self.DB_MAX_OVERFLOW - self.DB_SYNC_MAX_OVERFLOW
+
     @model_validator(mode="after")
     def validate_elasticsearch_connection(self) -> "Settings":
         if not self.ELASTICSEARCH_URL:
@@ -71,5 +197,7 @@ if settings.ENVIRONMENT == "development":
         "http://localhost:3000",
         "http://localhost:8000",
     ]
+    if settings.SQL_REPEAT_THRESHOLD is None:
+        settings.SQL_REPEAT_THRESHOLD = 2
 elif settings.ENVIRONMENT == "production":
     pass
@@ -1,21 +1,177 @@
-from sqlalchemy import create_engine
-from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
+import asyncio
+import time
+from typing import Any, Dict, List
+
+from opentelemetry.metrics import Observation
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
 
 from app.core.config import settings
+from app.core.metrics import meter
+from app.core.tracing import instrument_engine
 
-engine = create_engine(
-    settings.SQLALCHEMY_DATABASE_URI,
-    echo=settings.ENVIRONMENT == "development"
+_checkout_wait = meter.create_histogram(
+    "db.pool.checkout.wait",
+    unit="ms",
+    description="Time to obtain a connection, including opening a new one",
+)
+_connection_age = meter.create_histogram(
+    "db.pool.connection.age",
+    unit="s",
+    description="Age of connections when they are checked out",
 )
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
-def get_db():
-    """
-    Dependency function that yields db sessions
-    """
-    db = SessionLocal()
+# Engines by pool name and their capacity (pool_size + max_overflow), read by
+# the observable gauges below
+_engines: Dict[str, Engine] = {}
+_capacities: Dict[str, int] = {}
+
+
+class _TimedCheckout:
+    """Pool mixin recording how long each checkout waited for a connection."""
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            _checkout_wait.record(
+                (time.perf_counter() - started) * 1000, {"pool": self.logging_name}
+            )
+
+
+class TimedQueuePool(_TimedCheckout, QueuePool):
+    pass
+
+
+class TimedAsyncAdaptedQueuePool(_TimedCheckout, AsyncAdaptedQueuePool):
+    pass
+
+
+def _pool_options(name: str, pool_size: int, max_overflow: int) -> Dict[str, Any]:
+    return {
+        "pool_size": pool_size,
+        "max_overflow": max_overflow,
+        "pool_timeout": settings.DB_POOL_TIMEOUT_SECONDS,
+        "pool_recycle": settings.DB_POOL_RECYCLE_SECONDS,
+        "pool_pre_ping": settings.DB_POOL_PRE_PING,
+        "pool_logging_name": name,
+        "echo": settings.DB_ECHO,
+    }
+
+
+def _instrument(name: str, engine: Engine, pool_size: int, max_overflow: int) -> None:
+    @event.listens_for(engine, "connect")
+    def _stamp(dbapi_connection, connection_record):
+        connection_record.info["connected_at"] = time.monotonic()
+
+    @event.listens_for(engine, "checkout")
+    def _record_age(dbapi_connection, connection_record, connection_proxy):
+        connected_at = connection_record.info.get("connected_at")
+        if connected_at is not None:
+            _connection_age.record(time.monotonic() - connected_at, {"pool": name})
+
+    instrument_engine(engine)
+    _engines[name] = engine
+    _capacities[name] = pool_size + max(max_overflow, 0)
+
+
+def create_database_engine(name: str = "sync") -> Engine:
+    """Create the psycopg2 engine used by scripts and background jobs, sized by DB_SYNC_*."""
+    pool_size, max_overflow = settings.DB_SYNC_POOL_SIZE, settings.DB_SYNC_MAX_OVERFLOW
+    connect_args = {}
+    if settings.DB_STATEMENT_TIMEOUT_MS:
+        connect_args["options"] = f"-c statement_timeout={settings.DB_STATEMENT_TIMEOUT_MS}"
+
+    engine = create_engine(
+        str(settings.SQLALCHEMY_DATABASE_URI),
+        poolclass=TimedQueuePool,
+        connect_args=connect_args,
+        **_pool_options(name, pool_size, max_overflow),
+    )
+    _instrument(name, engine, pool_size, max_overflow)
+    return engine
+
+
+def create_async_database_engine(name: str = "async") -> AsyncEngine:
+    """Create the asyncpg engine used by request handlers, sized by what DB_SYNC_* leaves."""
+    pool_size, max_overflow = settings.DB_ASYNC_POOL_SIZE, settings.DB_ASYNC_MAX_OVERFLOW
+    connect_args = {}
+    if settings.DB_STATEMENT_TIMEOUT_MS:
+        connect_args["server_settings"] = {
+            "statement_timeout": str(settings.DB_STATEMENT_TIMEOUT_MS)
+        }
+
+    engine = create_async_engine(
+        settings.SQLALCHEMY_ASYNC_DATABASE_URI,
+        poolclass=TimedAsyncAdaptedQueuePool,
+        connect_args=connect_args,
+        **_pool_options(name, pool_size, max_overflow),
+    )
+    _instrument(name, engine.sync_engine, pool_size, max_overflow)
+    return engine
+
+
+def prefill_pool(engine: Engine, size: int) -> None:
+    """Open ``size`` connections and return them to the pool, which keeps up to pool_size."""
+    connections = []
     try:
-        yield db
+        for _ in range(size):
+            connections.append(engine.connect())
     finally:
-        db.close()
\ No newline at end of file
+        for connection in connections:
+            connection.close()
+
+
+async def prefill_async_pool(engine: AsyncEngine, size: int) -> None:
+    """Open ``size`` connections concurrently and return them to the pool."""
+    connections = await asyncio.gather(*(engine.connect() for _ in range(size)))
+    await asyncio.gather(*(connection.close() for connection in connections))
+
+
+def _observe_in_use(options) -> List[Observation]:
+    return [
+        Observation(engine.pool.checkedout(), {"pool": name})
+        for name, engine in _engines.items()
+    ]
+
+
+def _observe_idle(options) -> List[Observation]:
+    return [
+        Observation(engine.pool.checkedin(), {"pool": name})
+        for name, engine in _engines.items()
+    ]
+
+
+def _observe_saturation(options) -> List[Observation]:
+    # Share of each pool's pool_size + max_overflow in use; at 1.0 its
+    # checkouts start to wait. "all" counts both engines against the
+    # worker's whole DB_POOL_SIZE + DB_MAX_OVERFLOW budget
+    observations = [
+        Observation(engine.pool.checkedout() / _capacities[name], {"pool": name})
+        for name, engine in _engines.items()
+    ]
+    if _engines:
+        budget = settings.DB_POOL_SIZE + max(settings.DB_MAX_OVERFLOW, 0)
+        in_use = sum(engine.pool.checkedout() for engine in _engines.values())
+        observations.append(Observation(in_use / budget, {"pool": "all"}))
+    return observations
+
+
+meter.create_observable_gauge(
+    "db.pool.connections.in_use",
+    callbacks=[_observe_in_use],
+    description="Connections checked out of the pool",
+)
+meter.create_observable_gauge(
+    "db.pool.connections.idle",
+    callbacks=[_observe_idle],
+    description="Open connections waiting in the pool",
+)
+meter.create_observable_gauge(
+    "db.pool.saturation",
+    callbacks=[_observe_saturation],
+    description="Checked-out connections as a fraction of the pool's capacity",
+)
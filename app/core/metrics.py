@@ -0,0 +1,37 @@
+from opentelemetry import metrics
+from opentelemetry.sdk.metrics import MeterProvider
+from opentelemetry.sdk.metrics.export import (
+    ConsoleMetricExporter,
+    PeriodicExportingMetricReader,
+)
+from opentelemetry.sdk.resources import Resource
+
+from app.core.config import settings
+
+# Instruments created from this meter start recording once configure_metrics() runs
+meter = metrics.get_meter("personal_website")
+
+
+def configure_metrics() -> None:
+    """Install the metrics pipeline selected by METRICS_EXPORTER (none, console or otlp)."""
+    if settings.METRICS_EXPORTER == "none":
+        return
+
+    if settings.METRICS_EXPORTER == "otlp":
+        from opentelemetry.exporter.otlp.proto.grpc.metric_exporter import OTLPMetricExporter
+
+        exporter = OTLPMetricExporter(endpoint=settings.OTEL_EXPORTER_OTLP_ENDPOINT)
+    elif settings.METRICS_EXPORTER == "console":
+        exporter = ConsoleMetricExporter()
+    else:
+        raise ValueError(f"Unknown METRICS_EXPORTER: {settings.METRICS_EXPORTER}")
+
+    reader = PeriodicExportingMetricReader(
+        exporter, export_interval_millis=settings.METRICS_EXPORT_INTERVAL_MS
+    )
+    metrics.set_meter_provider(
+        MeterProvider(
+            resource=Resource.create({"service.name": settings.PROJECT_NAME}),
+            metric_readers=[reader],
+        )
+    )
@@ -1,18 +1,57 @@
+import math
+import time
+
 from slowapi import Limiter, _rate_limit_exceeded_handler
 from slowapi.util import get_remote_address
 from slowapi.errors import RateLimitExceeded
 from fastapi import Request, HTTPException
 from fastapi.responses import JSONResponse
 
-limiter = Limiter(key_func=get_remote_address)
+from app.core.config import settings
+from app.core.startup import warming_up
+
+# Counters live in RATE_LIMIT_STORAGE_URI: "redis://..." shares them between
+# workers, with every key expiring after its window; "memory://" keeps them
+# per process (tests, single-worker development). A sliding window counter
+# costs two keys and O(1) work per check. If Redis is unreachable, limits
+# fall back to per-process memory until it recovers.
+class _Limiter(Limiter):
+    """Limiter that lets in-process warm-up requests through without counting them."""
+
+    def _check_request_limit(self, request, endpoint_func, in_middleware=True) -> None:
+        # Warm-up requests would otherwise use up 127.0.0.1's limits
+        if warming_up.get():
+            # Read when the route adds rate limit headers to its response
+            request.state.view_rate_limit = None
+            return
+        super()._check_request_limit(request, endpoint_func, in_middleware)
+
+
+limiter = _Limiter(
+    key_func=get_remote_address,
+    storage_uri=settings.RATE_LIMIT_STORAGE_URI,
+    strategy=settings.RATE_LIMIT_STRATEGY,
+    key_prefix=settings.RATE_LIMIT_KEY_PREFIX,
+    in_memory_fallback_enabled=settings.RATE_LIMIT_STORAGE_URI != "memory://",
+)
+
+def _retry_after(request: Request) -> int:
+    """Seconds until the limit that was hit lets the next request through."""
+    current_limit = getattr(request.state, "view_rate_limit", None)
+    if current_limit is None:
+        return 3600
+    reset_time, _ = limiter.limiter.get_window_stats(current_limit[0], *current_limit[1])
+    return max(1, math.ceil(reset_time - time.time()))
+
 
 def rate_limit_exceeded_handler(request: Request, exc: RateLimitExceeded):
+    retry_after = _retry_after(request)
     response = JSONResponse(
         status_code=429,
         content={
             "detail": f"Rate limit exceeded: {exc.detail}",
-            "retry_after": str(exc.retry_after) if exc.retry_after else None
+            "retry_after": str(retry_after)
         }
     )
-    response.headers["Retry-After"] = str(exc.retry_after) if exc.retry_after else "3600"
-    return response
\ No newline at end of file
+    response.headers["Retry-After"] = str(retry_after)
+    return response
@@ -1,11 +1,17 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, Optional
 import uuid
 
 from jose import jwt
+from opentelemetry.metrics import Observation
 from passlib.context import CryptContext
 
 from app.core.config import settings
+from app.core.metrics import meter
 
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
@@ -20,6 +26,89 @@ def get_password_hash(password: str) -> str:
     return pwd_context.hash(password)
 
 
+class PasswordHasherBusyError(Exception):
+    """Raised when the password hashing executor has no room for more work."""
+
+
+class PasswordHasher:
+    """
+    Runs bcrypt on a dedicated, size-limited thread pool.
+
+    bcrypt is CPU-bound and takes tens of milliseconds, so running it inline
+    would stall the event loop. At most ``max_workers`` hashes run at once
+    and ``max_queue`` more may wait; further calls fail fast with
+    PasswordHasherBusyError instead of queueing without limit.
+    """
+
+    def __init__(self, max_workers: int, max_queue: int):
+        self.max_workers = max_workers
+        self.capacity = max_workers + max_queue
+        self._executor = ThreadPoolExecutor(max_workers, thread_name_prefix="password-hash")
+        self._in_flight = 0
+        self._lock = threading.Lock()
+
+        self._duration = meter.create_histogram(
+            "auth.password_hash.duration",
+            unit="ms",
+            description="Time spent running bcrypt",
+        )
+        self._wait = meter.create_histogram(
+            "auth.password_hash.wait",
+            unit="ms",
+            description="Time spent queued before bcrypt started",
+        )
+        self._rejected = meter.create_counter(
+            "auth.password_hash.rejected",
+            description="Hash operations refused because the executor was saturated",
+        )
+        meter.create_observable_gauge(
+            "auth.password_hash.queue_depth",
+            callbacks=[lambda options: [Observation(self.queue_depth)]],
+            description="Hash operations waiting for a worker thread",
+        )
+
+    @property
+    def queue_depth(self) -> int:
+        return max(0, self._in_flight - self.max_workers)
+
+    async def verify(self, plain_password: str, hashed_password: str) -> bool:
+        """Verify a password against a hash without blocking the event loop."""
+        return await self._run("verify", verify_password, plain_password, hashed_password)
+
+    async def hash(self, password: str) -> str:
+        """Hash a password without blocking the event loop."""
+        return await self._run("hash", get_password_hash, password)
+
+    async def _run(self, operation: str, func: Callable, *args) -> Any:
+        with self._lock:
+            if self._in_flight >= self.capacity:
+                self._rejected.add(1, {"operation": operation})
+                raise PasswordHasherBusyError("Password hashing is saturated")
+            self._in_flight += 1
+
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._executor, self._timed, operation, func, time.perf_counter(), *args
+        )
+
+    def _timed(self, operation: str, func: Callable, queued_at: float, *args) -> Any:
+        started = time.perf_counter()
+        attributes = {"operation": operation}
+        self._wait.record((started - queued_at) * 1000, attributes)
+        try:
+            return func(*args)
+        finally:
+            self._duration.record((time.perf_counter() - started) * 1000, attributes)
+            # Released by the worker, so abandoned requests still count until bcrypt finishes
+            with self._lock:
+                self._in_flight -= 1
+
+
+password_hasher = PasswordHasher(
+    settings.PASSWORD_HASH_WORKERS, settings.PASSWORD_HASH_MAX_QUEUE
+)
+
+
 def create_token(
     data: dict, expires_delta: Optional[timedelta] = None, token_type: str = "access"
 ) -> str:
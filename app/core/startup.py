@@ -0,0 +1,56 @@
+import logging
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, Optional
+
+from app.core.metrics import meter
+
+logger = logging.getLogger(__name__)
+
+# Set while an in-process warm-up request is handled: rate limits and request
+# metrics skip it, since it is neither a client nor real traffic
+warming_up: ContextVar[bool] = ContextVar("warming_up", default=False)
+
+_phase_duration = meter.create_histogram(
+    "app.startup.phase.duration",
+    unit="ms",
+    description="Time spent in each startup phase",
+)
+
+
+class StartupProfile:
+    """
+    Durations of the named startup phases, in the order they ran.
+
+    Each phase is logged and recorded as it finishes, so a phase that grows
+    between deploys shows up in logs and metrics rather than as slow first
+    requests.
+    """
+
+    def __init__(self, started: Optional[float] = None):
+        self.started = time.perf_counter() if started is None else started
+        self.phases: Dict[str, float] = {}
+        self.total_ms: Optional[float] = None
+
+    def record(self, name: str, duration_ms: float) -> None:
+        self.phases[name] = round(duration_ms, 1)
+        _phase_duration.record(duration_ms, {"phase": name})
+        logger.info("Startup phase %s took %.1f ms", name, duration_ms)
+
+    @contextmanager
+    def phase(self, name: str):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, (time.perf_counter() - started) * 1000)
+
+    def finish(self) -> None:
+        """Record the time from ``started`` until now as the total."""
+        self.total_ms = round((time.perf_counter() - self.started) * 1000, 1)
+        logger.info(
+            "Started in %.1f ms (%s)",
+            self.total_ms,
+            ", ".join(f"{name} {duration:.0f} ms" for name, duration in self.phases.items()),
+        )
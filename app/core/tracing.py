@@ -0,0 +1,202 @@
+import logging
+import threading
+import time
+from collections import Counter
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import List, Optional, Sequence, Tuple
+
+from opentelemetry import propagate, trace
+from opentelemetry.sdk.resources import Resource
+from opentelemetry.sdk.trace import ReadableSpan, TracerProvider
+from opentelemetry.sdk.trace.export import (
+    BatchSpanProcessor,
+    ConsoleSpanExporter,
+    SpanExporter,
+    SpanExportResult,
+)
+from opentelemetry.trace import SpanKind, Status, StatusCode
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.core.config import settings
+from app.core.metrics import meter
+from app.core.startup import warming_up
+
+logger = logging.getLogger(__name__)
+
+# Spans from this tracer are recorded once configure_tracing() runs
+tracer = trace.get_tracer("personal_website")
+
+_request_duration = meter.create_histogram(
+    "http.server.request.duration",
+    unit="ms",
+    description="Time from receiving a request to sending the last of its response",
+)
+
+
+class FileSpanExporter(SpanExporter):
+    """Appends finished spans to a file, one JSON object per line."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+
+    def export(self, spans: Sequence[ReadableSpan]) -> SpanExportResult:
+        lines = "".join(span.to_json(indent=None) + "\n" for span in spans)
+        try:
+            with self._lock, open(self.path, "a", encoding="utf-8") as output:
+                output.write(lines)
+        except OSError:
+            logger.exception("Could not write spans to %s", self.path)
+            return SpanExportResult.FAILURE
+        return SpanExportResult.SUCCESS
+
+
+def configure_tracing() -> None:
+    """Install the tracing pipeline selected by TRACING_EXPORTER (none, console, otlp or file)."""
+    if settings.TRACING_EXPORTER == "none":
+        return
+
+    if settings.TRACING_EXPORTER == "otlp":
+        from opentelemetry.exporter.otlp.proto.grpc.trace_exporter import OTLPSpanExporter
+
+        exporter = OTLPSpanExporter(endpoint=settings.OTEL_EXPORTER_OTLP_ENDPOINT)
+    elif settings.TRACING_EXPORTER == "file":
+        exporter = FileSpanExporter(settings.TRACING_FILE_PATH)
+    elif settings.TRACING_EXPORTER == "console":
+        exporter = ConsoleSpanExporter()
+    else:
+        raise ValueError(f"Unknown TRACING_EXPORTER: {settings.TRACING_EXPORTER}")
+
+    provider = TracerProvider(resource=Resource.create({"service.name": settings.PROJECT_NAME}))
+    provider.add_span_processor(BatchSpanProcessor(exporter))
+    trace.set_tracer_provider(provider)
+
+
+@dataclass
+class QueryStats:
+    """SQL statements run on behalf of one request."""
+
+    count: int = 0
+    duration_ms: float = 0.0
+    # Executions per SQL string, kept only while repeat detection is on
+    statements: Optional[Counter] = None
+
+    def repeated(self, threshold: int) -> List[Tuple[str, int]]:
+        if not self.statements or threshold < 2:
+            return []
+        return [(sql, runs) for sql, runs in self.statements.most_common() if runs >= threshold]
+
+
+_query_stats: ContextVar[Optional[QueryStats]] = ContextVar("query_stats", default=None)
+
+
+def current_query_stats() -> Optional[QueryStats]:
+    """Statement accounting of the request being handled, if any."""
+    return _query_stats.get()
+
+
+def instrument_engine(engine: Engine) -> None:
+    """Count and time the statements ``engine`` runs for the current request."""
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _start(conn, cursor, statement, parameters, context, executemany):
+        if _query_stats.get() is not None:
+            conn.info.setdefault("query_started", []).append(time.perf_counter())
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _record(conn, cursor, statement, parameters, context, executemany):
+        _finish(conn, statement)
+
+    # after_cursor_execute does not run for a failed statement; without this its
+    # start time would stay on the pooled connection
+    @event.listens_for(engine, "handle_error")
+    def _record_failed(exception_context):
+        if exception_context.connection is not None:
+            _finish(exception_context.connection, exception_context.statement)
+
+
+def _finish(conn, statement: Optional[str]) -> None:
+    started = conn.info.get("query_started")
+    if not started:
+        return
+    duration_ms = (time.perf_counter() - started.pop()) * 1000
+    stats = _query_stats.get()
+    if stats is None:
+        return
+    stats.count += 1
+    stats.duration_ms += duration_ms
+    if stats.statements is not None and statement:
+        stats.statements[statement] += 1
+
+
+class RequestTracingMiddleware:
+    """
+    Wraps each HTTP request in a server span carrying its route, status,
+    latency and the number and total time of the SQL statements it ran.
+
+    With SQL_REPEAT_THRESHOLD set, statements run that many times or more in
+    one request (typically a lazy load inside a loop) are logged and added to
+    the span as ``db.repeated_statement`` events.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        # Warm-up requests would skew request latency towards cold starts
+        if scope["type"] != "http" or warming_up.get():
+            await self.app(scope, receive, send)
+            return
+
+        threshold = settings.SQL_REPEAT_THRESHOLD or 0
+        stats = QueryStats(statements=Counter() if threshold else None)
+        token = _query_stats.set(stats)
+        status_code = 500
+
+        async def send_with_status(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        headers = {name.decode("latin-1"): value.decode("latin-1") for name, value in scope["headers"]}
+        started = time.perf_counter()
+        with tracer.start_as_current_span(
+            scope["method"],
+            context=propagate.extract(headers),
+            kind=SpanKind.SERVER,
+            attributes={"http.request.method": scope["method"], "url.path": scope["path"]},
+        ) as span:
+            try:
+                await self.app(scope, receive, send_with_status)
+            finally:
+                _query_stats.reset(token)
+                duration_ms = (time.perf_counter() - started) * 1000
+                # FastAPI stores the matched route in the scope while routing
+                route = getattr(scope.get("route"), "path", None)
+                if route:
+                    span.update_name(f"{scope['method']} {route}")
+                    span.set_attribute("http.route", route)
+                span.set_attribute("http.response.status_code", status_code)
+                span.set_attribute("db.statement_count", stats.count)
+                span.set_attribute("db.duration_ms", round(stats.duration_ms, 3))
+                if status_code >= 500:
+                    span.set_status(Status(StatusCode.ERROR))
+
+                for sql, runs in stats.repeated(threshold):
+                    logger.warning(
+                        "Statement ran %d times in %s %s, possible N+1 query: %s",
+                        runs, scope["method"], route or scope["path"], sql,
+                    )
+                    span.add_event("db.repeated_statement", {"db.statement": sql, "db.executions": runs})
+
+                _request_duration.record(
+                    duration_ms,
+                    {
+                        "http.request.method": scope["method"],
+                        "http.route": route or "",
+                        "http.response.status_code": status_code,
+                    },
+                )
@@ -0,0 +1,194 @@
+import hashlib
+import math
+import re
+import unicodedata
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import inspect
+
+WORDS_PER_MINUTE = 200
+EXCERPT_LENGTH = 280
+SEO_DESCRIPTION_LENGTH = 160
+
+_HEADING = re.compile(r"[ ]{0,3}(#{1,6})[ \t]+(.+?)(?:[ \t]+#+)?[ \t]*$")
+_RULE = re.compile(r"[ \t]*(?:[-*_][ \t]*){3,}$")
+_LINK_DEFINITION = re.compile(r"[ ]{0,3}\[[^\]]+\]:")
+_LINE_MARKER = re.compile(r"[ \t]*(?:>[ \t]?|[-*+][ \t]+|\d+[.)][ \t]+)+")
+_IMAGE = re.compile(r"!\[[^\]]*\]\([^)]*\)")
+_LINK = re.compile(r"\[([^\]]+)\](?:\([^)]*\)|\[[^\]]*\])")
+_HTML_TAG = re.compile(r"<[^>]+>")
+_INLINE_CODE = re.compile(r"`+([^`]*)`+")
+# Underscores only delimit emphasis outside words, so snake_case survives
+_EMPHASIS = re.compile(
+    r"(\*\*|\*|~~)(?=\S)(.+?)(?<=\S)\1|(?<!\w)(__|_)(?=\S)(.+?)(?<=\S)\3(?!\w)"
+)
+
+
+@dataclass
+class ContentSummary:
+    """Fields derived from a post's markdown, stored on the blog row."""
+
+    word_count: int
+    reading_time: int
+    excerpt: Optional[str]
+    seo_description: Optional[str]
+    content_hash: str
+    outline: List[Dict] = field(default_factory=list)
+
+
+def content_hash(content: str) -> str:
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
+def _unwrap_emphasis(match: re.Match) -> str:
+    return match.group(2) or match.group(4)
+
+
+def strip_inline(text: str) -> str:
+    """Plain text of inline markdown: links, images, code and emphasis unwrapped."""
+    # Each pattern only runs when its marker occurs; most prose has none
+    if "](" in text:
+        text = _IMAGE.sub("", text)
+    if "[" in text:
+        text = _LINK.sub(r"\1", text)
+    if "`" in text:
+        text = _INLINE_CODE.sub(r"\1", text)
+    if "<" in text:
+        text = _HTML_TAG.sub("", text)
+    if "*" in text or "_" in text or "~~" in text:
+        # Unwrap nested emphasis such as ***bold italic***
+        previous = None
+        while previous != text:
+            previous, text = text, _EMPHASIS.sub(_unwrap_emphasis, text)
+    return text
+
+
+def split_markdown(content: str) -> Tuple[List[str], List[Tuple[int, str]]]:
+    """
+    Split markdown into body lines and (level, text) ATX headings, in one pass.
+
+    Fenced code blocks, thematic breaks and link definitions are dropped, and
+    block quote and list markers are removed from body lines.
+    """
+    body, headings = [], []
+    fence = None
+    for line in content.splitlines():
+        stripped = line.strip()
+        if fence is not None:
+            if stripped.startswith(fence) and not stripped.strip(fence[0]):
+                fence = None
+            continue
+        if not stripped:
+            continue
+        first = stripped[0]
+        if first in "`~" and stripped.startswith(("```", "~~~")):
+            fence = stripped[:len(stripped) - len(stripped.lstrip(first))]
+            continue
+        if first == "#":
+            match = _HEADING.match(line)
+            if match:
+                headings.append((len(match.group(1)), match.group(2)))
+                continue
+        if first in "-*_" and _RULE.match(line):
+            continue
+        if first == "[" and _LINK_DEFINITION.match(line):
+            continue
+        if first in ">-*+0123456789":
+            line = _LINE_MARKER.sub("", line, count=1)
+        body.append(line)
+    return body, headings
+
+
+def plain_text(content: str, headings: bool = True) -> str:
+    """Markdown rendered down to whitespace-normalised plain text; code blocks are dropped."""
+    body, heading_lines = split_markdown(content)
+    if headings:
+        body = [text for _, text in heading_lines] + body
+    return " ".join(strip_inline(" ".join(body)).split())
+
+
+def truncate(text: str, length: int) -> str:
+    """Cut ``text`` at a word boundary to at most ``length`` characters, marking the cut."""
+    if len(text) <= length:
+        return text
+    cut = text[:length - 1].rsplit(" ", 1)[0].rstrip(" ,;:.-–—")
+    return cut + "…"
+
+
+def heading_anchor(text: str, seen: Dict[str, int]) -> str:
+    anchor = unicodedata.normalize("NFKC", text).lower()
+    anchor = re.sub(r"[^\w\- ]", "", anchor).strip().replace(" ", "-")
+    count = seen.get(anchor, 0)
+    seen[anchor] = count + 1
+    return f"{anchor}-{count}" if count else anchor
+
+
+def outline(headings: List[Tuple[int, str]]) -> List[Dict]:
+    """Outline entries for (level, text) headings, with GitHub-style anchors."""
+    seen: Dict[str, int] = {}
+    items = []
+    for level, text in headings:
+        text = " ".join(strip_inline(text).split())
+        if text:
+            items.append({"level": level, "text": text, "anchor": heading_anchor(text, seen)})
+    return items
+
+
+def make_excerpt(content: str, length: int = EXCERPT_LENGTH) -> Optional[str]:
+    """Opening of the post body as plain text, headings left out."""
+    return truncate(plain_text(content, headings=False), length) or None
+
+
+def summarize_content(content: str) -> ContentSummary:
+    body, headings = split_markdown(content)
+    text = " ".join(strip_inline(" ".join(body)).split())
+    items = outline(headings)
+    words = len(text.split()) + sum(len(item["text"].split()) for item in items)
+    excerpt = truncate(text, EXCERPT_LENGTH) or None
+    return ContentSummary(
+        word_count=words,
+        reading_time=max(1, math.ceil(words / WORDS_PER_MINUTE)),
+        excerpt=excerpt,
+        seo_description=truncate(excerpt, SEO_DESCRIPTION_LENGTH) if excerpt else None,
+        content_hash=content_hash(content),
+        outline=items,
+    )
+
+
+def apply_content_summary(blog) -> None:
+    """
+    Store the summary of a blog's content on it, when the content is new or changed.
+
+    Word count, reading time, hash and outline always follow the content. The
+    excerpt and SEO description are only filled in when empty, or when they
+    still hold the text derived from the previous content; hand-written ones
+    are kept.
+    """
+    attrs = inspect(blog).attrs
+    history = attrs.content.history
+    if blog.content_hash is not None and not history.has_changes():
+        return
+    summary = summarize_content(blog.content)
+    if summary.content_hash == blog.content_hash:
+        return
+
+    previous = history.deleted[0] if history.deleted else None
+    previous_excerpt = make_excerpt(previous) if previous else None
+    previous_description = (
+        truncate(previous_excerpt, SEO_DESCRIPTION_LENGTH) if previous_excerpt else None
+    )
+
+    blog.word_count = summary.word_count
+    blog.reading_time = summary.reading_time
+    blog.content_hash = summary.content_hash
+    blog.outline = summary.outline
+    if not blog.excerpt or (
+        blog.excerpt == previous_excerpt and not attrs.excerpt.history.has_changes()
+    ):
+        blog.excerpt = summary.excerpt
+    if not blog.seo_description or (
+        blog.seo_description == previous_description
+        and not attrs.seo_description.history.has_changes()
+    ):
+        blog.seo_description = summary.seo_description
@@ -0,0 +1,381 @@
+import json
+import logging
+from dataclasses import dataclass, field
+from itertools import chain
+from typing import Callable, Iterable, List, Set, Tuple
+from uuid import UUID, uuid4
+
+from sqlalchemy import event, func, insert, inspect, select
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import Session
+
+from app.data.models.blog import Blog
+from app.data.models.blog_write import BlogWrite
+from app.data.models.tag import Tag
+from app.data.models.user import User
+
+logger = logging.getLogger(__name__)
+
+_PENDING_KEY = "blog_writes"
+_PENDING_USERS_KEY = "user_writes"
+
+# NOTIFY channel announcing committed blog writes to other processes
+BLOG_WRITE_CHANNEL = "blog_writes"
+# NOTIFY channel announcing recomputed related posts; these are not logged
+RELATED_WRITE_CHANNEL = "related_writes"
+# NOTIFY channel announcing committed user writes; these are not logged either
+USER_WRITE_CHANNEL = "user_writes"
+# NOTIFY payloads are limited to 8000 bytes; larger writes are announced as bulk
+MAX_PAYLOAD_BYTES = 7900
+# Tags this process's announcements, which it has already dispatched itself
+PROCESS_ID = uuid4().hex
+
+
+@dataclass
+class BlogWriteEvent:
+    """
+    Summary of blog content written by one committed transaction.
+
+    ``blog_ids`` and ``slugs`` name the posts that changed (old and new slugs
+    when a slug was edited), ``tag_ids`` the tags. ``bulk`` is set when rows
+    were written by a bulk statement, in which case the sets may be incomplete
+    and listeners should treat everything as stale.
+    """
+
+    blog_ids: Set[UUID] = field(default_factory=set)
+    slugs: Set[str] = field(default_factory=set)
+    tag_ids: Set[UUID] = field(default_factory=set)
+    bulk: bool = False
+
+    def __bool__(self) -> bool:
+        return bool(self.blog_ids or self.slugs or self.tag_ids or self.bulk)
+
+    def update(self, other: "BlogWriteEvent") -> None:
+        """Fold another write into this one."""
+        self.blog_ids |= other.blog_ids
+        self.slugs |= other.slugs
+        self.tag_ids |= other.tag_ids
+        self.bulk = self.bulk or other.bulk
+
+
+BlogWriteListener = Callable[[BlogWriteEvent], None]
+
+_listeners: List[BlogWriteListener] = []
+_once_listeners: List[BlogWriteListener] = []
+_related_listeners: List[BlogWriteListener] = []
+
+
+def on_blog_write(listener: BlogWriteListener) -> BlogWriteListener:
+    """
+    Register a listener for blog writes in every process, for state the
+    process holds itself, such as caches.
+
+    It is called after any commit in this process that writes Blog, Tag or
+    blog_tag rows, and for writes committed by other processes once the
+    blog write subscriber delivers them.
+    """
+    _listeners.append(listener)
+    return listener
+
+
+def on_blog_write_once(listener: BlogWriteListener) -> BlogWriteListener:
+    """
+    Register a listener called once per blog write across all processes, for
+    work on shared state such as related_blog or an external search index.
+
+    It is called from the blog write log by the one API worker holding the
+    log lock, on a worker thread rather than in a commit hook. Writes
+    committed while no worker runs are delivered when one starts.
+    """
+    _once_listeners.append(listener)
+    return listener
+
+
+def on_related_write(listener: BlogWriteListener) -> BlogWriteListener:
+    """
+    Register a listener for recomputed related posts, in every process.
+
+    It is called with a write naming, by slug, the posts whose related
+    posts changed, or a bulk write when all of them may have. Only state
+    showing related posts, such as the blog detail cache, needs it: the
+    posts themselves did not change.
+    """
+    _related_listeners.append(listener)
+    return listener
+
+
+def dispatch_blog_write(write: BlogWriteEvent, once: bool = False) -> None:
+    """Call the on_blog_write listeners, or the on_blog_write_once listeners, with a write."""
+    _dispatch(write, _once_listeners if once else _listeners)
+
+
+def record_blog_write(connection: Connection, write: BlogWriteEvent) -> None:
+    """
+    Log a write in blog_write and announce it on BLOG_WRITE_CHANNEL, inside
+    the caller's transaction: other processes only hear of it if it commits.
+    """
+    connection.execute(
+        insert(BlogWrite).values(
+            blog_ids=sorted(write.blog_ids),
+            slugs=sorted(write.slugs),
+            tag_ids=sorted(write.tag_ids),
+            bulk=write.bulk,
+        )
+    )
+    connection.execute(select(func.pg_notify(BLOG_WRITE_CHANNEL, encode_blog_write(write))))
+
+
+def encode_blog_write(write: BlogWriteEvent) -> str:
+    """NOTIFY payload for a write made by this process."""
+    payload = json.dumps(
+        {
+            "origin": PROCESS_ID,
+            "blog_ids": sorted(str(blog_id) for blog_id in write.blog_ids),
+            "slugs": sorted(write.slugs),
+            "tag_ids": sorted(str(tag_id) for tag_id in write.tag_ids),
+            "bulk": write.bulk,
+        },
+        separators=(",", ":"),
+    )
+    if len(payload.encode("utf-8")) > MAX_PAYLOAD_BYTES:
+        payload = json.dumps({"origin": PROCESS_ID, "bulk": True}, separators=(",", ":"))
+    return payload
+
+
+def decode_blog_write(payload: str) -> Tuple[str, BlogWriteEvent]:
+    """The origin process and the write announced by a NOTIFY payload."""
+    data = json.loads(payload)
+    return data["origin"], BlogWriteEvent(
+        blog_ids={UUID(blog_id) for blog_id in data.get("blog_ids", [])},
+        slugs=set(data.get("slugs", [])),
+        tag_ids={UUID(tag_id) for tag_id in data.get("tag_ids", [])},
+        bulk=bool(data.get("bulk")),
+    )
+
+
+def dispatch_related_write(write: BlogWriteEvent) -> None:
+    """Call the on_related_write listeners with a write."""
+    _dispatch(write, _related_listeners)
+
+
+def notify_related_write(slugs: Iterable[str] = (), bulk: bool = False) -> None:
+    """
+    Announce recomputed related posts on RELATED_WRITE_CHANNEL, then call
+    this process's on_related_write listeners.
+
+    Unlike blog writes these are not logged: they leave the on_blog_write
+    listeners and the feed validators alone. A process that misses the
+    announcement while its subscriber reconnects drops everything anyway.
+    """
+    from app.data.repositories.session import get_engine
+
+    write = BlogWriteEvent(slugs=set(slugs), bulk=bulk)
+    with get_engine().begin() as connection:
+        connection.execute(select(func.pg_notify(RELATED_WRITE_CHANNEL, encode_blog_write(write))))
+    dispatch_related_write(write)
+
+
+def notify_blog_write(
+    blog_ids: Iterable[UUID] = (),
+    slugs: Iterable[str] = (),
+    tag_ids: Iterable[UUID] = (),
+    bulk: bool = False,
+) -> None:
+    """
+    Notify listeners of a blog write: log it for other processes in a
+    transaction of its own, then call this process's listeners.
+
+    ORM writes are picked up automatically; code writing through Core
+    statements (bulk loaders, raw SQL) must call this after committing.
+    """
+    # Imported here: the session module imports this one to register its hooks
+    from app.data.repositories.session import get_engine
+
+    write = BlogWriteEvent(
+        blog_ids=set(blog_ids), slugs=set(slugs), tag_ids=set(tag_ids), bulk=bulk
+    )
+    with get_engine().begin() as connection:
+        record_blog_write(connection, write)
+    _dispatch(write, _listeners)
+
+
+@dataclass
+class UserWriteEvent:
+    """
+    Users whose credentials or status changed in one committed transaction.
+
+    ``user_ids`` are users whose ``is_active`` or password hash changed, or
+    who were deleted. ``bulk`` is set when users were written by a bulk
+    statement; listeners should then treat every user as changed.
+    """
+
+    user_ids: Set[int] = field(default_factory=set)
+    bulk: bool = False
+
+    def __bool__(self) -> bool:
+        return bool(self.user_ids or self.bulk)
+
+    def update(self, other: "UserWriteEvent") -> None:
+        """Fold another write into this one."""
+        self.user_ids |= other.user_ids
+        self.bulk = self.bulk or other.bulk
+
+
+UserWriteListener = Callable[[UserWriteEvent], None]
+
+_user_listeners: List[UserWriteListener] = []
+
+
+def on_user_write(listener: UserWriteListener) -> UserWriteListener:
+    """
+    Register a listener called after any commit that changes a user's
+    is_active or password, in this process or, once the write subscriber
+    delivers it, in another one such as a script.
+    """
+    _user_listeners.append(listener)
+    return listener
+
+
+def dispatch_user_write(write: UserWriteEvent) -> None:
+    """Call the on_user_write listeners with a write."""
+    _dispatch_users(write)
+
+
+def encode_user_write(write: UserWriteEvent) -> str:
+    """NOTIFY payload for a user write made by this process."""
+    payload = json.dumps(
+        {"origin": PROCESS_ID, "user_ids": sorted(write.user_ids), "bulk": write.bulk},
+        separators=(",", ":"),
+    )
+    if len(payload.encode("utf-8")) > MAX_PAYLOAD_BYTES:
+        payload = json.dumps({"origin": PROCESS_ID, "bulk": True}, separators=(",", ":"))
+    return payload
+
+
+def decode_user_write(payload: str) -> Tuple[str, UserWriteEvent]:
+    """The origin process and the user write announced by a NOTIFY payload."""
+    data = json.loads(payload)
+    return data["origin"], UserWriteEvent(
+        user_ids={int(user_id) for user_id in data.get("user_ids", [])},
+        bulk=bool(data.get("bulk")),
+    )
+
+
+def notify_user_write(user_ids: Iterable[int] = (), bulk: bool = False) -> None:
+    """
+    Announce a user write to other processes, then call this process's
+    listeners; needed after Core statements that update users.
+    """
+    from app.data.repositories.session import get_engine
+
+    write = UserWriteEvent(user_ids=set(user_ids), bulk=bulk)
+    with get_engine().begin() as connection:
+        connection.execute(select(func.pg_notify(USER_WRITE_CHANNEL, encode_user_write(write))))
+    _dispatch_users(write)
+
+
+def _dispatch(write: BlogWriteEvent, listeners: List[BlogWriteListener]) -> None:
+    for listener in list(listeners):
+        try:
+            listener(write)
+        except Exception:
+            logger.exception("Blog write listener %r failed", listener)
+
+
+def _dispatch_users(write: UserWriteEvent) -> None:
+    for listener in list(_user_listeners):
+        try:
+            listener(write)
+        except Exception:
+            logger.exception("User write listener %r failed", listener)
+
+
+def _pending_users(session: Session) -> UserWriteEvent:
+    return session.info.setdefault(_PENDING_USERS_KEY, UserWriteEvent())
+
+
+def _pending(session: Session) -> BlogWriteEvent:
+    return session.info.setdefault(_PENDING_KEY, BlogWriteEvent())
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_flushed_writes(session: Session, flush_context) -> None:
+    pending = None
+    dirty = session.dirty
+    for obj in chain(session.new, dirty, session.deleted):
+        if isinstance(obj, User):
+            _collect_user_write(session, obj)
+            continue
+        if not isinstance(obj, (Blog, Tag)):
+            continue
+        if obj in dirty and not session.is_modified(obj):
+            continue
+
+        if pending is None:
+            pending = _pending(session)
+        if isinstance(obj, Blog):
+            pending.blog_ids.add(obj.id)
+            history = inspect(obj).attrs.slug.history
+            pending.slugs.update(s for s in chain(history.sum(), [obj.slug]) if s)
+        else:
+            pending.tag_ids.add(obj.id)
+
+
+def _collect_user_write(session: Session, user: User) -> None:
+    if user in session.new:
+        return
+
+    attrs = inspect(user).attrs
+    if (
+        user in session.deleted
+        or attrs.is_active.history.has_changes()
+        or attrs.password_hash.history.has_changes()
+    ):
+        _pending_users(session).user_ids.add(user.id)
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _collect_bulk_writes(orm_execute_state) -> None:
+    if not (orm_execute_state.is_update or orm_execute_state.is_delete):
+        return
+
+    mapper = orm_execute_state.bind_mapper
+    if mapper is not None and mapper.class_ in (Blog, Tag):
+        _pending(orm_execute_state.session).bulk = True
+    elif mapper is not None and mapper.class_ is User:
+        _pending_users(orm_execute_state.session).bulk = True
+
+
+@event.listens_for(Session, "before_commit")
+def _record_committing_writes(session: Session) -> None:
+    if session.in_nested_transaction():
+        return
+    # Commit flushes only after this hook, and the log row must see every write
+    session.flush()
+    pending = session.info.get(_PENDING_KEY)
+    if pending:
+        record_blog_write(session.connection(), pending)
+
+    # Sent only if the transaction commits, like the blog write announcement
+    pending_users = session.info.get(_PENDING_USERS_KEY)
+    if pending_users:
+        session.connection().execute(
+            select(func.pg_notify(USER_WRITE_CHANNEL, encode_user_write(pending_users)))
+        )
+
+
+@event.listens_for(Session, "after_commit")
+def _dispatch_committed_writes(session: Session) -> None:
+    pending = session.info.pop(_PENDING_KEY, None)
+    if pending:
+        _dispatch(pending, _listeners)
+
+    pending_users = session.info.pop(_PENDING_USERS_KEY, None)
+    if pending_users:
+        _dispatch_users(pending_users)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_rolled_back_writes(session: Session) -> None:
+    session.info.pop(_PENDING_KEY, None)
+    session.info.pop(_PENDING_USERS_KEY, None)
@@ -1,7 +1,9 @@
 from app.data.models.base import Base
 from app.data.models.blog import Blog
+from app.data.models.blog_write import BlogWrite
 from app.data.models.tag import Tag
 from app.data.models.contact import Contact
+from app.data.models.revoked_token import RevokedToken
 from app.data.models.user import User
 
-__all__ = ["Base", "Blog", "Tag", "Contact", "User"]
+__all__ = ["Base", "Blog", "BlogWrite", "Tag", "Contact", "RevokedToken", "User"]
@@ -2,19 +2,28 @@
 from datetime import datetime
 from sqlalchemy import (
     Column,
+    Computed,
+    Float,
     ForeignKey,
     Integer,
     String,
     Text,
     DateTime,
     CheckConstraint,
+    Index,
     Table,
+    event,
+    text,
 )
-from sqlalchemy.dialects.postgresql import UUID
-from sqlalchemy.orm import relationship
+from sqlalchemy.dialects.postgresql import JSONB, TSVECTOR, UUID
+from sqlalchemy.orm import deferred, query_expression, relationship
 
+from app.data.content import apply_content_summary
 from app.data.models.base import Base, BaseModel
 
+# Text search configuration used for Blog.search_vector and its queries
+SEARCH_CONFIG = "english"
+
 blog_tag = Table(
     "blog_tag",
     Base.metadata,
@@ -22,6 +31,8 @@ blog_tag = Table(
         "blog_id", UUID, ForeignKey("blog.id", ondelete="CASCADE"), primary_key=True
     ),
     Column("tag_id", UUID, ForeignKey("tag.id", ondelete="CASCADE"), primary_key=True),
+    # The primary key leads with blog_id; this serves lookups starting from a tag
+    Index("ix_blog_tag_tag_id_blog_id", "tag_id", "blog_id"),
 )
 
 related_blog = Table(
@@ -40,6 +51,8 @@ related_blog = Table(
         primary_key=True,
     ),
     Column("relationship_type", String(50)),
+    # Strength of the relation; detail views list related posts by descending score
+    Column("score", Float),
     CheckConstraint("source_blog_id != related_blog_id", name="different_blogs"),
 )
 
@@ -62,6 +75,27 @@ class Blog(Base, BaseModel):
     seo_description = Column(String(255))
     reading_time = Column(Integer)
 
+    # Derived from content on every write by apply_content_summary
+    word_count = Column(Integer)
+    content_hash = Column(String(64))
+    outline = Column(JSONB)  # [{"level": 2, "text": "...", "anchor": "..."}]
+
+    # Weighted full-text document: title (A), excerpt (B), content (C)
+    search_vector = deferred(
+        Column(
+            TSVECTOR,
+            Computed(
+                f"setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(title, '')), 'A') || "
+                f"setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(excerpt, '')), 'B') || "
+                f"setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(content, '')), 'C')",
+                persisted=True,
+            ),
+        )
+    )
+
+    # Search rank, populated only by queries that load it with with_expression()
+    relevance = query_expression()
+
     tags = relationship("Tag", secondary=blog_tag, back_populates="blogs")
 
     # Fixed relationship - use string references to avoid circular import issues
@@ -85,4 +119,36 @@ class Blog(Base, BaseModel):
         CheckConstraint(
             "status IN ('draft', 'published', 'archived')", name="status_check"
         ),
-    )
\ No newline at end of file
+        Index("ix_blog_search_vector", "search_vector", postgresql_using="gin"),
+        # Keyset pagination indexes, one per sortable field
+        Index(
+            "ix_blog_published_publication_dt_id",
+            "publication_dt",
+            "id",
+            postgresql_where=text("status = 'published'"),
+        ),
+        Index(
+            "ix_blog_published_updated_dt_id",
+            "updated_dt",
+            "id",
+            postgresql_where=text("status = 'published'"),
+        ),
+        Index(
+            "ix_blog_published_title_id",
+            "title",
+            "id",
+            postgresql_where=text("status = 'published'"),
+        ),
+        Index(
+            "ix_blog_published_reading_time_id",
+            "reading_time",
+            "id",
+            postgresql_where=text("status = 'published'"),
+        ),
+    )
+
+
+@event.listens_for(Blog, "before_insert")
+@event.listens_for(Blog, "before_update")
+def _derive_content_fields(mapper, connection, blog):
+    apply_content_summary(blog)
\ No newline at end of file
@@ -0,0 +1,33 @@
+from datetime import datetime
+
+from sqlalchemy import BigInteger, Boolean, Column, DateTime, Index, String, text
+from sqlalchemy.dialects.postgresql import ARRAY, UUID
+
+from app.data.models.base import Base
+
+
+class BlogWrite(Base):
+    """
+    A committed write of Blog, Tag or blog_tag rows, logged for other processes.
+
+    Rows are added in the writing transaction and announced with NOTIFY (see
+    app.data.events). The API worker holding the write log lock applies
+    pending rows to the on_blog_write_once listeners and sets
+    ``processed_dt``. Processed rows are deleted after a retention period,
+    except the newest, whose id serves as the blog write generation.
+    """
+
+    __tablename__ = "blog_write"
+
+    id = Column(BigInteger, primary_key=True)
+    blog_ids = Column(ARRAY(UUID(as_uuid=True)), nullable=False, default=list)
+    slugs = Column(ARRAY(String(255)), nullable=False, default=list)
+    tag_ids = Column(ARRAY(UUID(as_uuid=True)), nullable=False, default=list)
+    bulk = Column(Boolean, nullable=False, default=False)
+    written_dt = Column(DateTime, nullable=False, default=datetime.utcnow)
+    processed_dt = Column(DateTime)
+
+    __table_args__ = (
+        # Pending rows, read oldest first by the log processor
+        Index("ix_blog_write_pending", "id", postgresql_where=text("processed_dt IS NULL")),
+    )
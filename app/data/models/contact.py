@@ -1,11 +1,13 @@
 # backend/app/models/contact.py
 from datetime import datetime  # Add this import
-from sqlalchemy import Column, String, Text, DateTime, CheckConstraint
+from sqlalchemy import Column, String, Text, DateTime, CheckConstraint, Index
 
 from app.data.models.base import Base, BaseModel
 
 # rest of the file remains the same
 
+CONTACT_STATUSES = ("new", "read", "replied", "archived")
+
 
 class Contact(Base, BaseModel):
     """Model representing a contact form submission."""
@@ -16,15 +18,16 @@ class Contact(Base, BaseModel):
     email = Column(String(255), nullable=False)
     subject = Column(String(255), nullable=False)
     message = Column(Text, nullable=False)
-    submission_dt = Column(
-        DateTime, nullable=False, default=datetime.utcnow, index=True
-    )
+    submission_dt = Column(DateTime, nullable=False, default=datetime.utcnow)
     ip_address = Column(String(45))
-    status = Column(String(20), nullable=False, default="new", index=True)
+    status = Column(String(20), nullable=False, default="new")
 
     # Constraints
     __table_args__ = (
         CheckConstraint(
             "status IN ('new', 'read', 'replied', 'archived')", name="status_check"
         ),
+        # Keyset pagination on (submission_dt, id), with and without a status filter
+        Index("ix_contact_status_submission_dt_id", "status", "submission_dt", "id"),
+        Index("ix_contact_submission_dt_id", "submission_dt", "id"),
     )
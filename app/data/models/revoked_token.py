@@ -0,0 +1,22 @@
+from datetime import datetime
+
+from sqlalchemy import Column, DateTime, Integer, String
+
+from app.data.models.base import Base
+
+
+class RevokedToken(Base):
+    """
+    A revoked refresh token (``jti:<jti>``) or token family (``fam:<id>``).
+
+    Rows are grouped by ``expiry_bucket``, the hour their token expires in,
+    so expired revocations are deleted bucket by bucket.
+    """
+
+    __tablename__ = "revoked_token"
+
+    key = Column(String(64), primary_key=True)
+    reason = Column(String(20), nullable=False)
+    expires_at = Column(DateTime, nullable=False)
+    expiry_bucket = Column(Integer, nullable=False, index=True)
+    revoked_dt = Column(DateTime, nullable=False, default=datetime.utcnow, index=True)
@@ -1,11 +1,276 @@
-from typing import List, Optional, Tuple
+from typing import Any, AsyncIterator, Iterator, List, Optional, Sequence, Tuple
 from uuid import UUID
-from sqlalchemy import and_, or_, desc, asc, func, text
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy import Row, and_, or_, desc, asc, cast, exists, func, select, text, tuple_
+from sqlalchemy.dialects.postgresql import DOUBLE_PRECISION
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, joinedload, load_only, selectinload, with_expression
 
-from app.data.models.blog import Blog
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.data.events import on_blog_write
+from app.data.models.blog import SEARCH_CONFIG, Blog, blog_tag, related_blog
+from app.data.models.blog_write import BlogWrite
 from app.data.models.tag import Tag
-from app.data.repositories.base import CRUDBase
+from app.data.repositories.base import AsyncCRUDBase, CRUDBase
+
+# Totals per filter signature, so repeated listings skip counting
+_total_cache = TTLCache(
+    maxsize=settings.BLOG_TOTAL_CACHE_SIZE,
+    ttl=settings.BLOG_TOTAL_CACHE_TTL_SECONDS,
+)
+on_blog_write(lambda write: _total_cache.clear())
+
+# Columns a listing renders (BlogListItemDTO and its tags)
+LIST_COLUMNS = (Blog.id, Blog.title, Blog.slug, Blog.excerpt, Blog.publication_dt, Blog.reading_time)
+LIST_TAG_COLUMNS = (Tag.id, Tag.name, Tag.color_code)
+# Columns the RSS, Atom and sitemap documents render
+FEED_COLUMNS = (Blog.slug, Blog.title, Blog.excerpt, Blog.publication_dt, Blog.updated_dt)
+
+
+def list_projection(*extra_columns):
+    """
+    Loader options for listings: only LIST_COLUMNS plus ``extra_columns`` and
+    the tags' LIST_TAG_COLUMNS are fetched. Content, SEO fields and the search
+    vector stay in the database, and touching them raises instead of lazy
+    loading.
+
+    Tags are selectin-loaded for the chosen page in a second statement, so
+    the page's LIMIT counts blogs rather than blog/tag join rows.
+    """
+    return (
+        load_only(*LIST_COLUMNS, *extra_columns, raiseload=True),
+        selectinload(Blog.tags).load_only(*LIST_TAG_COLUMNS, raiseload=True),
+    )
+
+
+def tag_filter(tag_uuids: List[UUID], tag_match: str = "any"):
+    """
+    Criterion for blogs carrying any (or, with ``tag_match="all"``, every) tag.
+
+    Correlated EXISTS on blog_tag never multiplies blog rows, so no DISTINCT
+    is needed, and each probe is an index lookup on the (blog_id, tag_id)
+    primary key or the (tag_id, blog_id) index.
+    """
+    if tag_match == "all":
+        return and_(*(
+            exists().where(blog_tag.c.blog_id == Blog.id, blog_tag.c.tag_id == tag_uuid)
+            for tag_uuid in tag_uuids
+        ))
+    return exists().where(blog_tag.c.blog_id == Blog.id, blog_tag.c.tag_id.in_(tag_uuids))
+
+
+class PublishedBlogsQuery:
+    """
+    Statements behind one page of published blogs.
+
+    Pages by offset unless a keyset is given: ``after`` selects the rows
+    following a ``(sort_value, id)`` key and ``before`` the rows preceding it,
+    so deep pages cost the same as the first one.
+
+    ``tag_uuids`` keeps blogs carrying any of the tags, or all of them with
+    ``tag_match="all"``.
+
+    ``search_term`` is matched against the weighted search vector with
+    websearch_to_tsquery syntax; ``sort_by="relevance"`` orders matches by
+    their rank, which is also loaded into ``Blog.relevance``.
+
+    The total is read from a short-lived cache keyed on the filters, or else
+    counted by a window function in the page query itself. Keyset pages cannot
+    window-count the rows behind the cursor and need a separate count. With
+    ``include_total=False`` nothing is counted.
+
+    Building the statements here lets the sync and async repositories share
+    the query logic and differ only in how they execute it.
+    """
+
+    def __init__(
+        self,
+        page: int = 1,
+        page_size: int = 10,
+        tag_uuids: Optional[List[UUID]] = None,
+        search_term: Optional[str] = None,
+        sort_by: str = "publication_dt",
+        sort_dir: str = "desc",
+        after: Optional[Tuple[Any, UUID]] = None,
+        before: Optional[Tuple[Any, UUID]] = None,
+        include_total: bool = True,
+        tag_match: str = "any"
+    ):
+        self.page_size = page_size
+        self.after = after
+        self.before = before
+        self.keyset = after is not None or before is not None
+        self.offset = 0 if self.keyset else (page - 1) * page_size
+        self.descending = sort_dir.lower() != "asc"
+
+        self.criteria = [Blog.status == "published"]
+
+        if tag_uuids:
+            self.criteria.append(tag_filter(tag_uuids, tag_match))
+
+        self.rank = None
+        if search_term:
+            ts_query = func.websearch_to_tsquery(SEARCH_CONFIG, search_term)
+            # Rank as float8 so it round-trips exactly through keyset cursors
+            self.rank = cast(func.ts_rank_cd(Blog.search_vector, ts_query), DOUBLE_PRECISION)
+            self.criteria.append(Blog.search_vector.op("@@")(ts_query))
+
+        if sort_by == "relevance" and self.rank is not None:
+            self.sort_column = self.rank
+            self.projection = list_projection()
+        else:
+            self.sort_column = getattr(Blog, sort_by, Blog.publication_dt)
+            # Cursors are built from the sort value, so it has to be loaded
+            self.projection = list_projection(self.sort_column)
+
+        self.include_total = include_total
+        self.total_key = self._total_cache_key(tag_uuids, tag_match, search_term)
+        self.total_count = _total_cache.get(self.total_key) if include_total else None
+        self.windowed = include_total and self.total_count is None and not self.keyset
+
+    @property
+    def needs_count(self) -> bool:
+        """Whether the total must be counted before the page is fetched."""
+        return self.include_total and self.total_count is None and not self.windowed
+
+    def count_statement(self):
+        return select(func.count()).select_from(Blog).where(*self.criteria)
+
+    def set_total(self, total_count: int) -> None:
+        self.total_count = total_count
+        _total_cache.set(self.total_key, total_count)
+
+    def page_statement(self):
+        """Select one page plus a look-ahead row that tells whether more exist."""
+        columns = [Blog]
+        if self.windowed:
+            columns.append(func.count().over().label("total_count"))
+
+        stmt = select(*columns).options(*self.projection).where(*self.criteria)
+        if self.rank is not None:
+            stmt = stmt.options(with_expression(Blog.relevance, self.rank))
+
+        if self.before is not None:
+            # Walk backwards from the key; result() restores the requested order
+            stmt = stmt.where(self._keyset_filter(self.before, greater=self.descending))
+            stmt = self._order(stmt, descending=not self.descending)
+        else:
+            if self.after is not None:
+                stmt = stmt.where(self._keyset_filter(self.after, greater=not self.descending))
+            stmt = self._order(stmt, descending=self.descending)
+
+        return stmt.offset(self.offset).limit(self.page_size + 1)
+
+    def needs_count_after(self, rows) -> bool:
+        """Past the last page the window count has no row to report on."""
+        return self.windowed and not rows and self.offset > 0
+
+    def result(self, rows) -> Tuple[List[Blog], Optional[int], bool]:
+        """Turn the page rows into (blogs, total_count, has_more)."""
+        if self.windowed and self.total_count is None:
+            self.set_total(rows[0].total_count if rows else 0)
+
+        blogs = [row[0] for row in rows]
+        has_more = len(blogs) > self.page_size
+        blogs = blogs[:self.page_size]
+
+        if self.before is not None:
+            blogs.reverse()
+
+        return blogs, self.total_count, has_more
+
+    @staticmethod
+    def _total_cache_key(tag_uuids: Optional[List[UUID]], tag_match: str, search_term: Optional[str]):
+        """Signature of the filters a total depends on."""
+        tags = tuple(sorted(str(tag_uuid) for tag_uuid in tag_uuids)) if tag_uuids else ()
+        return "published", tags, tag_match if tags else None, search_term
+
+    def _order(self, stmt, descending: bool):
+        """Order by the sort column with the id as a unique tiebreaker."""
+        if descending:
+            return stmt.order_by(desc(self.sort_column), desc(Blog.id))
+        return stmt.order_by(asc(self.sort_column), asc(Blog.id))
+
+    def _keyset_filter(self, key: Tuple[Any, UUID], greater: bool):
+        """
+        Match rows strictly past ``key`` in ``(sort_column, id)`` order.
+
+        NULL sort values are treated as larger than any other value, which is
+        where Postgres places them by default (last ascending, first descending).
+        """
+        sort_column = self.sort_column
+        value, last_id = key
+        if greater:
+            if value is None:
+                return and_(sort_column.is_(None), Blog.id > last_id)
+            return or_(
+                tuple_(sort_column, Blog.id) > (value, last_id),
+                sort_column.is_(None)
+            )
+
+        if value is None:
+            return or_(
+                sort_column.isnot(None),
+                and_(sort_column.is_(None), Blog.id < last_id)
+            )
+        return tuple_(sort_column, Blog.id) < (value, last_id)
+
+
+def _published_by_ids_statement(blog_ids: List[UUID]):
+    return select(Blog).options(*list_projection()).where(
+        and_(Blog.id.in_(blog_ids), Blog.status == "published")
+    )
+
+
+def _in_given_order(blogs: List[Blog], blog_ids: List[UUID]) -> List[Blog]:
+    position = {blog_id: index for index, blog_id in enumerate(blog_ids)}
+    return sorted(blogs, key=lambda blog: position[blog.id])
+
+
+def _related_statement(blog_id: UUID, limit: int):
+    # Served by the related_blog primary key, which leads with source_blog_id
+    return (
+        select(Blog)
+        .join(related_blog, related_blog.c.related_blog_id == Blog.id)
+        .options(load_only(*LIST_COLUMNS, raiseload=True))
+        .where(related_blog.c.source_blog_id == blog_id, Blog.status == "published")
+        .order_by(desc(related_blog.c.score), Blog.id)
+        .limit(limit)
+    )
+
+
+def _feed_validators_statement():
+    # The latest updated_dt is answered from the end of
+    # ix_blog_published_updated_dt_id, the newest write from the blog_write
+    # primary key. Unlike updated_dt, the write also moves when a post is
+    # deleted or unpublished.
+    newest_write = select(BlogWrite).order_by(desc(BlogWrite.id)).limit(1)
+    return select(
+        select(func.max(Blog.updated_dt)).where(Blog.status == "published").scalar_subquery().label("updated_dt"),
+        newest_write.with_only_columns(BlogWrite.id).scalar_subquery().label("write_id"),
+        newest_write.with_only_columns(BlogWrite.written_dt).scalar_subquery().label("written_dt"),
+    )
+
+
+def _feed_statement(limit: Optional[int], batch_size: int):
+    # Newest first along ix_blog_published_publication_dt_id; yield_per makes
+    # the driver fetch rows batch by batch from a server-side cursor
+    stmt = (
+        select(*FEED_COLUMNS)
+        .where(Blog.status == "published")
+        .order_by(desc(Blog.publication_dt), desc(Blog.id))
+        .execution_options(yield_per=batch_size)
+    )
+    return stmt if limit is None else stmt.limit(limit)
+
+
+def _published_by_slug_statement(slug: str):
+    # Tags come in the same round trip; the detail view always renders them
+    return (
+        select(Blog)
+        .options(joinedload(Blog.tags))
+        .where(and_(Blog.slug == slug, Blog.status == "published"))
+    )
 
 
 class BlogRepository(CRUDBase[Blog, None, None]):
@@ -22,44 +287,41 @@ class BlogRepository(CRUDBase[Blog, None, None]):
         tag_uuids: Optional[List[UUID]] = None,
         search_term: Optional[str] = None,
         sort_by: str = "publication_dt",
-        sort_dir: str = "desc"
-    ) -> Tuple[List[Blog], int]:
+        sort_dir: str = "desc",
+        after: Optional[Tuple[Any, UUID]] = None,
+        before: Optional[Tuple[Any, UUID]] = None,
+        include_total: bool = True,
+        tag_match: str = "any"
+    ) -> Tuple[List[Blog], Optional[int], bool]:
         """
         Get published blogs with filtering, pagination and sorting.
 
+        See PublishedBlogsQuery for keyset paging, search and counting.
+
         Returns:
-            Tuple of (blogs_list, total_count)
+            Tuple of (blogs_list, total_count, has_more), where total_count is
+            None when not requested and has_more tells whether further rows
+            exist in the direction of travel
         """
-        # Base query for published blogs
-        query = db.query(Blog).options(joinedload(Blog.tags)).filter(
-            Blog.status == "published"
+        listing = PublishedBlogsQuery(
+            page, page_size, tag_uuids, search_term, sort_by, sort_dir, after, before, include_total, tag_match
         )
+        if listing.needs_count:
+            listing.set_total(db.execute(listing.count_statement()).scalar_one())
 
-        if tag_uuids:
-            query = query.join(Blog.tags).filter(Tag.id.in_(tag_uuids))
+        rows = db.execute(listing.page_statement()).unique().all()
+        if listing.needs_count_after(rows):
+            listing.set_total(db.execute(listing.count_statement()).scalar_one())
 
-        if search_term:
-            search_pattern = f"%{search_term}%"
-            query = query.filter(
-                or_(
-                    Blog.title.ilike(search_pattern),
-                    Blog.content.ilike(search_pattern),
-                    Blog.excerpt.ilike(search_pattern)
-                )
-            )
-
-        total_count = query.distinct().count() if tag_uuids else query.count()
-
-        sort_column = getattr(Blog, sort_by, Blog.publication_dt)
-        if sort_dir.lower() == "asc":
-            query = query.order_by(asc(sort_column))
-        else:
-            query = query.order_by(desc(sort_column))
+        return listing.result(rows)
 
-        offset = (page - 1) * page_size
-        blogs = query.distinct().offset(offset).limit(page_size).all()
+    def get_published_by_ids(self, db: Session, blog_ids: List[UUID]) -> List[Blog]:
+        """Get published blogs by id, in the order the ids are given."""
+        if not blog_ids:
+            return []
 
-        return blogs, total_count
+        blogs = db.scalars(_published_by_ids_statement(blog_ids)).unique().all()
+        return _in_given_order(blogs, blog_ids)
 
     def get_by_slug(self, db: Session, slug: str) -> Optional[Blog]:
         """Get a blog by its slug."""
@@ -67,6 +329,90 @@ class BlogRepository(CRUDBase[Blog, None, None]):
 
     def get_published_by_slug(self, db: Session, slug: str) -> Optional[Blog]:
         """Get a published blog by its slug."""
-        return db.query(Blog).filter(
-            and_(Blog.slug == slug, Blog.status == "published")
-        ).first()
\ No newline at end of file
+        return db.scalars(_published_by_slug_statement(slug)).unique().first()
+
+    def get_related(self, db: Session, blog_id: UUID, limit: int = 5) -> List[Blog]:
+        """Get the published blogs related to a blog, most related first."""
+        return db.scalars(_related_statement(blog_id, limit)).all()
+
+    def get_feed_validators(self, db: Session) -> Row:
+        """Latest updated_dt of any published blog, and the id and written_dt of the newest blog write."""
+        return db.execute(_feed_validators_statement()).one()
+
+    def iter_feed_entries(
+        self, db: Session, limit: Optional[int] = None, batch_size: int = 500
+    ) -> Iterator[Sequence[Row]]:
+        """
+        Published blogs as FEED_COLUMNS rows, newest first, in batches of
+        ``batch_size`` read from a server-side cursor.
+        """
+        yield from db.execute(_feed_statement(limit, batch_size)).partitions()
+
+
+class AsyncBlogRepository(AsyncCRUDBase[Blog, None, None]):
+    """Async variant of BlogRepository, running the same statements on an AsyncSession."""
+
+    def __init__(self):
+        super().__init__(Blog)
+
+    async def get_published_blogs(
+        self,
+        db: AsyncSession,
+        page: int = 1,
+        page_size: int = 10,
+        tag_uuids: Optional[List[UUID]] = None,
+        search_term: Optional[str] = None,
+        sort_by: str = "publication_dt",
+        sort_dir: str = "desc",
+        after: Optional[Tuple[Any, UUID]] = None,
+        before: Optional[Tuple[Any, UUID]] = None,
+        include_total: bool = True,
+        tag_match: str = "any"
+    ) -> Tuple[List[Blog], Optional[int], bool]:
+        """Get published blogs with filtering, pagination and sorting."""
+        listing = PublishedBlogsQuery(
+            page, page_size, tag_uuids, search_term, sort_by, sort_dir, after, before, include_total, tag_match
+        )
+        if listing.needs_count:
+            listing.set_total((await db.execute(listing.count_statement())).scalar_one())
+
+        rows = (await db.execute(listing.page_statement())).unique().all()
+        if listing.needs_count_after(rows):
+            listing.set_total((await db.execute(listing.count_statement())).scalar_one())
+
+        return listing.result(rows)
+
+    async def get_published_by_ids(self, db: AsyncSession, blog_ids: List[UUID]) -> List[Blog]:
+        """Get published blogs by id, in the order the ids are given."""
+        if not blog_ids:
+            return []
+
+        blogs = (await db.scalars(_published_by_ids_statement(blog_ids))).unique().all()
+        return _in_given_order(blogs, blog_ids)
+
+    async def get_by_slug(self, db: AsyncSession, slug: str) -> Optional[Blog]:
+        """Get a blog by its slug."""
+        return (await db.scalars(select(Blog).where(Blog.slug == slug))).first()
+
+    async def get_published_by_slug(self, db: AsyncSession, slug: str) -> Optional[Blog]:
+        """Get a published blog by its slug."""
+        return (await db.scalars(_published_by_slug_statement(slug))).unique().first()
+
+    async def get_related(self, db: AsyncSession, blog_id: UUID, limit: int = 5) -> List[Blog]:
+        """Get the published blogs related to a blog, most related first."""
+        return (await db.scalars(_related_statement(blog_id, limit))).all()
+
+    async def get_feed_validators(self, db: AsyncSession) -> Row:
+        """Latest updated_dt of any published blog, and the id and written_dt of the newest blog write."""
+        return (await db.execute(_feed_validators_statement())).one()
+
+    async def iter_feed_entries(
+        self, db: AsyncSession, limit: Optional[int] = None, batch_size: int = 500
+    ) -> AsyncIterator[Sequence[Row]]:
+        """
+        Published blogs as FEED_COLUMNS rows, newest first, in batches of
+        ``batch_size`` read from a server-side cursor.
+        """
+        result = await db.stream(_feed_statement(limit, batch_size))
+        async for partition in result.partitions():
+            yield partition
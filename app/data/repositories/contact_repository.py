@@ -0,0 +1,84 @@
+from datetime import datetime
+from typing import AsyncIterator, Dict, List, Optional, Sequence, Tuple
+from uuid import UUID
+
+from sqlalchemy import Row, desc, insert, select, tuple_, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.data.models.contact import Contact
+from app.data.repositories.base import AsyncCRUDBase
+
+# Columns an export writes, in output order
+EXPORT_COLUMNS = (
+    Contact.id,
+    Contact.submission_dt,
+    Contact.status,
+    Contact.name,
+    Contact.email,
+    Contact.subject,
+    Contact.message,
+    Contact.ip_address,
+)
+
+
+class AsyncContactRepository(AsyncCRUDBase[Contact, None, None]):
+    """Repository for contact form submissions."""
+
+    def __init__(self):
+        super().__init__(Contact)
+
+    async def insert_many(self, db: AsyncSession, rows: List[Dict]) -> None:
+        """Insert submissions with one multi-row INSERT; the caller commits."""
+        if rows:
+            await db.execute(insert(Contact).values(rows))
+
+    async def get_page(
+        self,
+        db: AsyncSession,
+        status: Optional[str] = None,
+        after: Optional[Tuple[datetime, UUID]] = None,
+        limit: int = 50,
+    ) -> List[Contact]:
+        """
+        Newest submissions first, ``limit`` at a time, starting after the
+        (submission_dt, id) key of the previous page's last row.
+
+        Served by ix_contact_status_submission_dt_id, or by
+        ix_contact_submission_dt_id without a status filter.
+        """
+        stmt = select(Contact).order_by(desc(Contact.submission_dt), desc(Contact.id)).limit(limit)
+        if status is not None:
+            stmt = stmt.where(Contact.status == status)
+        if after is not None:
+            stmt = stmt.where(tuple_(Contact.submission_dt, Contact.id) < after)
+        return (await db.scalars(stmt)).all()
+
+    async def update_status(self, db: AsyncSession, contact_ids: List[UUID], status: str) -> int:
+        """Set the status of the given submissions in one UPDATE; returns the rows changed."""
+        if not contact_ids:
+            return 0
+        result = await db.execute(
+            update(Contact)
+            .where(Contact.id.in_(contact_ids), Contact.status != status)
+            .values(status=status)
+            .execution_options(synchronize_session=False)
+        )
+        return result.rowcount
+
+    async def iter_export(
+        self, db: AsyncSession, status: Optional[str] = None, batch_size: int = 1000
+    ) -> AsyncIterator[Sequence[Row]]:
+        """
+        Submissions as EXPORT_COLUMNS rows, oldest first, in batches of
+        ``batch_size`` read from a server-side cursor.
+        """
+        stmt = (
+            select(*EXPORT_COLUMNS)
+            .order_by(Contact.submission_dt, Contact.id)
+            .execution_options(yield_per=batch_size)
+        )
+        if status is not None:
+            stmt = stmt.where(Contact.status == status)
+        result = await db.stream(stmt)
+        async for partition in result.partitions():
+            yield partition
@@ -1,7 +1,70 @@
-from sqlalchemy import create_engine
+import threading
+from typing import Optional, Tuple
+
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker
 from sqlalchemy.orm import sessionmaker
 
-from app.core.config import settings
+from app.core.database import create_async_database_engine, create_database_engine
+
+# The application's only engines, both sized by the DB_POOL_* settings. They
+# are created by init_engines(), which the application calls in its lifespan,
+# so importing the application builds no pools
+_engine: Optional[Engine] = None
+_async_engine: Optional[AsyncEngine] = None
+_lock = threading.Lock()
+
+
+class _SessionFactory(sessionmaker):
+    """Creates the engines on first use, for scripts and jobs that run without the lifespan."""
+
+    def __call__(self, **local_kw):
+        init_engines()
+        return super().__call__(**local_kw)
+
+
+class _AsyncSessionFactory(async_sessionmaker):
+    def __call__(self, **local_kw):
+        init_engines()
+        return super().__call__(**local_kw)
+
+
+# Sync sessions serve scripts and background jobs
+SessionLocal = _SessionFactory(autocommit=False, autoflush=False)
+
+# Async sessions for request handlers, so queries never block the event loop
+AsyncSessionLocal = _AsyncSessionFactory(autoflush=False, expire_on_commit=False)
+
+
+def init_engines() -> Tuple[Engine, AsyncEngine]:
+    """Create the engines, once, and bind the session factories to them."""
+    global _engine, _async_engine
+    if _engine is None:
+        with _lock:
+            if _engine is None:
+                engine, async_engine = create_database_engine(), create_async_database_engine()
+                SessionLocal.configure(bind=engine)
+                AsyncSessionLocal.configure(bind=async_engine)
+                # _engine last: other threads take it as the sign both exist
+                _async_engine, _engine = async_engine, engine
+    return _engine, _async_engine
+
+
+def get_engine() -> Engine:
+    return init_engines()[0]
+
+
+def get_async_engine() -> AsyncEngine:
+    return init_engines()[1]
+
+
+async def dispose_engines() -> None:
+    """Close every pooled connection; the engines reconnect if used again."""
+    if _engine is not None:
+        await _async_engine.dispose()
+        _engine.dispose()
+
 
-engine = create_engine(settings.SQLALCHEMY_DATABASE_URI)
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# Registers the session hooks that log blog writes for other processes, so
+# every writer using these sessions is covered
+import app.data.events  # noqa: E402,F401
@@ -0,0 +1,33 @@
+from typing import List
+
+from sqlalchemy import and_, func, select
+from sqlalchemy.engine import Row
+from sqlalchemy.orm import Session
+
+from app.data.models.blog import Blog, blog_tag
+from app.data.models.tag import Tag
+from app.data.repositories.base import CRUDBase
+
+
+class TagRepository(CRUDBase[Tag, None, None]):
+    """Repository for Tag entities."""
+
+    def __init__(self):
+        super().__init__(Tag)
+
+    def get_with_published_counts(self, db: Session) -> List[Row]:
+        """
+        Get every tag with the number of published blogs carrying it.
+
+        Returns:
+            Rows of (id, name, color_code, post_count), ordered by name
+        """
+        stmt = (
+            select(Tag.id, Tag.name, Tag.color_code, func.count(Blog.id).label("post_count"))
+            .select_from(Tag)
+            .outerjoin(blog_tag, blog_tag.c.tag_id == Tag.id)
+            .outerjoin(Blog, and_(Blog.id == blog_tag.c.blog_id, Blog.status == "published"))
+            .group_by(Tag.id)
+            .order_by(Tag.name)
+        )
+        return db.execute(stmt).all()
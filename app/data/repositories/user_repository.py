@@ -1,3 +1,5 @@
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from app.data.models.user import User
 
@@ -16,4 +18,23 @@ class UserRepository:
             self.db.commit()
 
     def get_by_id(self, user_id: str):
-        return self.db.query(User).filter(User.id == user_id).first()
\ No newline at end of file
+        return self.db.query(User).filter(User.id == user_id).first()
+
+
+class AsyncUserRepository:
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def get_by_email(self, email: str) -> User:
+        result = await self.db.scalars(select(User).where(User.email == email))
+        return result.first()
+
+    async def update_last_login(self, user_id: str, timestamp):
+        user = await self.get_by_id(user_id)
+        if user:
+            setattr(user, "last_login", timestamp)
+            await self.db.commit()
+
+    async def get_by_id(self, user_id: str):
+        result = await self.db.scalars(select(User).where(User.id == int(user_id)))
+        return result.first()
@@ -0,0 +1,238 @@
+import asyncio
+import logging
+from datetime import datetime, timedelta
+from typing import List, Optional, TypeVar
+
+import asyncpg
+from sqlalchemy import delete, select, update
+from sqlalchemy.engine import make_url
+
+from app.core.config import settings
+from app.data.events import (
+    BLOG_WRITE_CHANNEL,
+    PROCESS_ID,
+    RELATED_WRITE_CHANNEL,
+    USER_WRITE_CHANNEL,
+    BlogWriteEvent,
+    UserWriteEvent,
+    decode_blog_write,
+    decode_user_write,
+    dispatch_blog_write,
+    dispatch_related_write,
+    dispatch_user_write,
+)
+from app.data.models.blog_write import BlogWrite
+from app.data.repositories.session import AsyncSessionLocal
+
+logger = logging.getLogger(__name__)
+
+# Session-level advisory lock held by the subscriber that processes the log
+LOG_LOCK_KEY = 0x626C6F67  # "blog"
+LOG_BATCH_SIZE = 500
+
+Write = TypeVar("Write", BlogWriteEvent, UserWriteEvent)
+
+
+class BlogWriteSubscriber:
+    """
+    Delivers blog and user writes committed by other processes to this one.
+
+    Every committed blog write is logged in blog_write and announced with
+    NOTIFY (see app.data.events). The subscriber LISTENs on a connection of
+    its own and passes announced writes to this process's on_blog_write
+    listeners, on a worker thread. Recomputed related posts, announced on a
+    channel of their own, go to the on_related_write listeners the same
+    way, and user writes to the on_user_write listeners. Announcements are
+    lost while the connection is down, so after reconnecting it delivers a
+    bulk blog write and a bulk user write, which treat everything as stale.
+
+    One subscriber across all processes also holds the log lock, a Postgres
+    advisory lock on its connection. It applies logged writes to the
+    on_blog_write_once listeners, oldest first, and marks them processed.
+    Writes committed while no worker was running are therefore caught up
+    when one starts. If the holder dies, its connection and the lock go
+    with it, and another subscriber takes over within ``poll_interval``
+    seconds. ``log_term`` counts the times this process acquired the lock:
+    once listeners holding state built from earlier writes must rebuild it
+    when the term changes, since other processes applied writes meanwhile.
+    """
+
+    def __init__(self, dsn: str, poll_interval: float = 5.0, retention: timedelta = timedelta(hours=24)):
+        self.dsn = dsn
+        self.poll_interval = poll_interval
+        self.retention = retention
+        self.processing_log = False
+        self.log_term = 0
+        self._incoming: List[BlogWriteEvent] = []
+        self._incoming_related: List[BlogWriteEvent] = []
+        self._incoming_users: List[UserWriteEvent] = []
+        self._incoming_event: Optional[asyncio.Event] = None
+        self._log_event: Optional[asyncio.Event] = None
+        self._tasks: List[asyncio.Task] = []
+
+    @property
+    def running(self) -> bool:
+        return any(not task.done() for task in self._tasks)
+
+    async def start(self) -> None:
+        """Start listening; connection failures are retried in the background."""
+        if self.running:
+            return
+        self._incoming_event = asyncio.Event()
+        self._log_event = asyncio.Event()
+        self._tasks = [
+            asyncio.create_task(self._listen(), name="blog-write-listen"),
+            asyncio.create_task(self._deliver(), name="blog-write-deliver"),
+            asyncio.create_task(self._process_log(), name="blog-write-log"),
+        ]
+
+    async def stop(self) -> None:
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        self.processing_log = False
+
+    def _on_notify(self, connection, pid, channel, payload) -> None:
+        if channel == USER_WRITE_CHANNEL:
+            decode, incoming, bulk = decode_user_write, self._incoming_users, UserWriteEvent(bulk=True)
+        elif channel == RELATED_WRITE_CHANNEL:
+            decode, incoming, bulk = decode_blog_write, self._incoming_related, BlogWriteEvent(bulk=True)
+        else:
+            decode, incoming, bulk = decode_blog_write, self._incoming, BlogWriteEvent(bulk=True)
+        try:
+            origin, write = decode(payload)
+        except (ValueError, KeyError, TypeError):
+            logger.warning("Malformed %s announcement %r, treating it as bulk", channel, payload)
+            origin, write = None, bulk
+        # Writes made by this process were dispatched when they committed
+        if origin != PROCESS_ID:
+            incoming.append(write)
+            self._incoming_event.set()
+        if channel == BLOG_WRITE_CHANNEL:
+            self._log_event.set()
+
+    async def _listen(self) -> None:
+        """Hold the LISTEN connection, reconnecting with backoff, and contend for the log lock."""
+        delay = 1.0
+        connected_before = False
+        while True:
+            connection = None
+            try:
+                connection = await asyncpg.connect(self.dsn)
+                await connection.add_listener(BLOG_WRITE_CHANNEL, self._on_notify)
+                await connection.add_listener(RELATED_WRITE_CHANNEL, self._on_notify)
+                await connection.add_listener(USER_WRITE_CHANNEL, self._on_notify)
+                if connected_before:
+                    self._incoming.append(BlogWriteEvent(bulk=True))
+                    self._incoming_users.append(UserWriteEvent(bulk=True))
+                    self._incoming_event.set()
+                connected_before = True
+                delay = 1.0
+                while True:
+                    if not self.processing_log:
+                        self.processing_log = await connection.fetchval(
+                            "SELECT pg_try_advisory_lock($1)", LOG_LOCK_KEY
+                        )
+                        if self.processing_log:
+                            self.log_term += 1
+                            logger.info("Processing the blog write log in this process")
+                            self._log_event.set()
+                    else:
+                        # Notices a dead connection, which would also have lost the lock
+                        await connection.execute("SELECT 1")
+                    await asyncio.sleep(self.poll_interval)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.warning("Blog write subscriber disconnected, retrying in %.0f s", delay, exc_info=True)
+            finally:
+                self.processing_log = False
+                if connection is not None:
+                    connection.terminate()
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, 60.0)
+
+    async def _deliver(self) -> None:
+        """Pass announced writes to this process's listeners, merged into one per wake-up."""
+        while True:
+            await self._incoming_event.wait()
+            self._incoming_event.clear()
+            announcements, self._incoming = self._incoming, []
+            related, self._incoming_related = self._incoming_related, []
+            users, self._incoming_users = self._incoming_users, []
+            # Listeners may block on Redis, the database or an index
+            if announcements:
+                await asyncio.to_thread(dispatch_blog_write, _merge(announcements, BlogWriteEvent()))
+            if related:
+                await asyncio.to_thread(dispatch_related_write, _merge(related, BlogWriteEvent()))
+            if users:
+                await asyncio.to_thread(dispatch_user_write, _merge(users, UserWriteEvent()))
+
+    async def _process_log(self) -> None:
+        """While holding the log lock, apply pending logged writes to the once listeners."""
+        while True:
+            try:
+                await asyncio.wait_for(self._log_event.wait(), self.poll_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._log_event.clear()
+            try:
+                while self.processing_log and await self._process_batch():
+                    pass
+            except Exception:
+                logger.exception("Processing the blog write log failed")
+
+    async def _process_batch(self) -> bool:
+        """Apply the oldest pending writes; returns whether more may be pending."""
+        async with AsyncSessionLocal() as db:
+            rows = (
+                await db.execute(
+                    select(BlogWrite.id, BlogWrite.blog_ids, BlogWrite.slugs, BlogWrite.tag_ids, BlogWrite.bulk)
+                    .where(BlogWrite.processed_dt.is_(None))
+                    .order_by(BlogWrite.id)
+                    .limit(LOG_BATCH_SIZE)
+                )
+            ).all()
+        if not rows:
+            return False
+
+        write = BlogWriteEvent()
+        for row in rows:
+            write.update(
+                BlogWriteEvent(set(row.blog_ids), set(row.slugs), set(row.tag_ids), row.bulk)
+            )
+        await asyncio.to_thread(dispatch_blog_write, write, True)
+
+        now = datetime.utcnow()
+        async with AsyncSessionLocal() as db:
+            await db.execute(
+                update(BlogWrite).where(BlogWrite.id.in_([row.id for row in rows])).values(processed_dt=now)
+            )
+            # The newest row is kept: its id is the blog write generation
+            await db.execute(
+                delete(BlogWrite).where(
+                    BlogWrite.processed_dt < now - self.retention, BlogWrite.id < rows[-1].id
+                )
+            )
+            await db.commit()
+        return len(rows) == LOG_BATCH_SIZE
+
+
+def _merge(writes: List[Write], merged: Write) -> Write:
+    for write in writes:
+        merged.update(write)
+    return merged
+
+
+def _listen_dsn() -> str:
+    # asyncpg takes a plain postgresql:// URL, without the SQLAlchemy driver name
+    url = make_url(str(settings.SQLALCHEMY_DATABASE_URI)).set(drivername="postgresql")
+    return url.render_as_string(hide_password=False)
+
+
+blog_write_subscriber = BlogWriteSubscriber(
+    _listen_dsn(),
+    poll_interval=settings.BLOG_WRITE_POLL_SECONDS,
+    retention=timedelta(hours=settings.BLOG_WRITE_LOG_RETENTION_HOURS),
+)
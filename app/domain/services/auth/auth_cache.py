@@ -0,0 +1,74 @@
+import time
+from dataclasses import dataclass
+from typing import Optional
+from uuid import UUID
+
+from app.api.schemas.auth import TokenPayload
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.data.events import UserWriteEvent, on_user_write
+from app.data.models.user import User
+
+
+@dataclass(frozen=True)
+class AuthenticatedUser:
+    """The parts of a user that authentication and authorization need."""
+
+    id: int
+    uuid: UUID
+    email: str
+    is_active: bool
+
+    @classmethod
+    def from_user(cls, user: User) -> "AuthenticatedUser":
+        return cls(id=user.id, uuid=user.uuid, email=user.email, is_active=bool(user.is_active))
+
+
+class AuthCache:
+    """
+    Verified token claims and user snapshots for get_current_user.
+
+    Claims are keyed by the exact token string, so only tokens whose signature
+    was checked before are trusted, and live no longer than the token itself.
+    User snapshots are keyed by user id (the token's ``sub``) and dropped as
+    soon as a commit in any process changes the user's ``is_active`` or
+    password; other processes' commits arrive through the write subscriber.
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 60.0):
+        self.ttl = ttl
+        self._claims = TTLCache(maxsize=maxsize, ttl=ttl)
+        self._users = TTLCache(maxsize=maxsize, ttl=ttl)
+
+    def get_claims(self, token: str) -> Optional[TokenPayload]:
+        return self._claims.get(token)
+
+    def set_claims(self, token: str, claims: TokenPayload) -> None:
+        ttl = min(self.ttl, claims.exp - time.time())
+        if ttl > 0:
+            self._claims.set(token, claims, ttl)
+
+    def get_user(self, user_id: int) -> Optional[AuthenticatedUser]:
+        return self._users.get(user_id)
+
+    def set_user(self, user: AuthenticatedUser) -> None:
+        self._users.set(user.id, user)
+
+    def invalidate_user(self, user_id: int) -> None:
+        """Forget a user, so the next request reloads them from the database."""
+        self._users.pop(user_id)
+
+    def invalidate_all_users(self) -> None:
+        self._users.clear()
+
+
+auth_cache = AuthCache(settings.AUTH_CACHE_SIZE, settings.AUTH_CACHE_TTL_SECONDS)
+
+
+@on_user_write
+def _invalidate_users(write: UserWriteEvent) -> None:
+    if write.bulk:
+        auth_cache.invalidate_all_users()
+        return
+    for user_id in write.user_ids:
+        auth_cache.invalidate_user(user_id)
@@ -1,31 +1,44 @@
+import logging
+import uuid
 from datetime import datetime
 from typing import Optional
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from jose import JWTError  # Add this import
-from app.data.repositories.user_repository import UserRepository
-from app.core.security import verify_password, create_access_token, create_refresh_token, decode_token
+from app.data.repositories.user_repository import AsyncUserRepository
+from app.core.security import password_hasher, create_access_token, create_refresh_token, decode_token
 from app.api.schemas.user import TokenResponse
 from app.api.schemas.auth import TokenPayload
 from app.core.config import settings  # Also make sure this is imported
+from app.domain.services.auth.token_revocation import family_key, token_key, token_revocations
+
+logger = logging.getLogger(__name__)
 
 class AuthService:
-    def __init__(self, db: Session, user_repository: Optional[UserRepository] = None):
+    def __init__(self, db: AsyncSession, user_repository: Optional[AsyncUserRepository] = None):
         self.db = db
-        self.user_repository = user_repository or UserRepository(db)
+        self.user_repository = user_repository or AsyncUserRepository(db)
+
+    async def authenticate_user(self, email: str, password: str):
+        """
+        Return the active user matching the credentials, or None.
 
-    def authenticate_user(self, email: str, password: str):
-        user = self.user_repository.get_by_email(email)
+        Raises:
+            PasswordHasherBusyError: If too many password checks are already pending
+        """
+        user = await self.user_repository.get_by_email(email)
 
-        if not user or not verify_password(password, user.password_hash):
+        if not user or not await password_hasher.verify(password, user.password_hash):
             return None
         if not bool(user.is_active):
             return None
         return user
 
-    def login(self, user_id: str):
-        self.user_repository.update_last_login(user_id, datetime.utcnow())
-        access_token = create_access_token({"sub": str(user_id)})
-        refresh_token = create_refresh_token({"sub": str(user_id)})
+    async def login(self, user_id: str):
+        await self.user_repository.update_last_login(user_id, datetime.utcnow())
+        # Every token descending from this login shares the family id
+        claims = {"sub": str(user_id), "fam": str(uuid.uuid4())}
+        access_token = create_access_token(claims)
+        refresh_token = create_refresh_token(claims)
 
         return {
             "access_token": access_token,
@@ -34,8 +47,14 @@ class AuthService:
             "refresh_token": refresh_token,
         }
 
-    def refresh_tokens(self, refresh_token: str) -> TokenResponse:
-        """Validate refresh token and create new access/refresh tokens"""
+    async def refresh_tokens(self, refresh_token: str) -> TokenResponse:
+        """
+        Validate refresh token and create new access/refresh tokens.
+
+        Each refresh token can be exchanged once; it is revoked as "rotated"
+        in the same step. A rotated token presented again has been copied, so
+        its whole family is revoked and the user has to sign in again.
+        """
         try:
             payload = decode_token(refresh_token)
 
@@ -50,13 +69,30 @@ class AuthService:
             if exp_time < current_time:
                 raise ValueError("Token expired")
 
-            user = self.user_repository.get_by_id(token_data.sub)
+            if not token_data.jti:
+                raise ValueError("Token has no id")
+            family = token_data.fam or token_data.jti
+            if await token_revocations.reason(family_key(family)) is not None:
+                raise ValueError("Token revoked")
+
+            # Claims the token atomically; of concurrent refreshes only one succeeds
+            expires_at = datetime.utcfromtimestamp(token_data.exp)
+            if not await token_revocations.revoke(token_key(token_data.jti), "rotated", expires_at):
+                if await token_revocations.reason(token_key(token_data.jti)) == "rotated":
+                    await token_revocations.revoke_family(family, "reuse")
+                    logger.warning(
+                        "Refresh token reuse for user %s, revoked token family %s", token_data.sub, family
+                    )
+                raise ValueError("Token revoked")
+
+            user = await self.user_repository.get_by_id(token_data.sub)
 
             if not user or not bool(user.is_active):
                 raise ValueError("User not found or inactive")
 
-            access_token = create_access_token({"sub": str(user.id)})
-            new_refresh_token = create_refresh_token({"sub": str(user.id)})
+            claims = {"sub": str(user.id), "fam": family}
+            access_token = create_access_token(claims)
+            new_refresh_token = create_refresh_token(claims)
 
             response = TokenResponse(
                 access_token=access_token,
@@ -67,4 +103,19 @@ class AuthService:
             return response
 
         except (JWTError, ValueError, KeyError) as e:
-            raise ValueError(f"Invalid refresh token: {str(e)}")
\ No newline at end of file
+            raise ValueError(f"Invalid refresh token: {str(e)}")
+
+    async def logout(self, refresh_token: str) -> None:
+        """
+        Revoke a refresh token and its family, which signs out every access
+        and refresh token issued since the login it descends from.
+        """
+        try:
+            token_data = TokenPayload(**decode_token(refresh_token))
+            if token_data.type != "refresh" or not token_data.jti:
+                raise ValueError("Invalid token type")
+        except (JWTError, ValueError, KeyError) as e:
+            raise ValueError(f"Invalid refresh token: {str(e)}")
+
+        # Refreshing checks the family first, so this covers the token itself
+        await token_revocations.revoke_family(token_data.fam or token_data.jti, "logout")
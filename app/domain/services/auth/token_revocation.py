@@ -0,0 +1,265 @@
+import asyncio
+import time
+from abc import ABC, abstractmethod
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import delete, select
+from sqlalchemy.dialects.postgresql import insert
+
+from app.core.bloom import BloomFilter
+from app.core.config import settings
+from app.core.metrics import meter
+from app.data.models.revoked_token import RevokedToken
+from app.data.repositories.session import AsyncSessionLocal
+
+# Revocations written by other processes may commit slightly out of
+# revoked_dt order; each sync looks back this far to catch them
+SYNC_OVERLAP = timedelta(seconds=30)
+
+
+def token_key(jti: str) -> str:
+    return f"jti:{jti}"
+
+
+def family_key(family: str) -> str:
+    return f"fam:{family}"
+
+
+def expiry_bucket(expires_at: datetime, bucket_seconds: int) -> int:
+    """Bucket of a naive UTC expiry time; every key in a bucket has expired once the next one starts."""
+    return int(expires_at.replace(tzinfo=timezone.utc).timestamp()) // bucket_seconds
+
+
+class RevocationStore(ABC):
+    """Durable record of revoked token keys, grouped into expiry buckets."""
+
+    @abstractmethod
+    async def revoke(self, key: str, reason: str, expires_at: datetime, bucket: int) -> bool:
+        """Record a revocation. Returns False if the key was already revoked, keeping the first record."""
+
+    @abstractmethod
+    async def get(self, key: str) -> Optional[str]:
+        """Reason a key was revoked, or None if it is not revoked (or has expired)."""
+
+    @abstractmethod
+    async def revoked_since(self, since: datetime) -> Tuple[List[str], datetime]:
+        """Keys revoked at or after ``since``, and the time to pass to the next call."""
+
+    @abstractmethod
+    async def live_keys(self, bucket: int) -> List[str]:
+        """Every key in ``bucket`` or later."""
+
+    @abstractmethod
+    async def purge(self, before_bucket: int) -> int:
+        """Drop every bucket before ``before_bucket``; returns the number of keys dropped."""
+
+
+class InMemoryRevocationStore(RevocationStore):
+    """
+    Per-process store, for a single worker and for tests. Every revocation
+    passes through this process, so there is nothing to sync.
+    """
+
+    def __init__(self):
+        self._buckets: Dict[int, Dict[str, Tuple[str, datetime]]] = {}
+        self._bucket_of: Dict[str, int] = {}
+
+    async def revoke(self, key: str, reason: str, expires_at: datetime, bucket: int) -> bool:
+        if key in self._bucket_of:
+            return False
+        self._buckets.setdefault(bucket, {})[key] = (reason, expires_at)
+        self._bucket_of[key] = bucket
+        return True
+
+    async def get(self, key: str) -> Optional[str]:
+        bucket = self._bucket_of.get(key)
+        if bucket is None:
+            return None
+        reason, expires_at = self._buckets[bucket][key]
+        return reason if expires_at > datetime.utcnow() else None
+
+    async def revoked_since(self, since: datetime) -> Tuple[List[str], datetime]:
+        return [], since
+
+    async def live_keys(self, bucket: int) -> List[str]:
+        return [key for key, key_bucket in self._bucket_of.items() if key_bucket >= bucket]
+
+    async def purge(self, before_bucket: int) -> int:
+        dropped = 0
+        for bucket in [bucket for bucket in self._buckets if bucket < before_bucket]:
+            for key in self._buckets.pop(bucket):
+                del self._bucket_of[key]
+                dropped += 1
+        return dropped
+
+
+class PostgresRevocationStore(RevocationStore):
+    """
+    Store shared by every worker through the revoked_token table. Claiming a
+    key is a single INSERT ... ON CONFLICT DO NOTHING, so of two concurrent
+    refreshes with the same token exactly one succeeds.
+    """
+
+    async def revoke(self, key: str, reason: str, expires_at: datetime, bucket: int) -> bool:
+        async with AsyncSessionLocal() as db:
+            result = await db.execute(
+                insert(RevokedToken)
+                .values(
+                    key=key,
+                    reason=reason,
+                    expires_at=expires_at,
+                    expiry_bucket=bucket,
+                    revoked_dt=datetime.utcnow(),
+                )
+                .on_conflict_do_nothing(index_elements=[RevokedToken.key])
+                .returning(RevokedToken.key)
+            )
+            inserted = result.first() is not None
+            await db.commit()
+        return inserted
+
+    async def get(self, key: str) -> Optional[str]:
+        async with AsyncSessionLocal() as db:
+            return (
+                await db.execute(
+                    select(RevokedToken.reason).where(
+                        RevokedToken.key == key, RevokedToken.expires_at > datetime.utcnow()
+                    )
+                )
+            ).scalar_one_or_none()
+
+    async def revoked_since(self, since: datetime) -> Tuple[List[str], datetime]:
+        async with AsyncSessionLocal() as db:
+            rows = (
+                await db.execute(
+                    select(RevokedToken.key, RevokedToken.revoked_dt).where(
+                        RevokedToken.revoked_dt >= since - SYNC_OVERLAP
+                    )
+                )
+            ).all()
+        latest = max((row.revoked_dt for row in rows), default=since)
+        return [row.key for row in rows], max(latest, since)
+
+    async def live_keys(self, bucket: int) -> List[str]:
+        async with AsyncSessionLocal() as db:
+            return (
+                await db.scalars(select(RevokedToken.key).where(RevokedToken.expiry_bucket >= bucket))
+            ).all()
+
+    async def purge(self, before_bucket: int) -> int:
+        # Served by ix_revoked_token_expiry_bucket; one statement per purge
+        async with AsyncSessionLocal() as db:
+            result = await db.execute(delete(RevokedToken).where(RevokedToken.expiry_bucket < before_bucket))
+            await db.commit()
+        return result.rowcount
+
+
+class TokenRevocationList:
+    """
+    Revoked refresh tokens and token families, with a Bloom filter in front.
+
+    ``is_revoked`` answers most lookups from the filter: a key the filter has
+    never seen is certainly not revoked, and only filter hits (revoked keys
+    and rare false positives) reach the store. The filter picks up other
+    processes' revocations every ``sync_interval`` seconds, and is rebuilt
+    from the live keys whenever an expiry bucket passes, which also purges
+    the expired buckets from the store.
+
+    ``reason`` always asks the store, for decisions that must not be stale.
+    """
+
+    def __init__(
+        self,
+        store: RevocationStore,
+        bucket_seconds: int = 3600,
+        sync_interval: float = 5.0,
+        bloom_capacity: int = 100000,
+        bloom_error_rate: float = 0.001,
+    ):
+        self.store = store
+        self.bucket_seconds = bucket_seconds
+        self.sync_interval = sync_interval
+        self.bloom_capacity = bloom_capacity
+        self.bloom_error_rate = bloom_error_rate
+        self._filter = BloomFilter(bloom_capacity, bloom_error_rate)
+        self._filter_bucket: Optional[int] = None
+        self._watermark = datetime.utcnow()
+        self._synced_at = 0.0
+        self._sync_lock = asyncio.Lock()
+
+        self._lookups = meter.create_counter(
+            "auth.token_revocation.lookups",
+            description="Revocation checks, by whether the Bloom filter or the store answered",
+        )
+
+    def bucket(self, expires_at: datetime) -> int:
+        return expiry_bucket(expires_at, self.bucket_seconds)
+
+    async def revoke(self, key: str, reason: str, expires_at: datetime) -> bool:
+        """Revoke a key until ``expires_at``; False if it was already revoked."""
+        revoked = await self.store.revoke(key, reason, expires_at, self.bucket(expires_at))
+        self._filter.add(key)
+        return revoked
+
+    async def revoke_family(self, family: str, reason: str) -> None:
+        """Revoke every access and refresh token issued to a login."""
+        # No token of the family outlives one issued now
+        lifetime = max(
+            timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS),
+            timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES),
+        )
+        await self.revoke(family_key(family), reason, datetime.utcnow() + lifetime)
+
+    async def reason(self, key: str) -> Optional[str]:
+        """Why a key was revoked, read from the store; None if it is not revoked."""
+        return await self.store.get(key)
+
+    async def is_revoked(self, key: str) -> bool:
+        await self._sync()
+        if key not in self._filter:
+            self._lookups.add(1, {"source": "filter"})
+            return False
+        self._lookups.add(1, {"source": "store"})
+        return await self.store.get(key) is not None
+
+    async def _sync(self) -> None:
+        if time.monotonic() - self._synced_at < self.sync_interval:
+            return
+        async with self._sync_lock:
+            if time.monotonic() - self._synced_at < self.sync_interval:
+                return
+            current = self.bucket(datetime.utcnow())
+            if self._filter_bucket != current or self._filter.count > self._filter.capacity:
+                await self._rebuild(current)
+            else:
+                keys, self._watermark = await self.store.revoked_since(self._watermark)
+                self._filter.update(keys)
+            self._synced_at = time.monotonic()
+
+    async def _rebuild(self, current: int) -> None:
+        """Drop expired buckets and start a fresh filter holding only live keys."""
+        watermark = datetime.utcnow()
+        await self.store.purge(current)
+        keys = await self.store.live_keys(current)
+        rebuilt = BloomFilter(max(self.bloom_capacity, 2 * len(keys)), self.bloom_error_rate)
+        rebuilt.update(keys)
+        self._filter, self._filter_bucket, self._watermark = rebuilt, current, watermark
+
+
+def create_revocation_store() -> RevocationStore:
+    """Build the store selected by TOKEN_REVOCATION_BACKEND (postgres or memory)."""
+    if settings.TOKEN_REVOCATION_BACKEND == "postgres":
+        return PostgresRevocationStore()
+    if settings.TOKEN_REVOCATION_BACKEND == "memory":
+        return InMemoryRevocationStore()
+    raise ValueError(f"Unknown TOKEN_REVOCATION_BACKEND: {settings.TOKEN_REVOCATION_BACKEND}")
+
+
+token_revocations = TokenRevocationList(
+    create_revocation_store(),
+    bucket_seconds=settings.TOKEN_REVOCATION_BUCKET_SECONDS,
+    sync_interval=settings.TOKEN_REVOCATION_SYNC_SECONDS,
+    bloom_capacity=settings.TOKEN_REVOCATION_BLOOM_CAPACITY,
+    bloom_error_rate=settings.TOKEN_REVOCATION_BLOOM_ERROR_RATE,
+)
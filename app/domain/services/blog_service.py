@@ -1,88 +1,282 @@
-from typing import List, Optional, Dict, Any
+import asyncio
+import logging
+from typing import AsyncIterator, List, Optional, Dict, Any, Sequence
 from uuid import UUID
-from sqlalchemy.orm import Session
+from sqlalchemy import Row
+from sqlalchemy.ext.asyncio import AsyncSession
 from math import ceil
 
-from app.data.repositories.blog_repository import BlogRepository
+from app.core.config import settings
+from app.data.repositories.blog_repository import AsyncBlogRepository
 from app.data.models.blog import Blog
+from app.domain.services.pagination import (
+    Cursor,
+    InvalidCursorError,
+    decode_cursor,
+    encode_cursor,
+    filter_hash,
+)
+from app.domain.services.search import SearchBackendError, SearchService, get_search_service
+from app.domain.services.tag_catalog import tag_catalog
+
+logger = logging.getLogger(__name__)
+
+# Stands in for tag names the catalog cannot resolve. No tag has this id, so
+# the filter treats an unknown name like a tag no post carries
+UNKNOWN_TAG_ID = UUID(int=0)
 
 
 class BlogService:
     """Service for blog-related business logic."""
 
-    def __init__(self, blog_repository: BlogRepository = None):
-        self.blog_repository = blog_repository or BlogRepository()
+    def __init__(
+        self,
+        blog_repository: AsyncBlogRepository = None,
+        search_service: Optional[SearchService] = None
+    ):
+        self.blog_repository = blog_repository or AsyncBlogRepository()
+        self.search_service = search_service or get_search_service()
 
-    def get_published_blogs(
+    async def get_published_blogs(
         self,
-        db: Session,
+        db: AsyncSession,
         page: int = 1,
         page_size: int = 10,
         tag_uuids: Optional[List[str]] = None,
         search_term: Optional[str] = None,
         sort_by: str = "publication_dt",
-        sort_dir: str = "desc"
+        sort_dir: str = "desc",
+        cursor: Optional[str] = None,
+        include_total: bool = True,
+        tag_match: str = "any"
     ) -> Dict[str, Any]:
         """
         Get published blogs with pagination, filtering, and sorting.
 
         Args:
             db: Database session
-            page: Page number (1-based)
+            page: Page number (1-based), ignored when a cursor is given
             page_size: Items per page (max 50)
-            tag_uuids: List of tag UUID strings for filtering
-            search_term: Search term for title/content/excerpt
-            sort_by: Field to sort by
+            tag_uuids: Tag UUIDs or tag names for filtering
+            search_term: Search term for title/content/excerpt, in web search
+                syntax ("quoted phrases", -excluded, or)
+            sort_by: Field to sort by; "relevance" requires a search term
             sort_dir: Sort direction (asc/desc)
+            cursor: Opaque keyset cursor from a previous next_cursor/prev_cursor
+            include_total: Whether to count matching blogs; when False the
+                total and total_pages are None
+            tag_match: "any" to keep blogs with at least one of the tags,
+                "all" for blogs with every tag
+
+        When a search backend is configured, searches without a cursor are
+        answered by it and paged by offset; Postgres full-text search serves
+        them otherwise, or if the backend fails.
 
         Returns:
-            Dict with items, pagination info
+            Dict with items, pagination info and keyset cursors
+
+        Raises:
+            InvalidCursorError: If the cursor is malformed or was issued for a
+                different sort order or different filters
         """
 
+        params = self.normalize_listing_params(
+            page, page_size, tag_uuids, search_term, sort_by, sort_dir, cursor, include_total, tag_match
+        )
+        page, page_size, tag_match = params["page"], params["page_size"], params["tag_match"]
+        search_term, sort_by, sort_dir = params["search_term"], params["sort_by"], params["sort_dir"]
+        tag_uuid_objects = [UUID(tag_uuid) for tag_uuid in params["tag_uuids"]] if params["tag_uuids"] else None
+
+        filters = filter_hash(search_term=search_term, tags=params["tag_uuids"], tag_match=tag_match)
+        position = decode_cursor(cursor) if cursor else None
+        if position and (position.sort_by != sort_by or position.sort_dir != sort_dir):
+            raise InvalidCursorError("Cursor does not match the requested sort order")
+        if position and position.filters != filters:
+            raise InvalidCursorError("Cursor does not match the requested filters")
+
+        if search_term and self.search_service is not None and position is None:
+            try:
+                return await self._search_published_blogs(
+                    db, page, page_size, tag_uuid_objects, search_term, sort_by, sort_dir, include_total, tag_match
+                )
+            except SearchBackendError:
+                logger.exception("Search backend failed, falling back to Postgres full-text search")
+
+        blogs, total_count, has_more = await self.blog_repository.get_published_blogs(
+            db=db,
+            page=page,
+            page_size=page_size,
+            tag_uuids=tag_uuid_objects,
+            search_term=search_term,
+            sort_by=sort_by,
+            sort_dir=sort_dir,
+            after=position.key if position and not position.before else None,
+            before=position.key if position and position.before else None,
+            include_total=include_total,
+            tag_match=tag_match
+        )
+
+        if position is None:
+            has_next, has_previous = has_more, page > 1
+        elif position.before:
+            has_next, has_previous = True, has_more
+        else:
+            has_next, has_previous = has_more, True
+
+        return {
+            "items": blogs,
+            "total": total_count,
+            "page": page,
+            "page_size": page_size,
+            "total_pages": self._total_pages(total_count, page_size),
+            "next_cursor": self._cursor_for(blogs[-1], sort_by, sort_dir, filters) if has_next and blogs else None,
+            "prev_cursor": (
+                self._cursor_for(blogs[0], sort_by, sort_dir, filters, before=True) if has_previous and blogs else None
+            )
+        }
+
+    @staticmethod
+    def normalize_listing_params(
+        page: int = 1,
+        page_size: int = 10,
+        tag_uuids: Optional[List[str]] = None,
+        search_term: Optional[str] = None,
+        sort_by: str = "publication_dt",
+        sort_dir: str = "desc",
+        cursor: Optional[str] = None,
+        include_total: bool = True,
+        tag_match: str = "any"
+    ) -> Dict[str, Any]:
+        """
+        Normalize listing arguments the way get_published_blogs interprets them.
+
+        Tag names are resolved to UUIDs through the tag catalog. Names it
+        cannot resolve become UNKNOWN_TAG_ID, which matches no post: they are
+        ignored with tag_match="any" (an empty page if no tag resolves) and
+        make the page empty with tag_match="all".
+
+        Requests that normalize to the same values return the same listing, so
+        the result doubles as a response cache key.
+
+        Returns:
+            Dict of keyword arguments accepted by get_published_blogs
+        """
         page = max(1, page)
         page_size = min(max(1, page_size), 50)
 
-        tag_uuid_objects = None
+        tags = None
         if tag_uuids:
-            try:
-                tag_uuid_objects = [UUID(tag_uuid) for tag_uuid in tag_uuids if tag_uuid.strip()]
-            except ValueError:
-                tag_uuid_objects = None
+            resolved = [tag_catalog.resolve(tag) or UNKNOWN_TAG_ID for tag in tag_uuids if tag.strip()]
+            if resolved:
+                tags = sorted({str(tag_id) for tag_id in resolved})
 
+        search_term = search_term.strip() if search_term else None
+        if search_term and len(search_term) < 2:
+            search_term = None
+
+        # Relevance only means something when ranking search matches
         valid_sort_fields = ["publication_dt", "title", "updated_dt", "reading_time"]
+        if search_term:
+            valid_sort_fields.append("relevance")
         if sort_by not in valid_sort_fields:
             sort_by = "publication_dt"
 
-        if sort_dir.lower() not in ["asc", "desc"]:
+        sort_dir = sort_dir.lower()
+        if sort_dir not in ["asc", "desc"]:
             sort_dir = "desc"
 
-        search_term = search_term.strip() if search_term else None
-        if search_term and len(search_term) < 2:
-            search_term = None
+        tag_match = tag_match.lower()
+        if tag_match not in ["any", "all"] or not tags:
+            tag_match = "any"
 
-        blogs, total_count = self.blog_repository.get_published_blogs(
-            db=db,
-            page=page,
-            page_size=page_size,
-            tag_uuids=tag_uuid_objects,
-            search_term=search_term,
+        return {
+            "page": page,
+            "page_size": page_size,
+            "tag_uuids": tags,
+            "search_term": search_term,
+            "sort_by": sort_by,
+            "sort_dir": sort_dir,
+            "cursor": cursor or None,
+            "include_total": include_total,
+            "tag_match": tag_match
+        }
+
+    async def _search_published_blogs(
+        self,
+        db: AsyncSession,
+        page: int,
+        page_size: int,
+        tag_uuids: Optional[List[UUID]],
+        search_term: str,
+        sort_by: str,
+        sort_dir: str,
+        include_total: bool,
+        tag_match: str
+    ) -> Dict[str, Any]:
+        """Answer a search from the search backend, loading the hits from the database."""
+        # The backend client blocks, so keep it off the event loop
+        result = await asyncio.to_thread(
+            self.search_service.search_published,
+            term=search_term,
+            tag_ids=tag_uuids,
             sort_by=sort_by,
-            sort_dir=sort_dir
+            sort_dir=sort_dir,
+            offset=(page - 1) * page_size,
+            limit=page_size,
+            include_total=include_total,
+            tag_match=tag_match
         )
-
-        total_pages = ceil(total_count / page_size) if total_count > 0 else 1
+        blogs = await self.blog_repository.get_published_by_ids(db, result.ids)
 
         return {
             "items": blogs,
-            "total": total_count,
+            "total": result.total,
             "page": page,
             "page_size": page_size,
-            "total_pages": total_pages
+            "total_pages": self._total_pages(result.total, page_size),
+            "next_cursor": None,
+            "prev_cursor": None
         }
 
-    def get_blog_by_slug(self, db: Session, slug: str) -> Optional[Blog]:
+    @staticmethod
+    def _total_pages(total_count: Optional[int], page_size: int) -> Optional[int]:
+        if total_count is None:
+            return None
+        return ceil(total_count / page_size) if total_count > 0 else 1
+
+    @staticmethod
+    def _cursor_for(blog: Blog, sort_by: str, sort_dir: str, filters: str, before: bool = False) -> str:
+        """Build the cursor that pages on from (or back from) a blog."""
+        return encode_cursor(
+            Cursor(
+                sort_by=sort_by,
+                sort_dir=sort_dir,
+                value=getattr(blog, sort_by),
+                id=blog.id,
+                before=before,
+                filters=filters,
+            )
+        )
+
+    async def get_blog_by_slug(self, db: AsyncSession, slug: str) -> Optional[Blog]:
         """Get a published blog by slug."""
         if not slug or not slug.strip():
             return None
 
-        return self.blog_repository.get_published_by_slug(db, slug.strip())
\ No newline at end of file
+        return await self.blog_repository.get_published_by_slug(db, slug.strip())
+
+    async def get_related_blogs(self, db: AsyncSession, blog_id: UUID) -> List[Blog]:
+        """Get the published blogs precomputed as related to a blog."""
+        return await self.blog_repository.get_related(db, blog_id, settings.RELATED_POSTS_COUNT)
+
+    async def get_feed_validators(self, db: AsyncSession) -> Row:
+        """
+        What feeds derive their validators from: ``updated_dt``, when any
+        published blog last changed, and ``write_id`` and ``written_dt`` of
+        the newest blog write, which also covers deleted and unpublished posts.
+        """
+        return await self.blog_repository.get_feed_validators(db)
+
+    def iter_feed_entries(self, db: AsyncSession, limit: Optional[int] = None) -> AsyncIterator[Sequence[Row]]:
+        """Published blogs for feeds and the sitemap, newest first, in batches."""
+        return self.blog_repository.iter_feed_entries(db, limit, settings.FEED_BATCH_SIZE)
\ No newline at end of file
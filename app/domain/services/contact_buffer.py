@@ -0,0 +1,238 @@
+import asyncio
+import logging
+import time
+from typing import Dict, List, Optional
+
+from opentelemetry.metrics import Observation
+from sqlalchemy.exc import DBAPIError, InterfaceError, OperationalError
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+
+from app.core.config import settings
+from app.core.metrics import meter
+from app.data.repositories.contact_repository import AsyncContactRepository
+from app.data.repositories.session import AsyncSessionLocal
+
+logger = logging.getLogger(__name__)
+
+
+class ContactBufferFullError(Exception):
+    """Raised when a submission cannot be queued because the buffer is full or closed."""
+
+
+def is_connection_error(error: Exception) -> bool:
+    """Whether a write failed for lack of a working connection, rather than because of its rows."""
+    if isinstance(error, DBAPIError):
+        return error.connection_invalidated or isinstance(error, (OperationalError, InterfaceError))
+    return isinstance(error, (OSError, asyncio.TimeoutError, PoolTimeoutError))
+
+
+class ContactWriteBuffer:
+    """
+    Write-behind buffer for contact form submissions.
+
+    Requests enqueue a row and return; a background task writes queued rows
+    with one multi-row INSERT and commit per batch, once ``batch_size`` rows
+    are waiting or ``flush_interval`` seconds after the first one arrived.
+
+    The queue holds at most ``max_size`` rows. When it is full, a submission
+    waits up to ``enqueue_timeout`` seconds for room and then fails with
+    ContactBufferFullError, so a slow or unavailable database turns into
+    503s rather than unbounded memory. Connection failures are retried with
+    backoff, up to ``max_attempts`` per batch. A batch the database rejects
+    is written again one row per transaction, and only the rows that fail
+    on their own are dropped. stop() drains the queue before the process
+    exits.
+    """
+
+    def __init__(
+        self,
+        max_size: int,
+        batch_size: int,
+        flush_interval: float,
+        enqueue_timeout: float,
+        drain_timeout: float,
+        max_attempts: int = 8,
+        contact_repository: Optional[AsyncContactRepository] = None,
+    ):
+        self.max_size = max_size
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.enqueue_timeout = enqueue_timeout
+        self.drain_timeout = drain_timeout
+        self.max_attempts = max_attempts
+        self.contact_repository = contact_repository or AsyncContactRepository()
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+        self._closing = False
+
+        self._flushed = meter.create_counter(
+            "contact.buffer.flushed",
+            description="Contact submissions written to the database",
+        )
+        self._rejected = meter.create_counter(
+            "contact.buffer.rejected",
+            description="Contact submissions refused because the buffer was full",
+        )
+        self._dropped = meter.create_counter(
+            "contact.buffer.dropped",
+            description="Queued contact submissions that could not be written",
+        )
+        self._flush_duration = meter.create_histogram(
+            "contact.buffer.flush.duration",
+            unit="ms",
+            description="Time spent writing one batch of contact submissions",
+        )
+        meter.create_observable_gauge(
+            "contact.buffer.depth",
+            callbacks=[lambda options: [Observation(self.depth)]],
+            description="Contact submissions waiting to be written",
+        )
+
+    @property
+    def depth(self) -> int:
+        return self._queue.qsize() if self._queue is not None else 0
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    async def start(self) -> None:
+        """Create the queue and the flushing task on the running event loop."""
+        if self.running:
+            return
+        self._queue = asyncio.Queue(maxsize=self.max_size)
+        self._closing = False
+        self._task = asyncio.create_task(self._run(), name="contact-buffer")
+
+    async def submit(self, row: Dict) -> None:
+        """
+        Queue a contact row for writing.
+
+        Raises:
+            ContactBufferFullError: If the buffer stays full for enqueue_timeout,
+                or is not running
+        """
+        if self._closing or not self.running:
+            raise ContactBufferFullError("Contact buffer is not accepting submissions")
+        try:
+            self._queue.put_nowait(row)
+            return
+        except asyncio.QueueFull:
+            pass
+        try:
+            await asyncio.wait_for(self._queue.put(row), self.enqueue_timeout)
+        except asyncio.TimeoutError:
+            self._rejected.add(1)
+            raise ContactBufferFullError("Contact buffer is full")
+
+    async def stop(self) -> None:
+        """Stop accepting submissions and write every queued one, waiting up to drain_timeout."""
+        if self._task is None:
+            return
+        self._closing = True
+        try:
+            await asyncio.wait_for(self._queue.join(), self.drain_timeout)
+        except asyncio.TimeoutError:
+            logger.error(
+                "Contact buffer did not drain within %.0f s; %d submissions were not written",
+                self.drain_timeout, self._queue.qsize(),
+            )
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def _run(self) -> None:
+        while True:
+            batch = await self._next_batch()
+            await self._write(batch)
+            for _ in batch:
+                self._queue.task_done()
+
+    async def _next_batch(self) -> List[Dict]:
+        """Wait for a row, then gather more until the batch is full or flush_interval passes."""
+        batch = [await self._queue.get()]
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.flush_interval
+        while len(batch) < self.batch_size:
+            try:
+                batch.append(self._queue.get_nowait())
+                continue
+            except asyncio.QueueEmpty:
+                pass
+            remaining = deadline - loop.time()
+            # Once stopping, write what is queued without waiting for stragglers
+            if remaining <= 0 or self._closing:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self._queue.get(), remaining))
+            except asyncio.TimeoutError:
+                break
+        return batch
+
+    async def _write(self, batch: List[Dict]) -> None:
+        """
+        Insert a batch with one statement. If the database rejects it, one bad
+        row fails the whole statement, so the rows are written again one per
+        transaction and only those that fail on their own are dropped.
+        """
+        started = time.perf_counter()
+        written = 0
+        try:
+            if await self._insert(batch):
+                written = len(batch)
+            else:
+                for row in batch:
+                    if await self._insert([row]):
+                        written += 1
+                    else:
+                        self._dropped.add(1)
+                        logger.error("Dropping a contact submission the database rejected: %r", row)
+        except Exception:
+            self._dropped.add(len(batch) - written)
+            logger.exception(
+                "Giving up on %d contact submissions after %d attempts: %r",
+                len(batch) - written, self.max_attempts, batch,
+            )
+        if written:
+            self._flush_duration.record((time.perf_counter() - started) * 1000)
+            self._flushed.add(written)
+
+    async def _insert(self, rows: List[Dict]) -> bool:
+        """
+        Insert rows in one transaction; False if the database rejects them.
+
+        Connection failures are retried with backoff, and re-raised once
+        max_attempts have failed.
+        """
+        delay = 0.5
+        for attempt in range(1, self.max_attempts + 1):
+            try:
+                async with AsyncSessionLocal() as db:
+                    await self.contact_repository.insert_many(db, rows)
+                    await db.commit()
+                return True
+            except Exception as e:
+                if not is_connection_error(e):
+                    logger.warning("Database rejected %d contact submissions: %s", len(rows), e)
+                    return False
+                if attempt == self.max_attempts:
+                    raise
+                logger.warning(
+                    "Writing %d contact submissions failed, retrying in %.1f s", len(rows), delay, exc_info=True
+                )
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, 30.0)
+        return False
+
+
+contact_buffer = ContactWriteBuffer(
+    max_size=settings.CONTACT_BUFFER_SIZE,
+    batch_size=settings.CONTACT_BATCH_SIZE,
+    flush_interval=settings.CONTACT_FLUSH_INTERVAL_MS / 1000,
+    enqueue_timeout=settings.CONTACT_ENQUEUE_TIMEOUT_MS / 1000,
+    drain_timeout=settings.CONTACT_DRAIN_TIMEOUT_SECONDS,
+    max_attempts=settings.CONTACT_WRITE_MAX_ATTEMPTS,
+)
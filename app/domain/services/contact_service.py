@@ -0,0 +1,77 @@
+from typing import AsyncIterator, List, Optional, Sequence, Tuple
+from uuid import UUID
+
+from sqlalchemy import Row
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.data.models.contact import Contact
+from app.data.repositories.contact_repository import AsyncContactRepository
+from app.domain.services.pagination import (
+    Cursor,
+    InvalidCursorError,
+    decode_cursor,
+    encode_cursor,
+    filter_hash,
+)
+
+# The inbox is always read newest first
+SORT_BY = "submission_dt"
+SORT_DIR = "desc"
+
+
+class ContactService:
+    """Admin operations on contact form submissions."""
+
+    def __init__(self, contact_repository: Optional[AsyncContactRepository] = None):
+        self.contact_repository = contact_repository or AsyncContactRepository()
+
+    async def list_contacts(
+        self,
+        db: AsyncSession,
+        status: Optional[str] = None,
+        limit: int = 50,
+        cursor: Optional[str] = None,
+    ) -> Tuple[List[Contact], Optional[str]]:
+        """
+        Get a page of submissions, newest first.
+
+        Returns:
+            Tuple of (contacts, next_cursor), where next_cursor is None on the
+            last page
+
+        Raises:
+            InvalidCursorError: If the cursor is malformed, from another listing
+                or from another status filter
+        """
+        filters = filter_hash(status=status)
+        after = None
+        if cursor:
+            position = decode_cursor(cursor)
+            if position.sort_by != SORT_BY or position.sort_dir != SORT_DIR or position.before:
+                raise InvalidCursorError("Cursor does not belong to the contact listing")
+            if position.filters != filters:
+                raise InvalidCursorError("Cursor does not match the requested status")
+            after = position.key
+
+        # One extra row tells whether another page follows
+        contacts = await self.contact_repository.get_page(db, status, after, limit + 1)
+        next_cursor = None
+        if len(contacts) > limit:
+            contacts = contacts[:limit]
+            last = contacts[-1]
+            next_cursor = encode_cursor(
+                Cursor(sort_by=SORT_BY, sort_dir=SORT_DIR, value=last.submission_dt, id=last.id, filters=filters)
+            )
+        return contacts, next_cursor
+
+    async def update_status(self, db: AsyncSession, contact_ids: List[UUID], status: str) -> int:
+        """Set the status of several submissions at once; returns how many changed."""
+        updated = await self.contact_repository.update_status(db, list(dict.fromkeys(contact_ids)), status)
+        await db.commit()
+        return updated
+
+    def iter_export(
+        self, db: AsyncSession, status: Optional[str] = None, batch_size: int = 1000
+    ) -> AsyncIterator[Sequence[Row]]:
+        """Every submission (or those with ``status``), oldest first, in batches."""
+        return self.contact_repository.iter_export(db, status, batch_size)
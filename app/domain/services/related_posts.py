@@ -0,0 +1,385 @@
+import logging
+import re
+import threading
+from collections import Counter
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+from uuid import UUID
+
+import numpy as np
+from sqlalchemy import delete, select
+from sqlalchemy.dialects.postgresql import insert
+
+from app.core.config import settings
+from app.data.content import plain_text
+from app.data.events import BlogWriteEvent, notify_related_write, on_blog_write_once
+from app.data.models.blog import Blog, blog_tag, related_blog
+from app.data.repositories.session import get_engine
+from app.data.write_subscriber import blog_write_subscriber
+
+logger = logging.getLogger(__name__)
+
+RELATIONSHIP_TYPE = "similar"
+
+# Rows of the score matrix computed at once; bounds memory at BLOCK_SIZE x posts
+BLOCK_SIZE = 256
+WRITE_CHUNK_SIZE = 5000
+# Posts read per server-side cursor round trip while building the model
+LOAD_BATCH_SIZE = 500
+
+_TOKEN = re.compile(r"[a-z][a-z0-9']+")
+STOP_WORDS = frozenset(
+    "a about above after again against all am an and any are as at be because been before being "
+    "below between both but by can could did do does doing down during each few for from further "
+    "had has have having he her here hers herself him himself his how i if in into is it its itself "
+    "just me more most my myself no nor not now of off on once only or other our ours ourselves out "
+    "over own same she should so some such than that the their theirs them themselves then there "
+    "these they this those through to too under until up very was we were what when where which "
+    "while who whom why will with would you your yours yourself yourselves also like one use using "
+    "get got make way well".split()
+)
+
+
+def tokenize(title: str, content: str) -> Counter:
+    # The title counts twice: it names what the post is about
+    text = f"{title} {title} {plain_text(content)}".lower()
+    counts = Counter(_TOKEN.findall(text))
+    # Dropping stop words by key is far cheaper than filtering every token
+    for word in STOP_WORDS.intersection(counts):
+        del counts[word]
+    return counts
+
+
+@dataclass
+class RelatedPostsModel:
+    """
+    Term and tag vectors of every published post, row-aligned with ``blog_ids``.
+
+    ``terms`` holds L2-normalised TF-IDF rows over a vocabulary fixed when the
+    model was built; ``tags`` holds 0/1 rows over ``tag_index``. Rows of posts
+    that stopped being published are zeroed and marked inactive.
+    ``neighbours`` and ``kth_scores`` mirror what was last written for each
+    post: its related rows (-1 padded) and the score a post must beat to
+    enter its list.
+    """
+
+    blog_ids: List[UUID]
+    index: Dict[UUID, int]
+    vocabulary: Dict[str, int]
+    idf: np.ndarray
+    terms: np.ndarray
+    tag_index: Dict[UUID, int]
+    tags: np.ndarray
+    active: np.ndarray
+    neighbours: np.ndarray
+    kth_scores: np.ndarray
+
+
+class RelatedPostsService:
+    """
+    Precomputes each published post's most related posts into related_blog.
+
+    Relatedness blends the cosine similarity of TF-IDF content vectors with
+    the Jaccard overlap of tag sets, weighted by RELATED_POSTS_TAG_WEIGHT.
+    Scores are computed as block matrix products over the whole corpus, and
+    the top RELATED_POSTS_COUNT posts above RELATED_POSTS_MIN_SCORE are kept.
+
+    rebuild() recomputes everything. update() refreshes only the changed
+    posts and the posts whose lists they enter or leave, against the model
+    held from the last build; IDF weights drift until the next rebuild. A
+    changed tag counts as a change of the posts carrying it.
+
+    Writes reach the service through the blog write log, in the API worker
+    holding the log lock, so the model lives as long as that worker. It is
+    built on the first write after the worker acquires the lock.
+    """
+
+    def __init__(
+        self,
+        top_k: int = None,
+        tag_weight: float = None,
+        min_score: float = None,
+        max_terms: int = None,
+    ):
+        self.top_k = settings.RELATED_POSTS_COUNT if top_k is None else top_k
+        self.tag_weight = settings.RELATED_POSTS_TAG_WEIGHT if tag_weight is None else tag_weight
+        self.min_score = settings.RELATED_POSTS_MIN_SCORE if min_score is None else min_score
+        self.max_terms = settings.RELATED_POSTS_MAX_TERMS if max_terms is None else max_terms
+        self._model: Optional[RelatedPostsModel] = None
+        self._lock = threading.Lock()
+
+    def forget(self) -> None:
+        """Drop the held model, so the next update() rebuilds."""
+        with self._lock:
+            self._model = None
+
+    def rebuild(self) -> int:
+        """Recompute related posts for every published post; returns the rows written."""
+        with self._lock:
+            model = self._model = self._build_model()
+            rows = self._related_rows(model, np.flatnonzero(model.active))
+            with get_engine().begin() as connection:
+                connection.execute(
+                    delete(related_blog).where(related_blog.c.relationship_type == RELATIONSHIP_TYPE)
+                )
+                self._insert(connection, rows)
+
+        notify_related_write(bulk=True)
+        return len(rows)
+
+    def update(self, blog_ids: Iterable[UUID], tag_ids: Iterable[UUID] = ()) -> int:
+        """Refresh related posts after the given posts or tags changed; returns the posts recomputed."""
+        blog_ids, tag_ids = set(blog_ids), set(tag_ids)
+        if not (blog_ids or tag_ids):
+            return 0
+        if self._model is None:
+            self.rebuild()
+            return len(self._model.blog_ids)
+
+        with self._lock:
+            model = self._model
+            # Renaming a tag changes no vector; deleting one changes its posts'
+            blog_ids |= self._tagged(model, tag_ids)
+            if not blog_ids:
+                return 0
+            ids, counts, post_tags = self._load_posts(blog_ids)
+            changed = self._apply_changes(model, blog_ids, dict(zip(ids, counts)), post_tags)
+
+            # Posts that listed a changed post may need a replacement for it
+            listing = np.flatnonzero(np.isin(model.neighbours, changed).any(axis=1))
+            affected = set(changed[model.active[changed]].tolist()) | set(listing.tolist())
+
+            # Scores are symmetric: a changed post enters another post's list
+            # when it beats that post's current K-th score
+            published = changed[model.active[changed]]
+            if len(published):
+                scores = self._scores(model, published)
+                scores[:, ~model.active] = -np.inf
+                scores[np.arange(len(published)), published] = -np.inf
+                entering = np.flatnonzero((scores > model.kth_scores[np.newaxis, :]).any(axis=0))
+                affected.update(entering.tolist())
+            affected.difference_update(np.flatnonzero(~model.active).tolist())
+
+            sources = np.array(sorted(affected), dtype=np.int64)
+            rows = self._related_rows(model, sources)
+            cleared = blog_ids | {model.blog_ids[i] for i in sources}
+            with get_engine().begin() as connection:
+                connection.execute(
+                    delete(related_blog).where(
+                        related_blog.c.relationship_type == RELATIONSHIP_TYPE,
+                        related_blog.c.source_blog_id.in_(cleared),
+                    )
+                )
+                self._insert(connection, rows)
+                slugs = set(connection.scalars(select(Blog.slug).where(Blog.id.in_(cleared))))
+
+        notify_related_write(slugs=slugs)
+        return len(sources)
+
+    @staticmethod
+    def _tagged(model: RelatedPostsModel, tag_ids: Set[UUID]) -> Set[UUID]:
+        """Posts of the model carrying any of the given tags."""
+        columns = [model.tag_index[tag_id] for tag_id in tag_ids if tag_id in model.tag_index]
+        if not columns:
+            return set()
+        rows = np.flatnonzero(model.tags[:, columns].any(axis=1))
+        return {model.blog_ids[row] for row in rows}
+
+    def _load_posts(
+        self, blog_ids: Optional[Set[UUID]] = None
+    ) -> Tuple[List[UUID], List[Counter], Dict[UUID, List[UUID]]]:
+        """
+        Ids and term counts of published posts, and their tag ids, optionally
+        limited to ``blog_ids``.
+
+        Posts are read from a server-side cursor and tokenized as they
+        arrive, so their content is never held all at once.
+        """
+        posts_query = select(Blog.id, Blog.title, Blog.content).where(Blog.status == "published")
+        tags_query = select(blog_tag.c.blog_id, blog_tag.c.tag_id).join(
+            Blog, Blog.id == blog_tag.c.blog_id
+        ).where(Blog.status == "published")
+        if blog_ids is not None:
+            posts_query = posts_query.where(Blog.id.in_(blog_ids))
+            tags_query = tags_query.where(blog_tag.c.blog_id.in_(blog_ids))
+
+        ids: List[UUID] = []
+        counts: List[Counter] = []
+        post_tags: Dict[UUID, List[UUID]] = {}
+        with get_engine().connect() as connection:
+            posts = connection.execution_options(yield_per=LOAD_BATCH_SIZE).execute(posts_query.order_by(Blog.id))
+            for post in posts:
+                ids.append(post.id)
+                counts.append(tokenize(post.title, post.content))
+            for blog_id, tag_id in connection.execute(tags_query):
+                post_tags.setdefault(blog_id, []).append(tag_id)
+        return ids, counts, post_tags
+
+    def _build_model(self) -> RelatedPostsModel:
+        ids, counts, post_tags = self._load_posts()
+
+        # Terms in at least two posts and at most half of them, most common first
+        document_frequency = Counter(term for terms in counts for term in terms)
+        ceiling = max(2, len(ids) // 2)
+        kept = [term for term, df in document_frequency.items() if 2 <= df <= ceiling]
+        kept.sort(key=lambda term: (-document_frequency[term], term))
+        vocabulary = {term: column for column, term in enumerate(kept[:self.max_terms])}
+        df = np.array([document_frequency[term] for term in vocabulary], dtype=np.float32)
+        idf = np.log((1 + len(ids)) / (1 + df)) + 1
+
+        tag_ids = sorted({tag_id for tags in post_tags.values() for tag_id in tags})
+        model = RelatedPostsModel(
+            blog_ids=ids,
+            index={blog_id: row for row, blog_id in enumerate(ids)},
+            vocabulary=vocabulary,
+            idf=idf.astype(np.float32),
+            terms=np.zeros((len(ids), len(vocabulary)), dtype=np.float32),
+            tag_index={tag_id: column for column, tag_id in enumerate(tag_ids)},
+            tags=np.zeros((len(ids), len(tag_ids)), dtype=np.float32),
+            active=np.ones(len(ids), dtype=bool),
+            neighbours=np.full((len(ids), self.top_k), -1, dtype=np.int64),
+            kth_scores=np.full(len(ids), self.min_score, dtype=np.float32),
+        )
+        for row, blog_id in enumerate(ids):
+            model.terms[row] = self._term_vector(model, counts[row])
+            model.tags[row] = self._tag_vector(model, post_tags.get(blog_id, []))
+        logger.info(
+            "Related posts model: %d posts, %d terms, %d tags", len(ids), len(vocabulary), len(tag_ids)
+        )
+        return model
+
+    def _term_vector(self, model: RelatedPostsModel, counts: Counter) -> np.ndarray:
+        vector = np.zeros(len(model.vocabulary), dtype=np.float32)
+        known = [(model.vocabulary[term], count) for term, count in counts.items() if term in model.vocabulary]
+        if known:
+            columns = [column for column, _ in known]
+            frequencies = np.array([count for _, count in known], dtype=np.float32)
+            # Sublinear term frequency, so one word repeated does not dominate
+            vector[columns] = (1 + np.log(frequencies)) * model.idf[columns]
+            norm = np.linalg.norm(vector)
+            if norm:
+                vector /= norm
+        return vector
+
+    def _tag_vector(self, model: RelatedPostsModel, tag_ids: List[UUID]) -> np.ndarray:
+        new = [tag_id for tag_id in tag_ids if tag_id not in model.tag_index]
+        if new:
+            # Tags created since the build get new columns
+            for tag_id in new:
+                model.tag_index[tag_id] = len(model.tag_index)
+            model.tags = np.hstack([model.tags, np.zeros((len(model.blog_ids), len(new)), dtype=np.float32)])
+        vector = np.zeros(len(model.tag_index), dtype=np.float32)
+        vector[[model.tag_index[tag_id] for tag_id in tag_ids]] = 1
+        return vector
+
+    def _apply_changes(self, model, blog_ids, published, post_tags) -> np.ndarray:
+        """
+        Update, add or deactivate the rows of changed posts; returns their row
+        numbers. ``published`` maps the changed posts still published to
+        their term counts.
+        """
+        for blog_id in blog_ids:
+            counts = published.get(blog_id)
+            if counts is None:
+                if blog_id in model.index:
+                    row = model.index[blog_id]
+                    model.active[row] = False
+                    model.terms[row] = 0
+                    model.tags[row] = 0
+                    model.neighbours[row] = -1
+                continue
+
+            if blog_id not in model.index:
+                model.index[blog_id] = len(model.blog_ids)
+                model.blog_ids.append(blog_id)
+                model.terms = np.vstack([model.terms, np.zeros((1, model.terms.shape[1]), np.float32)])
+                model.tags = np.vstack([model.tags, np.zeros((1, model.tags.shape[1]), np.float32)])
+                model.active = np.append(model.active, True)
+                model.neighbours = np.vstack([model.neighbours, np.full((1, self.top_k), -1, np.int64)])
+                model.kth_scores = np.append(model.kth_scores, np.float32(self.min_score))
+            row = model.index[blog_id]
+            tag_vector = self._tag_vector(model, post_tags.get(blog_id, []))
+            model.terms[row] = self._term_vector(model, counts)
+            model.tags[row] = tag_vector
+            model.active[row] = True
+
+        return np.array(sorted(model.index[b] for b in blog_ids if b in model.index), dtype=np.int64)
+
+    def _scores(self, model: RelatedPostsModel, rows: np.ndarray) -> np.ndarray:
+        """Blended relatedness of ``rows`` against every post, shape (len(rows), posts)."""
+        content = model.terms[rows] @ model.terms.T
+        if not self.tag_weight or not model.tags.shape[1]:
+            return content
+
+        shared = model.tags[rows] @ model.tags.T
+        sizes = model.tags.sum(axis=1)
+        union = sizes[rows, np.newaxis] + sizes[np.newaxis, :] - shared
+        jaccard = np.divide(shared, union, out=np.zeros_like(shared), where=union > 0)
+        return (1 - self.tag_weight) * content + self.tag_weight * jaccard
+
+    def _related_rows(self, model: RelatedPostsModel, sources: np.ndarray) -> List[Dict]:
+        rows = []
+        k = min(self.top_k, len(model.blog_ids) - 1)
+        if k <= 0 or not len(sources):
+            return rows
+
+        for start in range(0, len(sources), BLOCK_SIZE):
+            block = sources[start:start + BLOCK_SIZE]
+            scores = self._scores(model, block)
+            scores[np.arange(len(block)), block] = -np.inf
+            scores[:, ~model.active] = -np.inf
+
+            top = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+            top_scores = np.take_along_axis(scores, top, axis=1)
+            order = np.argsort(-top_scores, axis=1, kind="stable")
+            top = np.take_along_axis(top, order, axis=1)
+            top_scores = np.take_along_axis(top_scores, order, axis=1)
+
+            kept = top_scores > self.min_score
+            model.neighbours[block] = -1
+            model.neighbours[block, :k] = np.where(kept, top, -1)
+            # A list with room takes any post above the minimum score
+            full = kept.all(axis=1) & (k == self.top_k)
+            model.kth_scores[block] = np.where(full, top_scores[:, -1], self.min_score)
+
+            for source, related, related_scores, keep in zip(block, top, top_scores, kept):
+                for target, score in zip(related[keep], related_scores[keep]):
+                    rows.append({
+                        "source_blog_id": model.blog_ids[source],
+                        "related_blog_id": model.blog_ids[target],
+                        "relationship_type": RELATIONSHIP_TYPE,
+                        "score": round(float(score), 6),
+                    })
+        return rows
+
+    def _insert(self, connection, rows: List[Dict]) -> None:
+        # Hand-curated relations of other types keep their pair
+        for start in range(0, len(rows), WRITE_CHUNK_SIZE):
+            connection.execute(
+                insert(related_blog).on_conflict_do_nothing(),
+                rows[start:start + WRITE_CHUNK_SIZE],
+            )
+
+
+related_posts_service = RelatedPostsService()
+# Log term the held model was kept current under
+_model_term = None
+
+
+@on_blog_write_once
+def _update_related_posts(write: BlogWriteEvent) -> None:
+    global _model_term
+    # Writes naming only slugs change no content
+    if not (write.bulk or write.blog_ids or write.tag_ids):
+        return
+    # Another process applied writes while this one did not hold the log lock
+    if _model_term != blog_write_subscriber.log_term:
+        related_posts_service.forget()
+        _model_term = blog_write_subscriber.log_term
+    try:
+        if write.bulk:
+            related_posts_service.rebuild()
+        else:
+            related_posts_service.update(write.blog_ids, write.tag_ids)
+    except Exception:
+        logger.exception("Related posts update failed")
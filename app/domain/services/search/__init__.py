@@ -0,0 +1,20 @@
+from app.domain.services.search.backends import (
+    OpenSearchBackend,
+    SearchBackend,
+    SearchBackendError,
+    SearchQuery,
+    SearchResult,
+)
+from app.domain.services.search.memory import InMemorySearchBackend
+from app.domain.services.search.service import SearchService, get_search_service
+
+__all__ = [
+    "OpenSearchBackend",
+    "SearchBackend",
+    "SearchBackendError",
+    "SearchQuery",
+    "SearchResult",
+    "InMemorySearchBackend",
+    "SearchService",
+    "get_search_service",
+]
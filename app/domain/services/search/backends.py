@@ -0,0 +1,254 @@
+import copy
+import logging
+import re
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, List, Optional
+from uuid import UUID
+
+from opensearchpy import OpenSearch, Q, Search, helpers
+from opensearchpy.exceptions import NotFoundError, OpenSearchException
+
+from app.domain.services.search.documents import BLOG_INDEX_BODY, SEARCH_FIELDS, SORT_FIELDS
+
+
+logger = logging.getLogger(__name__)
+
+# Quoted phrases (possibly negated) and bare words of a web search term
+_TERM_TOKEN = re.compile(r'-?"[^"]*"|\S+')
+
+
+class SearchBackendError(Exception):
+    """Raised when the search backend cannot serve a request."""
+
+
+def split_alternatives(term: str) -> List[str]:
+    """
+    Split a web search term on its unquoted ``or`` words.
+
+    As in websearch_to_tsquery, AND binds tighter than OR: "a b or c"
+    matches documents with both a and b, or with c. Empty alternatives,
+    from a leading, trailing or doubled ``or``, are dropped.
+    """
+    alternatives, current = [], []
+    for token in _TERM_TOKEN.findall(term):
+        if token.lower() == "or":
+            alternatives.append(current)
+            current = []
+        else:
+            current.append(token)
+    alternatives.append(current)
+    return [" ".join(tokens) for tokens in alternatives if tokens]
+
+
+@dataclass
+class SearchQuery:
+    """A page of published blogs matching a search term."""
+
+    term: str
+    tag_ids: List[UUID] = field(default_factory=list)
+    tag_match: str = "any"  # "any" or "all" of tag_ids
+    sort_by: str = "relevance"
+    sort_dir: str = "desc"
+    offset: int = 0
+    limit: int = 10
+    include_total: bool = True
+
+
+@dataclass
+class SearchResult:
+    """Ids of the matching blogs in result order, plus the total match count."""
+
+    ids: List[UUID]
+    total: Optional[int] = None
+
+
+class SearchBackend(ABC):
+    """Storage and query engine behind the blog search service."""
+
+    @abstractmethod
+    def reindex(
+        self,
+        documents: Iterable[Dict[str, Any]],
+        catch_up: Optional[Callable[["SearchBackend"], None]] = None,
+    ) -> int:
+        """
+        Replace every indexed document with ``documents``; returns the number
+        written. Searches see the old documents until the new ones are complete.
+
+        ``catch_up`` is called once the documents are written, before they
+        replace the old ones, with a backend writing to the new documents:
+        writes made during the build are applied through it. Backends that
+        keep such writes themselves need not call it.
+        """
+
+    @abstractmethod
+    def index_documents(self, documents: Iterable[Dict[str, Any]]) -> int:
+        """Insert or replace documents by id; returns the number written."""
+
+    @abstractmethod
+    def delete_documents(self, ids: Iterable[str]) -> None:
+        """Remove documents by id, ignoring ids that are not indexed."""
+
+    @abstractmethod
+    def search(self, query: SearchQuery) -> SearchResult:
+        """Run a query against published documents."""
+
+
+class OpenSearchBackend(SearchBackend):
+    """
+    Search backend storing blogs in an OpenSearch index.
+
+    ``index`` names an alias. reindex() fills a new index named after it and
+    the time, e.g. blogs-20240517093012345678, then points the alias at it
+    in one atomic alias update and deletes the old index. Searches and
+    incremental writes go through the alias, so they never see a missing
+    or half-built index.
+
+    Incremental writes made while the new index is filled land in the old
+    one. reindex() hands catch_up a backend writing to the new index, so
+    they can be applied there before the swap.
+    """
+
+    def __init__(self, url: str, index: str = "blogs", chunk_size: int = 500):
+        self.client = OpenSearch(hosts=[url])
+        self.index = index
+        self.chunk_size = chunk_size
+
+    def reindex(
+        self,
+        documents: Iterable[Dict[str, Any]],
+        catch_up: Optional[Callable[[SearchBackend], None]] = None,
+    ) -> int:
+        new_index = f"{self.index}-{datetime.utcnow():%Y%m%d%H%M%S%f}"
+        try:
+            self.client.indices.create(index=new_index, body=BLOG_INDEX_BODY)
+        except OpenSearchException as e:
+            raise SearchBackendError(str(e)) from e
+
+        try:
+            written = self._bulk(self._index_actions(documents, new_index), refresh=False)
+            self.client.indices.refresh(index=new_index)
+            if catch_up is not None:
+                catch_up(self._writing_to(new_index))
+            old_indices = self._aliased_indices()
+            actions = [{"add": {"index": new_index, "alias": self.index}}]
+            actions.extend({"remove": {"index": old, "alias": self.index}} for old in old_indices)
+            if not old_indices and self.client.indices.exists(index=self.index):
+                # An index from before the alias, named like it; replaced in the same step
+                actions.append({"remove_index": {"index": self.index}})
+            self.client.indices.update_aliases(body={"actions": actions})
+        except SearchBackendError:
+            self._delete_index(new_index)
+            raise
+        except OpenSearchException as e:
+            self._delete_index(new_index)
+            raise SearchBackendError(str(e)) from e
+
+        for old in old_indices:
+            self._delete_index(old)
+        return written
+
+    def _writing_to(self, index: str) -> "OpenSearchBackend":
+        """This backend, with writes and searches going to ``index`` instead of the alias."""
+        backend = copy.copy(self)
+        backend.index = index
+        return backend
+
+    def _delete_index(self, index: str) -> None:
+        # Unaliased indices are no longer searched; one left behind only takes space
+        try:
+            self.client.indices.delete(index=index)
+        except OpenSearchException:
+            logger.warning("Could not delete search index %s", index, exc_info=True)
+
+    def _aliased_indices(self) -> List[str]:
+        """Indices the alias currently points at."""
+        try:
+            return list(self.client.indices.get_alias(name=self.index))
+        except NotFoundError:
+            return []
+
+    def index_documents(self, documents: Iterable[Dict[str, Any]]) -> int:
+        return self._bulk(self._index_actions(documents, self.index))
+
+    @staticmethod
+    def _index_actions(documents: Iterable[Dict[str, Any]], index: str):
+        return (
+            {
+                "_op_type": "index",
+                "_index": index,
+                "_id": document["id"],
+                "_source": document,
+            }
+            for document in documents
+        )
+
+    def delete_documents(self, ids: Iterable[str]) -> None:
+        actions = (
+            {"_op_type": "delete", "_index": self.index, "_id": doc_id}
+            for doc_id in ids
+        )
+        self._bulk(actions)
+
+    def _bulk(self, actions, refresh="wait_for") -> int:
+        try:
+            written, errors = helpers.bulk(
+                self.client,
+                actions,
+                chunk_size=self.chunk_size,
+                raise_on_error=False,
+                refresh=refresh,
+            )
+        except OpenSearchException as e:
+            raise SearchBackendError(str(e)) from e
+
+        # Deleting a document that was never indexed is not an error
+        failures = [
+            error for error in errors
+            if error.get("delete", {}).get("status") != 404
+        ]
+        if failures:
+            raise SearchBackendError(f"{len(failures)} bulk actions failed: {failures[0]}")
+        return written
+
+    def search(self, query: SearchQuery) -> SearchResult:
+        # One simple_query_string per alternative: its own operators would
+        # apply left to right, but "or" splits the term into AND groups
+        alternatives = [
+            Q("simple_query_string", query=alternative, fields=SEARCH_FIELDS, default_operator="and")
+            for alternative in split_alternatives(query.term) or [query.term]
+        ]
+        matching = alternatives[0] if len(alternatives) == 1 else Q(
+            "bool", should=alternatives, minimum_should_match=1
+        )
+        search = (
+            Search(using=self.client, index=self.index)
+            .query(matching)
+            .filter("term", status="published")
+            .source(False)
+            .extra(track_total_hits=query.include_total)
+        )
+        if query.tag_ids and query.tag_match == "all":
+            for tag_id in query.tag_ids:
+                search = search.filter("term", tag_ids=str(tag_id))
+        elif query.tag_ids:
+            search = search.filter("terms", tag_ids=[str(tag_id) for tag_id in query.tag_ids])
+
+        # Match Postgres NULL placement: last ascending, first descending
+        missing = "_last" if query.sort_dir == "asc" else "_first"
+        if query.sort_by in SORT_FIELDS:
+            primary = {SORT_FIELDS[query.sort_by]: {"order": query.sort_dir, "missing": missing}}
+        else:
+            primary = {"_score": {"order": query.sort_dir}}
+        search = search.sort(primary, {"id": {"order": query.sort_dir}})
+        search = search[query.offset:query.offset + query.limit]
+
+        try:
+            response = search.execute()
+        except OpenSearchException as e:
+            raise SearchBackendError(str(e)) from e
+
+        total = response.hits.total.value if query.include_total else None
+        return SearchResult(ids=[UUID(hit.meta.id) for hit in response], total=total)
@@ -0,0 +1,63 @@
+from typing import Any, Dict
+
+from app.data.models.blog import Blog
+
+# Fields a search can be sorted by, mapped to their sortable index field
+SORT_FIELDS = {
+    "publication_dt": "publication_dt",
+    "updated_dt": "updated_dt",
+    "reading_time": "reading_time",
+    "title": "title.raw",
+}
+
+# Query-time weights mirroring the Postgres search vector (title A, excerpt B, content C)
+SEARCH_FIELDS = ["title^4", "tag_names^3", "excerpt^2", "content"]
+
+BLOG_INDEX_BODY: Dict[str, Any] = {
+    "settings": {
+        "number_of_shards": 1,
+        "number_of_replicas": 0,
+        "analysis": {
+            "normalizer": {
+                "lowercase": {"type": "custom", "filter": ["lowercase"]},
+            },
+        },
+    },
+    "mappings": {
+        "dynamic": "strict",
+        "properties": {
+            "id": {"type": "keyword"},
+            "title": {
+                "type": "text",
+                "analyzer": "english",
+                "fields": {"raw": {"type": "keyword", "normalizer": "lowercase"}},
+            },
+            "slug": {"type": "keyword"},
+            "excerpt": {"type": "text", "analyzer": "english"},
+            "content": {"type": "text", "analyzer": "english"},
+            "status": {"type": "keyword"},
+            "publication_dt": {"type": "date"},
+            "updated_dt": {"type": "date"},
+            "reading_time": {"type": "integer"},
+            "tag_ids": {"type": "keyword"},
+            "tag_names": {"type": "text", "analyzer": "english"},
+        },
+    },
+}
+
+
+def blog_to_document(blog: Blog) -> Dict[str, Any]:
+    """Build the index document for a blog and its tags."""
+    return {
+        "id": str(blog.id),
+        "title": blog.title,
+        "slug": blog.slug,
+        "excerpt": blog.excerpt,
+        "content": blog.content,
+        "status": blog.status,
+        "publication_dt": blog.publication_dt.isoformat() if blog.publication_dt else None,
+        "updated_dt": blog.updated_dt.isoformat() if blog.updated_dt else None,
+        "reading_time": blog.reading_time,
+        "tag_ids": [str(tag.id) for tag in blog.tags],
+        "tag_names": [tag.name for tag in blog.tags],
+    }
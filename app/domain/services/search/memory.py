@@ -0,0 +1,187 @@
+import math
+import re
+import threading
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+from uuid import UUID
+
+from app.domain.services.search.backends import SearchBackend, SearchQuery, SearchResult, split_alternatives
+
+_QUERY_TOKEN = re.compile(r'(-?)"([^"]*)"|(-?)(\S+)')
+_WORD = re.compile(r"\w+")
+
+# Same weighting as the OpenSearch query fields
+_FIELD_WEIGHTS = {"title": 4.0, "tag_names": 3.0, "excerpt": 2.0, "content": 1.0}
+
+
+def _words(text: str) -> List[str]:
+    return _WORD.findall(text.lower())
+
+
+class InMemorySearchBackend(SearchBackend):
+    """
+    Process-local search backend for tests and offline development.
+
+    Understands the web search syntax of websearch_to_tsquery: every word
+    must match, "quoted phrases" must appear verbatim, -prefixed words or
+    phrases must not appear, and ``or`` separates alternatives, each of
+    which must match as a whole.
+    """
+
+    def __init__(self):
+        self._documents: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+        # Writes made while reindex() builds, one list per running build
+        self._replays: List[List[Callable[[Dict[str, Dict[str, Any]]], None]]] = []
+
+    def reindex(
+        self,
+        documents: Iterable[Dict[str, Any]],
+        catch_up: Optional[Callable[[SearchBackend], None]] = None,
+    ) -> int:
+        # Built aside, so searches keep the old documents until it is
+        # complete. Writes made meanwhile are replayed onto it before the
+        # swap, so catch_up is not needed
+        replay = []
+        with self._lock:
+            self._replays.append(replay)
+        try:
+            entries = {document["id"]: self._entry(document) for document in documents}
+        except BaseException:
+            with self._lock:
+                self._replays.remove(replay)
+            raise
+        with self._lock:
+            self._replays.remove(replay)
+            for apply in replay:
+                apply(entries)
+            self._documents = entries
+        return len(entries)
+
+    def index_documents(self, documents: Iterable[Dict[str, Any]]) -> int:
+        entries = [self._entry(document) for document in documents]
+
+        def apply(documents: Dict[str, Dict[str, Any]]) -> None:
+            for entry in entries:
+                documents[entry["document"]["id"]] = entry
+
+        self._write(apply)
+        return len(entries)
+
+    def _write(self, apply: Callable[[Dict[str, Dict[str, Any]]], None]) -> None:
+        with self._lock:
+            apply(self._documents)
+            for replay in self._replays:
+                replay.append(apply)
+
+    @staticmethod
+    def _entry(document: Dict[str, Any]) -> Dict[str, Any]:
+        fields = {
+            name: " ".join(document.get(name) or []) if name == "tag_names"
+            else (document.get(name) or "")
+            for name in _FIELD_WEIGHTS
+        }
+        return {
+            "document": document,
+            "text": {name: " ".join(_words(value)) for name, value in fields.items()},
+            "words": {name: _words(value) for name, value in fields.items()},
+        }
+
+    def delete_documents(self, ids: Iterable[str]) -> None:
+        ids = list(ids)
+
+        def apply(documents: Dict[str, Dict[str, Any]]) -> None:
+            for doc_id in ids:
+                documents.pop(doc_id, None)
+
+        self._write(apply)
+
+    def search(self, query: SearchQuery) -> SearchResult:
+        alternatives = self._parse(query.term)
+        tag_ids = {str(tag_id) for tag_id in query.tag_ids}
+
+        with self._lock:
+            entries = list(self._documents.values())
+
+        matches: List[Tuple[Dict[str, Any], float]] = []
+        for entry in entries:
+            document = entry["document"]
+            if document["status"] != "published":
+                continue
+            if tag_ids:
+                if query.tag_match == "all":
+                    tagged = tag_ids.issubset(document["tag_ids"])
+                else:
+                    tagged = bool(tag_ids.intersection(document["tag_ids"]))
+                if not tagged:
+                    continue
+            scores = [self._score(entry, required, excluded) for required, excluded in alternatives]
+            matched = [score for score in scores if score is not None]
+            if matched:
+                matches.append((document, max(matched)))
+
+        ordered = self._sort(matches, query.sort_by, query.sort_dir)
+        page = ordered[query.offset:query.offset + query.limit]
+        return SearchResult(
+            ids=[UUID(document["id"]) for document in page],
+            total=len(ordered) if query.include_total else None,
+        )
+
+    @staticmethod
+    def _parse(term: str) -> List[Tuple[List[str], List[str]]]:
+        """The required and excluded words or phrases of each alternative in a term."""
+        alternatives = []
+        for alternative in split_alternatives(term):
+            required, excluded = [], []
+            for phrase_neg, phrase, word_neg, word in _QUERY_TOKEN.findall(alternative):
+                text = " ".join(_words(phrase or word))
+                if text:
+                    (excluded if phrase_neg or word_neg else required).append(text)
+            if required:
+                alternatives.append((required, excluded))
+        return alternatives
+
+    def _score(self, entry: Dict[str, Any], required: List[str], excluded: List[str]) -> Optional[float]:
+        """Score of an entry matching every required and no excluded phrase, or None."""
+        if any(self._occurrences(entry, phrase) for phrase in excluded):
+            return None
+        score = 0.0
+        for phrase in required:
+            hits = self._occurrences(entry, phrase)
+            if not hits:
+                return None
+            score += hits
+        return score
+
+    @staticmethod
+    def _occurrences(entry: Dict[str, Any], phrase: str) -> float:
+        """Weighted, log-damped number of times a word or phrase occurs."""
+        weighted = 0.0
+        for name, weight in _FIELD_WEIGHTS.items():
+            if " " in phrase:
+                count = f" {entry['text'][name]} ".count(f" {phrase} ")
+            else:
+                count = entry["words"][name].count(phrase)
+            if count:
+                weighted += weight * (1 + math.log(count))
+        return weighted
+
+    @staticmethod
+    def _sort(matches, sort_by: str, sort_dir: str) -> List[Dict[str, Any]]:
+        descending = sort_dir == "desc"
+        if sort_by == "relevance":
+            keyed = [((score, document["id"]), document) for document, score in matches]
+            return [document for _, document in sorted(keyed, key=lambda item: item[0], reverse=descending)]
+
+        field = sort_by
+        present = [(document, document.get(field)) for document, _ in matches]
+        values = sorted(
+            ((value.lower() if isinstance(value, str) else value, document["id"]), document)
+            for document, value in present if value is not None
+        )
+        missing = sorted((document["id"], document) for document, value in present if value is None)
+
+        # NULLs sort last ascending and first descending, as in Postgres
+        ordered = [document for _, document in values] + [document for _, document in missing]
+        if descending:
+            ordered.reverse()
+        return ordered
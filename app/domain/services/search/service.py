@@ -0,0 +1,180 @@
+from typing import Iterable, List, Optional
+from uuid import UUID
+
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session, selectinload
+
+from app.core.config import settings
+from app.data.events import BlogWriteEvent, on_blog_write, on_blog_write_once
+from app.data.models.blog import Blog, blog_tag
+from app.data.models.blog_write import BlogWrite
+from app.data.repositories.session import SessionLocal
+from app.domain.services.search.backends import (
+    OpenSearchBackend,
+    SearchBackend,
+    SearchQuery,
+    SearchResult,
+)
+from app.domain.services.search.documents import blog_to_document
+from app.domain.services.search.memory import InMemorySearchBackend
+
+
+class SearchService:
+    """Keeps the search index in step with published blogs and queries it."""
+
+    def __init__(self, backend: SearchBackend, chunk_size: int = 500):
+        self.backend = backend
+        self.chunk_size = chunk_size
+
+    def search_published(
+        self,
+        term: str,
+        tag_ids: Optional[List[UUID]] = None,
+        sort_by: str = "relevance",
+        sort_dir: str = "desc",
+        offset: int = 0,
+        limit: int = 10,
+        include_total: bool = True,
+        tag_match: str = "any",
+    ) -> SearchResult:
+        """Return the ids of one page of published blogs matching ``term``."""
+        return self.backend.search(
+            SearchQuery(
+                term=term,
+                tag_ids=tag_ids or [],
+                tag_match=tag_match,
+                sort_by=sort_by,
+                sort_dir=sort_dir,
+                offset=offset,
+                limit=limit,
+                include_total=include_total,
+            )
+        )
+
+    def reindex_all(self, db: Session) -> int:
+        """
+        Rebuild the index from every published blog, streaming in chunks.
+        Searches are served from the previous index until it is complete.
+
+        Blogs written during the build, as recorded in the blog write log,
+        are synced into the new index before it goes live, and once more
+        after, for writes that reached the old index in between.
+        """
+        since = db.scalar(select(func.max(BlogWrite.id))) or 0
+
+        def catch_up(backend: SearchBackend) -> None:
+            nonlocal since
+            since = self._sync_logged_writes(backend, since)
+
+        blogs = db.scalars(
+            select(Blog)
+            .options(selectinload(Blog.tags))
+            .where(Blog.status == "published")
+            .execution_options(yield_per=self.chunk_size)
+        )
+        written = self.backend.reindex((blog_to_document(blog) for blog in blogs), catch_up=catch_up)
+        self._sync_logged_writes(self.backend, since)
+        return written
+
+    def _sync_logged_writes(self, backend: SearchBackend, since: int) -> int:
+        """Sync the blogs named by logged writes after ``since``; returns the last id applied."""
+        # A session of its own: the build's session holds the blogs as it read them
+        db = SessionLocal()
+        try:
+            rows = db.execute(
+                select(BlogWrite.id, BlogWrite.blog_ids, BlogWrite.tag_ids)
+                .where(BlogWrite.id > since)
+                .order_by(BlogWrite.id)
+            ).all()
+            if not rows:
+                return since
+            # Bulk writes are left out: the log processor reindexes for them
+            blog_ids = {blog_id for row in rows for blog_id in row.blog_ids}
+            blog_ids.update(self._tagged_blogs(db, {tag_id for row in rows for tag_id in row.tag_ids}))
+            self.sync_blogs(db, blog_ids, backend)
+            return rows[-1].id
+        finally:
+            db.close()
+
+    @staticmethod
+    def _tagged_blogs(db: Session, tag_ids: Iterable[UUID]) -> List[UUID]:
+        tag_ids = list(tag_ids)
+        if not tag_ids:
+            return []
+        return [row.blog_id for row in db.execute(blog_tag.select().where(blog_tag.c.tag_id.in_(tag_ids)))]
+
+    def sync_blogs(self, db: Session, blog_ids: Iterable[UUID], backend: Optional[SearchBackend] = None) -> None:
+        """
+        Bring the given blogs up to date in the index, or in ``backend``.
+
+        Published blogs are upserted; blogs that are no longer published or no
+        longer exist are deleted.
+        """
+        backend = backend or self.backend
+        blog_ids = list(blog_ids)
+        if not blog_ids:
+            return
+
+        blogs = (
+            db.query(Blog)
+            .options(selectinload(Blog.tags))
+            .filter(Blog.id.in_(blog_ids))
+            .all()
+        )
+        published = [blog for blog in blogs if blog.status == "published"]
+        published_ids = {blog.id for blog in published}
+
+        if published:
+            backend.index_documents(blog_to_document(blog) for blog in published)
+        backend.delete_documents(
+            str(blog_id) for blog_id in blog_ids if blog_id not in published_ids
+        )
+
+    def handle_blog_write(self, write: BlogWriteEvent) -> None:
+        """Apply a committed blog write to the index."""
+        db = SessionLocal()
+        try:
+            if write.bulk:
+                self.reindex_all(db)
+                return
+
+            blog_ids = set(write.blog_ids)
+            # Renamed or deleted tags change every document carrying them
+            blog_ids.update(self._tagged_blogs(db, write.tag_ids))
+            self.sync_blogs(db, blog_ids)
+        finally:
+            db.close()
+
+
+_search_service: Optional[SearchService] = None
+
+
+def get_search_service() -> Optional[SearchService]:
+    """
+    Return the configured search service, or None when search runs on
+    Postgres full-text search (SEARCH_BACKEND="postgres").
+    """
+    global _search_service
+    if _search_service is None and settings.SEARCH_BACKEND != "postgres":
+        if settings.SEARCH_BACKEND == "opensearch":
+            backend = OpenSearchBackend(settings.ELASTICSEARCH_URL, settings.SEARCH_INDEX_NAME)
+        elif settings.SEARCH_BACKEND == "memory":
+            backend = InMemorySearchBackend()
+        else:
+            raise ValueError(f"Unknown SEARCH_BACKEND: {settings.SEARCH_BACKEND}")
+        _search_service = SearchService(backend)
+    return _search_service
+
+
+def _sync_search_index(write: BlogWriteEvent) -> None:
+    service = get_search_service()
+    if service is not None:
+        service.handle_blog_write(write)
+
+
+# Every process holds its own in-memory index; an OpenSearch index is shared
+# and updated once per write, by the worker processing the blog write log
+if settings.SEARCH_BACKEND == "memory":
+    on_blog_write(_sync_search_index)
+elif settings.SEARCH_BACKEND != "postgres":
+    on_blog_write_once(_sync_search_index)
@@ -0,0 +1,118 @@
+import hashlib
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+from uuid import UUID
+
+from app.core.config import settings
+from app.data.events import BlogWriteEvent, on_blog_write
+from app.data.repositories.session import SessionLocal
+from app.data.repositories.tag_repository import TagRepository
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class CatalogTag:
+    """A tag as held by the catalog."""
+
+    id: UUID
+    name: str
+    color_code: Optional[str]
+    post_count: int
+
+
+@dataclass(frozen=True)
+class CatalogSnapshot:
+    """Immutable view of every tag, swapped in whole on each reload."""
+
+    tags: List[CatalogTag]
+    by_id: Dict[UUID, CatalogTag]
+    by_name: Dict[str, CatalogTag]
+    version: str
+    loaded_at: float
+
+
+class TagCatalog:
+    """
+    Process-local copy of the tag table with published post counts.
+
+    Loaded at startup and reloaded after every committed blog or tag write in
+    this process. Writes made by other processes are picked up once the
+    snapshot is older than TAG_CATALOG_TTL_SECONDS, by a background reload;
+    readers keep using the previous snapshot meanwhile and never query.
+    """
+
+    def __init__(self, tag_repository: TagRepository = None, ttl: float = None):
+        self.tag_repository = tag_repository or TagRepository()
+        self.ttl = settings.TAG_CATALOG_TTL_SECONDS if ttl is None else ttl
+        self._snapshot: Optional[CatalogSnapshot] = None
+        self._reload_lock = threading.Lock()
+
+    @property
+    def loaded(self) -> bool:
+        return self._snapshot is not None
+
+    def load(self) -> CatalogSnapshot:
+        """Read every tag and its post count, then publish the new snapshot."""
+        with self._reload_lock:
+            db = SessionLocal()
+            try:
+                rows = self.tag_repository.get_with_published_counts(db)
+            finally:
+                db.close()
+
+            tags = [CatalogTag(row.id, row.name, row.color_code, row.post_count) for row in rows]
+            digest = hashlib.blake2b(digest_size=16)
+            for tag in tags:
+                digest.update(f"{tag.id}|{tag.name}|{tag.color_code}|{tag.post_count}\n".encode("utf-8"))
+
+            self._snapshot = CatalogSnapshot(
+                tags=tags,
+                by_id={tag.id: tag for tag in tags},
+                by_name={tag.name.casefold(): tag for tag in tags},
+                version=digest.hexdigest(),
+                loaded_at=time.monotonic(),
+            )
+            return self._snapshot
+
+    def snapshot(self) -> CatalogSnapshot:
+        """
+        Return the current snapshot.
+
+        The first call loads synchronously if startup did not; a stale
+        snapshot is returned as is while a background thread refreshes it.
+        """
+        snapshot = self._snapshot
+        if snapshot is None:
+            return self.load()
+        if time.monotonic() - snapshot.loaded_at > self.ttl and not self._reload_lock.locked():
+            threading.Thread(target=self._reload_quietly, daemon=True).start()
+        return snapshot
+
+    def resolve(self, value: str) -> Optional[UUID]:
+        """Resolve a tag UUID or a tag name (case-insensitive) to a tag id."""
+        value = value.strip()
+        try:
+            return UUID(value)
+        except ValueError:
+            tag = self.snapshot().by_name.get(value.casefold())
+            return tag.id if tag else None
+
+    def _reload_quietly(self) -> None:
+        try:
+            self.load()
+        except Exception:
+            logger.exception("Tag catalog reload failed")
+
+
+tag_catalog = TagCatalog()
+
+
+@on_blog_write
+def _reload_tag_catalog(write: BlogWriteEvent) -> None:
+    # Any blog write may change which posts are published, and so the counts
+    if tag_catalog.loaded:
+        tag_catalog._reload_quietly()
@@ -1,18 +1,118 @@
+import time
+
+_import_started = time.perf_counter()
+
+import asyncio
+import logging
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from slowapi import Limiter, _rate_limit_exceeded_handler
 from slowapi.util import get_remote_address
 from slowapi.errors import RateLimitExceeded
+from sqlalchemy.orm import configure_mappers
 
-from app.api.routers.admin import auth
-from app.api.routers.public import blogs
+from app.api.routers.admin import auth, contacts as admin_contacts
+from app.api.routers.public import blogs, contact, feeds, tags
+from app.api.warmup import warm_up
 from app.core.config import settings
+from app.core.database import prefill_async_pool, prefill_pool
+from app.core.metrics import configure_metrics
 from app.core.rate_limiting import limiter, rate_limit_exceeded_handler
+from app.core.startup import StartupProfile
+from app.core.tracing import RequestTracingMiddleware, configure_tracing
+from app.domain.services import related_posts  # noqa: F401 - registers its blog write hook
+from app.data.repositories.session import SessionLocal, dispose_engines, init_engines
+from app.data.write_subscriber import blog_write_subscriber
+from app.domain.services.contact_buffer import contact_buffer
+from app.domain.services.search.service import get_search_service
+from app.domain.services.tag_catalog import tag_catalog
+
+configure_metrics()
+configure_tracing()
+
+_imports_ms = (time.perf_counter() - _import_started) * 1000
+
+logger = logging.getLogger(__name__)
+
+
+def _reindex_memory_search() -> None:
+    # The in-memory index starts empty in every process
+    db = SessionLocal()
+    try:
+        get_search_service().reindex_all(db)
+    finally:
+        db.close()
+
+
+async def _warm_up(app: FastAPI, startup: StartupProfile) -> None:
+    try:
+        with startup.phase("warmup_requests"):
+            await warm_up(app)
+    except Exception:
+        # A failed warm-up only costs the first requests their latency
+        logger.exception("Startup warm-up failed")
+    finally:
+        startup.finish()
+        app.state.ready = True
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Importing the app creates no engines or connections; that, mapper
+    # configuration and warm-up happen here, each timed as a phase
+    app.state.ready = False
+    app.state.startup = startup = StartupProfile(_import_started)
+    startup.record("imports", _imports_ms)
+
+    with startup.phase("database_engines"):
+        engine, async_engine = init_engines()
+    with startup.phase("orm_mappers"):
+        configure_mappers()
+    if settings.DB_POOL_PREFILL:
+        with startup.phase("database_pools"):
+            await asyncio.gather(
+                asyncio.to_thread(prefill_pool, engine, settings.DB_SYNC_POOL_SIZE),
+                prefill_async_pool(async_engine, settings.DB_ASYNC_POOL_SIZE),
+            )
+    with startup.phase("tag_catalog"):
+        tag_catalog.load()
+    with startup.phase("contact_buffer"):
+        await contact_buffer.start()
+    with startup.phase("blog_write_subscriber"):
+        await blog_write_subscriber.start()
+    # Needed for search to work at all, so not part of the optional warm-up;
+    # built after the subscriber starts, which then delivers later writes
+    if settings.SEARCH_BACKEND == "memory":
+        with startup.phase("search_index"):
+            await asyncio.to_thread(_reindex_memory_search)
+
+    # Serve while warming up; /ready tells load balancers when to send traffic
+    warmup_task = None
+    if settings.STARTUP_WARMUP:
+        warmup_task = asyncio.create_task(_warm_up(app, startup))
+    else:
+        startup.finish()
+        app.state.ready = True
+
+    yield
+
+    app.state.ready = False
+    if warmup_task is not None and not warmup_task.done():
+        warmup_task.cancel()
+    await blog_write_subscriber.stop()
+    # Write queued contact submissions before the process exits
+    await contact_buffer.stop()
+    await dispose_engines()
+
 
 app = FastAPI(
     title="Personal Website API",
     description="Backend API for Personal Professional Website",
     version="0.1.0",
+    lifespan=lifespan,
 )
 
 app.state.limiter = limiter
@@ -25,11 +125,32 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
+# Added last so it is outermost and times the whole request
+app.add_middleware(RequestTracingMiddleware)
 
 app.include_router(auth.router, prefix="/api/admin/auth", tags=["admin"])
+app.include_router(admin_contacts.router, prefix="/api/admin/contacts", tags=["admin"])
 app.include_router(blogs.router, prefix="/api", tags=["blogs"])
+app.include_router(tags.router, prefix="/api", tags=["tags"])
+app.include_router(contact.router, prefix="/api", tags=["contact"])
+# Feeds and the sitemap live at the conventional root paths
+app.include_router(feeds.router, tags=["feeds"])
 
 @app.get("/")
 @limiter.limit("100/minute")
 async def root(request: Request):
-    return {"message": "Welcome to Personal Website API"}
\ No newline at end of file
+    return {"message": "Welcome to Personal Website API"}
+
+
+@app.get("/ready", include_in_schema=False)
+async def ready(request: Request):
+    """Readiness probe: 503 until startup and warm-up have finished."""
+    startup = request.app.state.startup
+    return JSONResponse(
+        {
+            "status": "ready" if request.app.state.ready else "starting",
+            "startup_ms": startup.total_ms,
+            "phases": startup.phases,
+        },
+        status_code=200 if request.app.state.ready else 503,
+    )
\ No newline at end of file
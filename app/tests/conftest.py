@@ -0,0 +1,94 @@
+"""
+Shared fixtures. The tests run against the database configured in the
+environment (see .env.example), with migrations applied; every row a test
+creates is deleted again when it finishes.
+"""
+import os
+import time
+from datetime import datetime, timedelta
+from uuid import uuid4
+
+import pytest
+
+# Read by Settings on import, so set before the app is imported
+os.environ.setdefault("STARTUP_WARMUP", "false")
+
+from fastapi.testclient import TestClient  # noqa: E402
+
+from app.core.rate_limiting import limiter  # noqa: E402
+from app.data.models.blog import Blog  # noqa: E402
+from app.data.models.tag import Tag  # noqa: E402
+from app.data.repositories.session import SessionLocal  # noqa: E402
+from app.main import app  # noqa: E402
+
+
+@pytest.fixture(scope="session")
+def client():
+    limiter.enabled = False
+    with TestClient(app) as client:
+        yield client
+    limiter.enabled = True
+
+
+@pytest.fixture
+def db():
+    session = SessionLocal()
+    try:
+        yield session
+    finally:
+        session.close()
+
+
+@pytest.fixture
+def wait_for():
+    """Poll ``condition`` until it holds, for work done off the request path."""
+
+    def wait_for(condition, timeout=10.0):
+        deadline = time.monotonic() + timeout
+        while not condition():
+            if time.monotonic() > deadline:
+                pytest.fail("condition not met within %.0f s" % timeout)
+            time.sleep(0.1)
+
+    return wait_for
+
+
+@pytest.fixture
+def make_tag(db):
+    """Create tags with unique names; they are deleted after the test."""
+    created = []
+
+    def make_tag(**fields):
+        tag = Tag(name=f"test-{uuid4().hex[:12]}", **fields)
+        db.add(tag)
+        db.commit()
+        created.append(tag)
+        return tag
+
+    yield make_tag
+    for tag in created:
+        db.delete(tag)
+    db.commit()
+
+
+@pytest.fixture
+def make_blog(db):
+    """Create published blogs with unique slugs; they are deleted after the test."""
+    created = []
+
+    def make_blog(tags=(), **fields):
+        slug = f"test-{uuid4().hex[:12]}"
+        fields.setdefault("title", slug.replace("-", " ").title())
+        fields.setdefault("content", f"Content of {slug}.")
+        fields.setdefault("status", "published")
+        fields.setdefault("publication_dt", datetime.utcnow() - timedelta(minutes=len(created)))
+        blog = Blog(slug=slug, tags=list(tags), **fields)
+        db.add(blog)
+        db.commit()
+        created.append(blog)
+        return blog
+
+    yield make_blog
+    for blog in created:
+        db.delete(blog)
+    db.commit()
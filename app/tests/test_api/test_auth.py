@@ -0,0 +1,107 @@
+import os
+import subprocess
+import sys
+from uuid import uuid4
+
+import pytest
+
+from app.core.security import get_password_hash
+from app.data.models.user import User
+
+PASSWORD = "correct horse battery staple"
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+# Deactivates a user the way a script does: in a process of its own
+DEACTIVATE_USER = """
+import sys
+from app.data.models.user import User
+from app.data.repositories.session import SessionLocal
+
+db = SessionLocal()
+db.get(User, int(sys.argv[1])).is_active = False
+db.commit()
+"""
+
+
+@pytest.fixture
+def user(db):
+    user = User(email=f"test-{uuid4().hex[:12]}@example.com", password_hash=get_password_hash(PASSWORD))
+    db.add(user)
+    db.commit()
+    yield user
+    db.delete(user)
+    db.commit()
+
+
+def _login(client, user):
+    response = client.post("/api/admin/auth/login", data={"username": user.email, "password": PASSWORD})
+    assert response.status_code == 200, response.text
+    return response.json()
+
+
+def _refresh(client, refresh_token):
+    return client.post("/api/admin/auth/refresh", json={"refresh_token": refresh_token})
+
+
+def _contacts(client, access_token):
+    return client.get("/api/admin/contacts", headers={"Authorization": f"Bearer {access_token}"})
+
+
+def test_refresh_rotates_the_refresh_token(client, user):
+    tokens = _login(client, user)
+
+    response = _refresh(client, tokens["refresh_token"])
+    assert response.status_code == 200, response.text
+    rotated = response.json()
+    assert rotated["refresh_token"] != tokens["refresh_token"]
+    assert _contacts(client, rotated["access_token"]).status_code == 200
+
+    # The rotated token keeps working until it is exchanged itself
+    assert _refresh(client, rotated["refresh_token"]).status_code == 200
+
+
+def test_reused_refresh_token_revokes_its_family(client, user):
+    tokens = _login(client, user)
+    rotated = _refresh(client, tokens["refresh_token"]).json()
+
+    # Presenting the exchanged token again looks like theft
+    assert _refresh(client, tokens["refresh_token"]).status_code == 401
+
+    # Every token of the login is now revoked, including the legitimate one
+    assert _refresh(client, rotated["refresh_token"]).status_code == 401
+    assert _contacts(client, rotated["access_token"]).status_code == 401
+
+
+def test_reuse_leaves_other_logins_alone(client, user):
+    stolen = _login(client, user)
+    other = _login(client, user)
+    _refresh(client, stolen["refresh_token"])
+    _refresh(client, stolen["refresh_token"])
+
+    assert _refresh(client, other["refresh_token"]).status_code == 200
+
+
+def test_logout_revokes_refresh_and_access_tokens(client, user):
+    tokens = _login(client, user)
+
+    response = client.post("/api/admin/auth/logout", json={"refresh_token": tokens["refresh_token"]})
+    assert response.status_code == 204
+    assert _refresh(client, tokens["refresh_token"]).status_code == 401
+    assert _contacts(client, tokens["access_token"]).status_code == 401
+
+
+def test_access_token_is_not_a_refresh_token(client, user):
+    tokens = _login(client, user)
+    assert _refresh(client, tokens["access_token"]).status_code == 401
+
+
+def test_user_deactivated_in_other_process_is_refused(client, user, wait_for):
+    tokens = _login(client, user)
+    # Caches the user snapshot
+    assert _contacts(client, tokens["access_token"]).status_code == 200
+
+    env = dict(os.environ, PYTHONPATH=ROOT)
+    subprocess.run([sys.executable, "-c", DEACTIVATE_USER, str(user.id)], check=True, cwd=ROOT, env=env)
+
+    # Delivered by the write subscriber, well before the cache TTL
+    wait_for(lambda: _contacts(client, tokens["access_token"]).status_code == 400, timeout=5)
@@ -0,0 +1,63 @@
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+# Edits a post the way a script does: in a process of its own
+EDIT_POST = """
+import sys
+from app.data.models.blog import Blog
+from app.data.repositories.session import SessionLocal
+
+db = SessionLocal()
+blog = db.query(Blog).filter(Blog.slug == sys.argv[1]).one()
+blog.title = sys.argv[2]
+db.commit()
+"""
+
+
+def _edit_in_other_process(slug, title):
+    env = dict(os.environ, PYTHONPATH=ROOT)
+    subprocess.run([sys.executable, "-c", EDIT_POST, slug, title], check=True, cwd=ROOT, env=env)
+
+
+def test_detail_has_etag_and_answers_if_none_match(client, make_blog):
+    blog = make_blog()
+
+    response = client.get(f"/api/blogs/{blog.slug}")
+    assert response.status_code == 200
+    etag = response.headers["etag"]
+    assert response.headers["last-modified"]
+
+    cached = client.get(f"/api/blogs/{blog.slug}", headers={"If-None-Match": etag})
+    assert cached.status_code == 304
+    assert cached.headers["etag"] == etag
+
+
+def test_detail_changes_after_write_in_same_process(client, db, make_blog):
+    blog = make_blog(title="Before")
+    etag = client.get(f"/api/blogs/{blog.slug}").headers["etag"]
+
+    blog.title = "After"
+    db.commit()
+
+    response = client.get(f"/api/blogs/{blog.slug}", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.json()["title"] == "After"
+    assert response.headers["etag"] != etag
+
+
+def test_detail_changes_after_write_in_other_process(client, make_blog, wait_for):
+    blog = make_blog(title="Before")
+    first = client.get(f"/api/blogs/{blog.slug}")
+    etag = first.headers["etag"]
+    assert client.get(f"/api/blogs/{blog.slug}").headers["x-cache"] == "HIT"
+
+    _edit_in_other_process(blog.slug, "Edited elsewhere")
+
+    # Delivered by the blog write subscriber once Postgres relays the NOTIFY
+    wait_for(lambda: client.get(f"/api/blogs/{blog.slug}").json()["title"] == "Edited elsewhere")
+    response = client.get(f"/api/blogs/{blog.slug}", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["etag"] != etag
@@ -0,0 +1,114 @@
+def _slugs(response):
+    assert response.status_code == 200, response.text
+    return [item["slug"] for item in response.json()["items"]]
+
+
+def test_tag_match_any_and_all(client, make_tag, make_blog):
+    python, postgres = make_tag(), make_tag()
+    both = make_blog(tags=[python, postgres])
+    only_python = make_blog(tags=[python])
+    only_postgres = make_blog(tags=[postgres])
+    make_blog()
+
+    tags = f"{python.name},{postgres.name}"
+    any_slugs = _slugs(client.get("/api/blogs", params={"tags": tags, "tag_match": "any"}))
+    assert sorted(any_slugs) == sorted([both.slug, only_python.slug, only_postgres.slug])
+
+    all_slugs = _slugs(client.get("/api/blogs", params={"tags": tags, "tag_match": "all"}))
+    assert all_slugs == [both.slug]
+
+
+def test_tags_by_uuid_match_tags_by_name(client, make_tag, make_blog):
+    python, postgres = make_tag(), make_tag()
+    both = make_blog(tags=[python, postgres])
+    make_blog(tags=[python])
+
+    by_uuid = client.get("/api/blogs", params={"tags": f"{python.id},{postgres.id}", "tag_match": "all"})
+    assert _slugs(by_uuid) == [both.slug]
+
+
+def test_unknown_tag_matches_nothing(client, make_tag, make_blog):
+    python = make_tag()
+    tagged = make_blog(tags=[python])
+
+    response = client.get("/api/blogs", params={"tags": "no-such-tag-name"})
+    assert _slugs(response) == []
+    assert response.json()["total"] == 0
+
+    any_slugs = _slugs(client.get("/api/blogs", params={"tags": f"{python.name},no-such-tag-name"}))
+    assert any_slugs == [tagged.slug]
+    all_slugs = _slugs(
+        client.get("/api/blogs", params={"tags": f"{python.name},no-such-tag-name", "tag_match": "all"})
+    )
+    assert all_slugs == []
+
+
+def test_unknown_tag_match_falls_back_to_any(client, make_tag, make_blog):
+    python, postgres = make_tag(), make_tag()
+    tagged = make_blog(tags=[python])
+
+    tags = f"{python.name},{postgres.name}"
+    assert _slugs(client.get("/api/blogs", params={"tags": tags, "tag_match": "some"})) == [tagged.slug]
+
+def test_cursor_pages_forward_and_back(client, make_tag, make_blog):
+    tag = make_tag()
+    # make_blog publishes each post a minute before the previous one
+    blogs = [make_blog(tags=[tag]) for _ in range(5)]
+    params = {"tags": tag.name, "page_size": 2, "sort_by": "publication_dt", "sort_dir": "desc"}
+
+    pages, cursors = [], []
+    cursor = None
+    while True:
+        response = client.get("/api/blogs", params=dict(params, cursor=cursor) if cursor else params)
+        pages.append(_slugs(response))
+        cursors.append(response.json()["prev_cursor"])
+        cursor = response.json()["next_cursor"]
+        if cursor is None:
+            break
+
+    assert pages == [[blogs[0].slug, blogs[1].slug], [blogs[2].slug, blogs[3].slug], [blogs[4].slug]]
+    assert cursors[0] is None
+
+    # prev_cursor of the last page leads back to the middle one
+    back = client.get("/api/blogs", params=dict(params, cursor=cursors[-1]))
+    assert _slugs(back) == pages[1]
+
+
+def test_cursor_by_title_covers_every_post(client, make_tag, make_blog):
+    tag = make_tag()
+    blogs = [make_blog(tags=[tag], title=title) for title in ["Delta", "Alpha", "Charlie", "Bravo"]]
+    params = {"tags": tag.name, "page_size": 3, "sort_by": "title", "sort_dir": "asc"}
+
+    first = client.get("/api/blogs", params=params)
+    second = client.get("/api/blogs", params=dict(params, cursor=first.json()["next_cursor"]))
+
+    titles = {blog.slug: blog.title for blog in blogs}
+    seen = [titles[slug] for slug in _slugs(first) + _slugs(second)]
+    assert seen == ["Alpha", "Bravo", "Charlie", "Delta"]
+    assert second.json()["next_cursor"] is None
+
+
+def test_malformed_cursor_is_rejected(client):
+    response = client.get("/api/blogs", params={"cursor": "not-a-cursor"})
+    assert response.status_code == 400
+
+
+def test_cursor_from_other_filters_is_rejected(client, make_tag, make_blog):
+    python, postgres = make_tag(), make_tag()
+    for _ in range(3):
+        make_blog(tags=[python, postgres])
+    params = {"tags": python.name, "page_size": 2}
+
+    cursor = client.get("/api/blogs", params=params).json()["next_cursor"]
+    assert client.get("/api/blogs", params=dict(params, cursor=cursor)).status_code == 200
+    # The same tag by UUID normalises to the same filters
+    assert client.get("/api/blogs", params={"tags": str(python.id), "page_size": 2, "cursor": cursor}).status_code == 200
+
+    other_filters = [
+        {"tags": postgres.name},
+        {"tags": f"{python.name},{postgres.name}", "tag_match": "all"},
+        {"search_term": "pagination"},
+    ]
+    for changed in other_filters:
+        response = client.get("/api/blogs", params=dict(params, cursor=cursor, **changed))
+        assert response.status_code == 400, changed
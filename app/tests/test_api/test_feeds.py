@@ -0,0 +1,61 @@
+from datetime import datetime, timedelta
+
+from email.utils import parsedate_to_datetime
+
+import pytest
+
+from app.core.config import settings
+
+
+@pytest.mark.parametrize("path", ["/feed.xml", "/atom.xml", "/sitemap.xml"])
+def test_feed_answers_validators_with_304(client, make_blog, path):
+    make_blog()
+
+    response = client.get(path)
+    assert response.status_code == 200
+    etag, last_modified = response.headers["etag"], response.headers["last-modified"]
+
+    assert client.get(path, headers={"If-None-Match": etag}).status_code == 304
+    assert client.get(path, headers={"If-Modified-Since": last_modified}).status_code == 304
+    # If-None-Match wins over If-Modified-Since
+    stale = client.get(path, headers={"If-None-Match": 'W/"0"', "If-Modified-Since": last_modified})
+    assert stale.status_code == 200
+
+
+def test_unpublishing_newest_post_changes_validators(client, db, make_blog):
+    # Newer than any other published post, so it alone sets max(updated_dt)
+    blog = make_blog(publication_dt=datetime.utcnow() + timedelta(days=1))
+    first = client.get("/feed.xml")
+    assert blog.slug in first.text
+    etag, last_modified = first.headers["etag"], first.headers["last-modified"]
+
+    blog.status = "draft"
+    db.commit()
+
+    response = client.get("/feed.xml", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert blog.slug not in response.text
+    assert response.headers["etag"] != etag
+    assert parsedate_to_datetime(response.headers["last-modified"]) >= parsedate_to_datetime(last_modified)
+
+
+def test_deleting_a_post_changes_the_etag(client, db, make_blog):
+    blog = make_blog()
+    etag = client.get("/sitemap.xml").headers["etag"]
+
+    db.delete(blog)
+    db.commit()
+
+    response = client.get("/sitemap.xml", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert blog.slug not in response.text
+
+
+@pytest.mark.parametrize("path", ["/feed.xml", "/atom.xml"])
+def test_self_link_ignores_the_host_header(client, make_blog, path):
+    make_blog()
+    forged = client.get(path, headers={"Host": "attacker.example"})
+    assert "attacker.example" not in forged.text
+    assert f'{settings.SITE_URL.rstrip("/")}{path}' in forged.text
+    # Nor does a forged request poison the cached document
+    assert "attacker.example" not in client.get(path).text
@@ -0,0 +1,34 @@
+from app.api.warmup import warm_up
+from app.core import tracing
+from app.core.rate_limiting import limiter
+
+
+class Recorder:
+    def __init__(self):
+        self.calls = []
+
+    def record(self, *args, **kwargs):
+        self.calls.append(args)
+
+
+def test_warm_up_requests_succeed(client, make_blog):
+    make_blog()
+    statuses = client.portal.call(warm_up, client.app)
+    assert statuses and all(status == 200 for status in statuses.values())
+
+
+def test_warm_up_skips_rate_limits_and_request_metrics(client, monkeypatch):
+    recorder = Recorder()
+    monkeypatch.setattr(tracing, "_request_duration", recorder)
+    monkeypatch.setattr(limiter, "enabled", True)
+    limiter.reset()
+
+    client.portal.call(warm_up, client.app)
+    assert recorder.calls == []
+    # Counters of the in-memory storage the tests run with
+    assert not [key for key in limiter._storage.storage if "127.0.0.1" in key]
+
+    # Real requests are still limited and measured
+    client.get("/api/tags")
+    assert len(recorder.calls) == 1
+    assert [key for key in limiter._storage.storage if "testclient" in key]
@@ -0,0 +1,172 @@
+import asyncio
+
+import pytest
+from sqlalchemy.exc import DBAPIError
+
+from app.domain.services.contact_buffer import ContactBufferFullError, ContactWriteBuffer
+
+
+class FakeContactRepository:
+    """Records inserted batches; rows whose name is in ``reject`` fail like a constraint violation."""
+
+    def __init__(self, reject=(), connection_failures=0, delay=0.0):
+        self.batches = []
+        self.reject = set(reject)
+        self.connection_failures = connection_failures
+        self.delay = delay
+
+    async def insert_many(self, db, rows):
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        if self.connection_failures:
+            self.connection_failures -= 1
+            raise ConnectionResetError("connection reset by peer")
+        if any(row["name"] in self.reject for row in rows):
+            raise DBAPIError("INSERT INTO contact ...", {}, Exception("violates check constraint"))
+        self.batches.append([row["name"] for row in rows])
+
+    @property
+    def written(self):
+        return [name for batch in self.batches for name in batch]
+
+
+def _buffer(repository, **options):
+    options.setdefault("max_size", 100)
+    options.setdefault("batch_size", 10)
+    options.setdefault("flush_interval", 0.05)
+    options.setdefault("enqueue_timeout", 0.05)
+    options.setdefault("drain_timeout", 5)
+    return ContactWriteBuffer(contact_repository=repository, **options)
+
+
+def _row(name):
+    return {"name": name, "email": f"{name}@example.com", "subject": "Hello", "message": "Hi there"}
+
+
+def test_full_batch_is_written_with_one_insert():
+    async def run():
+        repository = FakeContactRepository()
+        buffer = _buffer(repository, batch_size=5, flush_interval=10)
+        await buffer.start()
+        for i in range(5):
+            await buffer.submit(_row(f"c{i}"))
+        await asyncio.wait_for(buffer._queue.join(), 1)
+        await buffer.stop()
+        return repository
+
+    repository = asyncio.run(run())
+    assert repository.batches == [["c0", "c1", "c2", "c3", "c4"]]
+
+
+def test_partial_batch_is_written_after_flush_interval():
+    async def run():
+        repository = FakeContactRepository()
+        buffer = _buffer(repository, flush_interval=0.05)
+        await buffer.start()
+        await buffer.submit(_row("a"))
+        await buffer.submit(_row("b"))
+        await asyncio.sleep(0.3)
+        written = list(repository.batches)
+        await buffer.stop()
+        return written
+
+    assert asyncio.run(run()) == [["a", "b"]]
+
+
+def test_stop_drains_queued_submissions():
+    async def run():
+        repository = FakeContactRepository(delay=0.01)
+        buffer = _buffer(repository, batch_size=3, flush_interval=10)
+        await buffer.start()
+        for i in range(8):
+            await buffer.submit(_row(f"c{i}"))
+        await buffer.stop()
+        return repository, buffer
+
+    repository, buffer = asyncio.run(run())
+    assert repository.written == [f"c{i}" for i in range(8)]
+    assert buffer.depth == 0
+    assert not buffer.running
+
+
+def test_submissions_are_refused_once_stopped():
+    async def run():
+        buffer = _buffer(FakeContactRepository())
+        await buffer.start()
+        await buffer.stop()
+        with pytest.raises(ContactBufferFullError):
+            await buffer.submit(_row("late"))
+
+    asyncio.run(run())
+
+
+def test_full_buffer_refuses_submissions():
+    async def run():
+        repository = FakeContactRepository(delay=0.5)
+        buffer = _buffer(repository, max_size=2, batch_size=1, flush_interval=0, enqueue_timeout=0.01)
+        await buffer.start()
+        # The first row is taken off the queue and written slowly
+        await buffer.submit(_row("a"))
+        await asyncio.sleep(0.05)
+        await buffer.submit(_row("b"))
+        await buffer.submit(_row("c"))
+        with pytest.raises(ContactBufferFullError):
+            await buffer.submit(_row("d"))
+        await buffer.stop()
+        return repository
+
+    assert asyncio.run(run()).written == ["a", "b", "c"]
+
+
+def test_rejected_rows_are_dropped_alone():
+    async def run():
+        repository = FakeContactRepository(reject={"bad"})
+        buffer = _buffer(repository, flush_interval=10)
+        await buffer.start()
+        for name in ["a", "bad", "b"]:
+            await buffer.submit(_row(name))
+        await buffer.stop()
+        return repository
+
+    assert asyncio.run(run()).written == ["a", "b"]
+
+
+def test_connection_failures_are_retried(monkeypatch):
+    monkeypatch.setattr(asyncio, "sleep", _no_sleep(asyncio.sleep))
+
+    async def run():
+        repository = FakeContactRepository(connection_failures=2)
+        buffer = _buffer(repository, flush_interval=10, max_attempts=3)
+        await buffer.start()
+        await buffer.submit(_row("a"))
+        await buffer.stop()
+        return repository
+
+    assert asyncio.run(run()).written == ["a"]
+
+
+def test_batch_is_given_up_after_max_attempts(monkeypatch):
+    monkeypatch.setattr(asyncio, "sleep", _no_sleep(asyncio.sleep))
+
+    async def run():
+        repository = FakeContactRepository(connection_failures=3)
+        buffer = _buffer(repository, flush_interval=10, max_attempts=3)
+        await buffer.start()
+        await buffer.submit(_row("lost"))
+        await buffer.submit(_row("lost-too"))
+        await buffer.stop()
+        # The buffer keeps running after giving up on a batch
+        await buffer.start()
+        await buffer.submit(_row("later"))
+        await buffer.stop()
+        return repository
+
+    assert asyncio.run(run()).written == ["later"]
+
+
+def _no_sleep(sleep):
+    # Skips retry backoff, while still yielding to the event loop
+    async def no_sleep(delay, *args, **kwargs):
+        await sleep(0)
+
+    return no_sleep
@@ -0,0 +1,76 @@
+import base64
+import json
+from datetime import datetime
+from uuid import uuid4
+
+import pytest
+
+from app.domain.services.pagination import (
+    Cursor,
+    InvalidCursorError,
+    decode_cursor,
+    encode_cursor,
+    filter_hash,
+)
+
+
+def _token(payload):
+    raw = json.dumps(payload).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode("ascii")
+
+
+@pytest.mark.parametrize(
+    "sort_by, value",
+    [
+        ("publication_dt", datetime(2024, 5, 17, 9, 30, 12, 345678)),
+        ("updated_dt", None),
+        ("title", "Keyset pagination, explained"),
+        ("reading_time", 7),
+        ("relevance", 0.0607927),
+    ],
+)
+def test_cursor_round_trip(sort_by, value):
+    cursor = Cursor(sort_by=sort_by, sort_dir="desc", value=value, id=uuid4())
+    assert decode_cursor(encode_cursor(cursor)) == cursor
+
+    before = Cursor(sort_by=sort_by, sort_dir="asc", value=value, id=uuid4(), before=True)
+    assert decode_cursor(encode_cursor(before)) == before
+
+    filtered = Cursor(sort_by=sort_by, sort_dir="asc", value=value, id=uuid4(), filters=filter_hash(tags=["a"]))
+    assert decode_cursor(encode_cursor(filtered)) == filtered
+
+
+def test_filter_hash_depends_on_every_filter():
+    base = filter_hash(search_term="postgres", tags=["a", "b"], tag_match="any")
+    assert filter_hash(tag_match="any", tags=["a", "b"], search_term="postgres") == base
+    assert filter_hash(search_term="postgresql", tags=["a", "b"], tag_match="any") != base
+    assert filter_hash(search_term="postgres", tags=["a"], tag_match="any") != base
+    assert filter_hash(search_term="postgres", tags=["a", "b"], tag_match="all") != base
+
+
+def test_cursor_token_is_url_safe():
+    token = encode_cursor(Cursor("title", "asc", "?&=/+ é", uuid4()))
+    assert all(c.isalnum() or c in "-_" for c in token)
+
+
+@pytest.mark.parametrize(
+    "token",
+    [
+        "not-a-cursor",
+        "",
+        _token({"s": "title", "d": "asc", "v": "a"}),
+        _token({"s": "title", "d": "sideways", "v": "a", "i": str(uuid4())}),
+        _token({"s": "title", "d": "asc", "v": "a", "i": 42}),
+        _token({"s": "title", "d": "asc", "v": "a", "i": "not-a-uuid"}),
+        _token({"s": "title", "d": "asc", "v": 3, "i": str(uuid4())}),
+        _token({"s": "reading_time", "d": "asc", "v": True, "i": str(uuid4())}),
+        _token({"s": "reading_time", "d": "asc", "v": "7", "i": str(uuid4())}),
+        _token({"s": "publication_dt", "d": "asc", "v": 1715938212, "i": str(uuid4())}),
+        _token({"s": "publication_dt", "d": "asc", "v": "yesterday", "i": str(uuid4())}),
+        _token({"s": "view_count", "d": "asc", "v": 3, "i": str(uuid4())}),
+        _token({"s": "title", "d": "asc", "v": "a", "i": str(uuid4()), "f": 7}),
+    ],
+)
+def test_invalid_cursor_is_rejected(token):
+    with pytest.raises(InvalidCursorError):
+        decode_cursor(token)
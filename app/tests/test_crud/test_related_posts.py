@@ -0,0 +1,46 @@
+from sqlalchemy import func, select
+
+from app.data import events
+from app.data.events import BlogWriteEvent, notify_related_write
+from app.data.models.blog import related_blog
+from app.data.models.blog_write import BlogWrite
+from app.domain.services.related_posts import RELATIONSHIP_TYPE
+
+CONTENT = "Keyset pagination walks a composite index with a cursor instead of counting skipped rows. "
+
+
+def _related_ids(db, blog_id):
+    db.rollback()
+    return set(
+        db.scalars(
+            select(related_blog.c.related_blog_id).where(
+                related_blog.c.source_blog_id == blog_id,
+                related_blog.c.relationship_type == RELATIONSHIP_TYPE,
+            )
+        )
+    )
+
+
+def test_written_posts_get_related_posts_through_the_write_log(client, db, make_tag, make_blog, wait_for):
+    tag = make_tag()
+    first = make_blog(tags=[tag], title="Keyset pagination in Postgres", content=CONTENT * 20)
+    second = make_blog(tags=[tag], title="Keyset pagination with cursors", content=CONTENT * 20)
+
+    # Applied by the API worker holding the log lock, off the commit path
+    wait_for(lambda: second.id in _related_ids(db, first.id), timeout=60)
+    assert first.id in _related_ids(db, second.id)
+
+
+def test_related_writes_reach_only_related_listeners(client, db, monkeypatch):
+    blog_writes, related_writes = [], []
+    monkeypatch.setattr(events, "_listeners", [blog_writes.append])
+    monkeypatch.setattr(events, "_related_listeners", [related_writes.append])
+    latest = db.scalar(select(func.max(BlogWrite.id)))
+
+    notify_related_write(slugs={"some-post"})
+
+    assert blog_writes == []
+    assert related_writes == [BlogWriteEvent(slugs={"some-post"})]
+    # Not logged, so the feed validators keep their write id
+    db.rollback()
+    assert db.scalar(select(func.max(BlogWrite.id))) == latest
@@ -0,0 +1,226 @@
+from uuid import uuid4
+
+import pytest
+
+from app.data.models.blog import Blog
+from app.data.repositories.session import SessionLocal
+from app.domain.services.search import InMemorySearchBackend, OpenSearchBackend, SearchQuery, SearchService
+from app.domain.services.search.backends import split_alternatives
+
+
+def _document(title, content="", **fields):
+    document = {
+        "id": str(uuid4()),
+        "title": title,
+        "excerpt": "",
+        "content": content,
+        "status": "published",
+        "tag_ids": [],
+        "tag_names": [],
+    }
+    document.update(fields)
+    return document
+
+
+@pytest.fixture
+def backend():
+    backend = InMemorySearchBackend()
+    backend.reindex(
+        [
+            _document("Postgres indexes", "btree and gin"),
+            _document("Redis caching", "eviction policies"),
+            _document("Postgres caching", "shared buffers"),
+            _document("Kubernetes", "pods and services"),
+        ]
+    )
+    return backend
+
+
+def _titles(backend, term):
+    result = backend.search(SearchQuery(term=term, sort_by="title", sort_dir="asc"))
+    titles = {entry["document"]["id"]: entry["document"]["title"] for entry in backend._documents.values()}
+    return [titles[str(blog_id)] for blog_id in result.ids]
+
+
+@pytest.mark.parametrize(
+    "term, alternatives",
+    [
+        ("postgres", ["postgres"]),
+        ("postgres or redis", ["postgres", "redis"]),
+        ("postgres caching OR kubernetes", ["postgres caching", "kubernetes"]),
+        ('"or" or -redis', ['"or"', "-redis"]),
+        ("or postgres or or", ["postgres"]),
+        ("or", []),
+    ],
+)
+def test_split_alternatives(term, alternatives):
+    assert split_alternatives(term) == alternatives
+
+
+@pytest.mark.parametrize(
+    "term, titles",
+    [
+        ("postgres", ["Postgres caching", "Postgres indexes"]),
+        ("postgres caching", ["Postgres caching"]),
+        ("postgres or redis", ["Postgres caching", "Postgres indexes", "Redis caching"]),
+        # AND binds tighter than OR, as in websearch_to_tsquery
+        ("postgres caching or kubernetes", ["Kubernetes", "Postgres caching"]),
+        ("caching -redis or pods", ["Kubernetes", "Postgres caching"]),
+        ('"shared buffers" or "btree and gin"', ["Postgres caching", "Postgres indexes"]),
+        ("or", []),
+    ],
+)
+def test_memory_search_syntax(backend, term, titles):
+    assert _titles(backend, term) == titles
+
+
+def test_memory_reindex_replaces_documents(backend):
+    backend.reindex([_document("Only this one")])
+    assert _titles(backend, "postgres") == []
+    assert _titles(backend, "only") == ["Only this one"]
+
+
+def test_memory_reindex_keeps_writes_made_while_building(backend):
+    kept, deleted = _document("Kept caching"), _document("Deleted caching")
+
+    def documents():
+        yield kept
+        yield deleted
+        # Synced by a blog write while the build is still reading rows
+        backend.index_documents([_document("Written caching"), dict(kept, title="Edited caching")])
+        backend.delete_documents([deleted["id"]])
+
+    backend.reindex(documents())
+    assert _titles(backend, "caching") == ["Edited caching", "Written caching"]
+
+
+class FakeIndices:
+    def __init__(self, indices, aliases):
+        self.indices = set(indices)
+        self.aliases = dict(aliases)
+        self.alias_updates = []
+
+    def create(self, index, body):
+        self.indices.add(index)
+
+    def refresh(self, index):
+        pass
+
+    def delete(self, index):
+        self.indices.discard(index)
+
+    def exists(self, index):
+        return index in self.indices or index in self.aliases.values()
+
+    def get_alias(self, name):
+        from opensearchpy.exceptions import NotFoundError
+
+        indices = {index: {} for index, alias in self.aliases.items() if alias == name}
+        if not indices:
+            raise NotFoundError(404, "alias_missing")
+        return indices
+
+    def update_aliases(self, body):
+        self.alias_updates.append(body["actions"])
+        for action in body["actions"]:
+            (kind, target), = action.items()
+            if kind == "add":
+                self.aliases[target["index"]] = target["alias"]
+            elif kind == "remove":
+                del self.aliases[target["index"]]
+            else:
+                self.indices.discard(target["index"])
+
+
+def _opensearch(monkeypatch, indices, aliases):
+    backend = OpenSearchBackend("http://localhost:9200", index="blogs")
+    backend.client.indices = FakeIndices(indices, aliases)
+    written = []
+    monkeypatch.setattr(backend, "_bulk", lambda actions, refresh="wait_for": written.extend(actions) or len(written))
+    return backend, written
+
+
+def test_opensearch_reindex_swaps_the_alias(monkeypatch):
+    backend, written = _opensearch(monkeypatch, {"blogs-1"}, {"blogs-1": "blogs"})
+
+    assert backend.reindex([_document("New")]) == 1
+
+    indices = backend.client.indices
+    (new_index,) = indices.indices
+    assert new_index.startswith("blogs-") and new_index != "blogs-1"
+    assert indices.aliases == {new_index: "blogs"}
+    # One atomic update moves the alias
+    assert indices.alias_updates == [
+        [{"add": {"index": new_index, "alias": "blogs"}}, {"remove": {"index": "blogs-1", "alias": "blogs"}}]
+    ]
+    assert {action["_index"] for action in written} == {new_index}
+
+
+def test_opensearch_reindex_replaces_an_unaliased_index(monkeypatch):
+    backend, _ = _opensearch(monkeypatch, {"blogs"}, {})
+
+    backend.reindex([_document("New")])
+
+    indices = backend.client.indices
+    (new_index,) = indices.indices
+    assert indices.aliases == {new_index: "blogs"}
+    assert indices.alias_updates[0][-1] == {"remove_index": {"index": "blogs"}}
+
+
+def test_opensearch_failed_reindex_keeps_the_live_index(monkeypatch):
+    from app.domain.services.search import SearchBackendError
+
+    backend, _ = _opensearch(monkeypatch, {"blogs-1"}, {"blogs-1": "blogs"})
+
+    def failing_bulk(actions, refresh="wait_for"):
+        list(actions)
+        raise SearchBackendError("bulk failed")
+
+    monkeypatch.setattr(backend, "_bulk", failing_bulk)
+    with pytest.raises(SearchBackendError):
+        backend.reindex([_document("New")])
+
+    assert backend.client.indices.indices == {"blogs-1"}
+    assert backend.client.indices.aliases == {"blogs-1": "blogs"}
+
+
+def test_opensearch_reindex_catches_up_before_the_swap(monkeypatch):
+    backend, written = _opensearch(monkeypatch, {"blogs-1"}, {"blogs-1": "blogs"})
+    indices = backend.client.indices
+    caught_up = []
+
+    def catch_up(new_backend):
+        # Still before the alias moves, and writing to the new index
+        assert indices.alias_updates == []
+        caught_up.append(new_backend.index)
+        new_backend.index_documents([_document("Written during the build")])
+
+    backend.reindex([_document("New")], catch_up=catch_up)
+
+    (new_index,) = indices.indices
+    assert caught_up == [new_index]
+    assert [action["_index"] for action in written] == [new_index, new_index]
+    assert backend.index == "blogs"
+
+
+def test_reindex_all_syncs_blogs_written_during_the_build(db, make_blog):
+    blog = make_blog(title="Before the build")
+
+    class SeparateIndexBackend(InMemorySearchBackend):
+        """Builds into a separate index, like OpenSearch, so writes in between miss it."""
+
+        def reindex(self, documents, catch_up=None):
+            built = InMemorySearchBackend()
+            built.reindex(documents)
+            other = SessionLocal()
+            other.get(Blog, blog.id).title = "Edited during the build"
+            other.commit()
+            other.close()
+            catch_up(built)
+            self._documents = built._documents
+            return len(built._documents)
+
+    service = SearchService(SeparateIndexBackend())
+    service.reindex_all(db)
+
+    assert service.backend._documents[str(blog.id)]["document"]["title"] == "Edited during the build"
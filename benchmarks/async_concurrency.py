@@ -0,0 +1,81 @@
+"""
+Compare request concurrency on the sync and async database paths.
+
+Simulates N concurrent list requests inside one event loop, as a single
+uvicorn worker would see them. The sync path runs BlogRepository on a
+SessionLocal session inside a coroutine, the way the handlers used to; the
+async path runs AsyncBlogRepository on an AsyncSession. ``--latency-ms`` adds
+a server-side pg_sleep per request to stand in for a remote database.
+
+    python -m benchmarks.async_concurrency --requests 200 --concurrency 20 --latency-ms 20
+"""
+import argparse
+import asyncio
+import os
+import sys
+import time
+
+from sqlalchemy import func, select
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.data.repositories.blog_repository import AsyncBlogRepository, BlogRepository
+from app.data.repositories.session import AsyncSessionLocal, SessionLocal, dispose_engines
+
+
+async def sync_request(repository: BlogRepository, latency: float):
+    db = SessionLocal()
+    try:
+        if latency:
+            db.execute(select(func.pg_sleep(latency)))
+        repository.get_published_blogs(db, page_size=10)
+    finally:
+        db.close()
+
+
+async def async_request(repository: AsyncBlogRepository, latency: float):
+    async with AsyncSessionLocal() as db:
+        if latency:
+            await db.execute(select(func.pg_sleep(latency)))
+        await repository.get_published_blogs(db, page_size=10)
+
+
+async def run(request, repository, total: int, concurrency: int, latency: float) -> float:
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def bounded():
+        async with semaphore:
+            await request(repository, latency)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(bounded() for _ in range(total)))
+    return time.perf_counter() - started
+
+
+async def main(total: int, concurrency: int, latency_ms: float):
+    latency = latency_ms / 1000
+    sync_repository, async_repository = BlogRepository(), AsyncBlogRepository()
+
+    # Warm both pools so connection setup is not timed
+    await run(sync_request, sync_repository, concurrency, concurrency, 0)
+    await run(async_request, async_repository, concurrency, concurrency, 0)
+
+    sync_elapsed = await run(sync_request, sync_repository, total, concurrency, latency)
+    async_elapsed = await run(async_request, async_repository, total, concurrency, latency)
+
+    print(f"{total} requests, concurrency {concurrency}, +{latency_ms:g} ms per request")
+    print(f"  sync session:  {sync_elapsed:8.3f} s  {total / sync_elapsed:8.1f} req/s")
+    print(f"  async session: {async_elapsed:8.3f} s  {total / async_elapsed:8.1f} req/s")
+    print(f"  speedup:       {sync_elapsed / async_elapsed:8.2f}x")
+
+    await dispose_engines()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=10)
+    parser.add_argument("--latency-ms", type=float, default=20.0)
+    args = parser.parse_args()
+
+    asyncio.run(main(args.requests, args.concurrency, args.latency_ms))
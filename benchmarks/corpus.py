@@ -0,0 +1,238 @@
+"""
+Generate a synthetic blog corpus for load and latency benchmarks.
+
+Posts are shaped like a real blog rather than uniform filler:
+
+- length: log-normal word counts (median ``--median-words``), so most posts
+  are a few minutes' read and a long tail runs to long-form articles
+- text: words drawn from a Zipf-distributed vocabulary, so search terms
+  range from very common to rare, as in real prose
+- tags: each post gets 1-6 tags, picked by Zipf popularity, so a few tags
+  cover most posts and many cover few
+- dates: publication dates over ``--years`` with posting frequency growing
+  towards the present; about 10% drafts and 5% archived posts
+- reading time, excerpt and the other derived fields come from
+  app.data.content, as for posts written through the ORM
+
+Rows are written with chunked Core inserts through the sync engine, and
+every generated slug starts with ``--prefix`` so ``--purge`` can remove a
+previous corpus.
+
+    python -m benchmarks.corpus --posts 100000 --tags 200 --seed 42 --purge
+"""
+import argparse
+import math
+import os
+import random
+import sys
+import time
+import uuid
+from datetime import datetime, timedelta
+from typing import Dict, Iterator, List
+
+from sqlalchemy import delete, func, insert, select
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.data.content import summarize_content
+from app.data.events import notify_blog_write
+from app.data.models.blog import Blog, blog_tag
+from app.data.models.tag import Tag
+from app.data.repositories.session import get_engine
+
+SYLLABLES = [
+    "ka", "lo", "mi", "ren", "to", "sa", "vi", "del", "nor", "qua", "bre", "tis",
+    "on", "ex", "py", "dat", "ser", "ver", "lan", "gu", "ap", "io", "cach", "que",
+]
+
+# Real words mixed into the vocabulary so benchmark searches read naturally
+TOPIC_WORDS = [
+    "python", "postgres", "fastapi", "async", "cache", "index", "query", "latency",
+    "deploy", "docker", "design", "testing", "security", "search", "database",
+    "performance", "typing", "frontend", "career", "writing", "linux", "network",
+]
+
+CHUNK_SIZE = 1000
+
+
+def build_vocabulary(rng: random.Random, size: int) -> List[str]:
+    words = set(TOPIC_WORDS)
+    while len(words) < size:
+        words.add("".join(rng.choice(SYLLABLES) for _ in range(rng.randint(1, 4))))
+    vocabulary = sorted(words)
+    rng.shuffle(vocabulary)
+    return vocabulary
+
+
+class ZipfSampler:
+    """Draws items with probability proportional to 1 / (rank ** s)."""
+
+    def __init__(self, rng: random.Random, items: List, s: float = 1.1):
+        self.rng = rng
+        self.items = items
+        running, self.cumulative = 0.0, []
+        for rank in range(1, len(items) + 1):
+            running += 1 / (rank ** s)
+            self.cumulative.append(running)
+
+    def sample(self, k: int = 1) -> List:
+        return self.rng.choices(self.items, cum_weights=self.cumulative, k=k)
+
+
+class CorpusGenerator:
+    """Produces blog rows and their tag links from a seeded random source."""
+
+    def __init__(
+        self,
+        seed: int,
+        tag_ids: List[uuid.UUID],
+        prefix: str,
+        median_words: int,
+        years: int,
+        vocabulary_size: int = 20000,
+    ):
+        self.rng = random.Random(seed)
+        self.tag_ids = tag_ids
+        self.prefix = prefix
+        self.median_words = median_words
+        self.years = years
+        self.vocabulary = build_vocabulary(self.rng, vocabulary_size)
+        self.words = ZipfSampler(self.rng, self.vocabulary)
+        self.tags = ZipfSampler(self.rng, tag_ids)
+        self.now = datetime.utcnow()
+
+    def word_count(self) -> int:
+        count = int(self.rng.lognormvariate(math.log(self.median_words), 0.6))
+        return min(max(count, 50), 20000)
+
+    def sentence(self, length: int) -> str:
+        return " ".join(self.words.sample(length)).capitalize() + "."
+
+    def content(self, words: int) -> str:
+        sections, written = [], 0
+        while written < words:
+            section = [f"## {self.sentence(self.rng.randint(2, 6))[:-1]}"]
+            for _ in range(self.rng.randint(2, 5)):
+                paragraph = []
+                for _ in range(self.rng.randint(3, 7)):
+                    length = self.rng.randint(6, 22)
+                    paragraph.append(self.sentence(length))
+                    written += length
+                section.append(" ".join(paragraph))
+            sections.append("\n\n".join(section))
+        return "\n\n".join(sections)
+
+    def publication_dt(self) -> datetime:
+        # Square root skews towards recent dates: more posts as the blog matures
+        age = (1 - math.sqrt(self.rng.random())) * self.years * 365
+        return self.now - timedelta(days=age, seconds=self.rng.randint(0, 86399))
+
+    def post(self, number: int) -> Dict:
+        words = self.word_count()
+        status = self.rng.choices(["published", "draft", "archived"], [85, 10, 5])[0]
+        published = self.publication_dt() if status != "draft" else None
+        title = self.sentence(self.rng.randint(3, 9))[:-1]
+        content = self.content(words)
+        summary = summarize_content(content)
+        return {
+            "id": uuid.uuid4(),
+            "title": title[:255],
+            "slug": f"{self.prefix}{number}",
+            "content": content,
+            "excerpt": summary.excerpt,
+            "seo_description": summary.seo_description,
+            "status": status,
+            "publication_dt": published,
+            "updated_dt": (published or self.now) + timedelta(days=self.rng.random() * 30),
+            "created_dt": published or self.now,
+            "reading_time": summary.reading_time,
+            "word_count": summary.word_count,
+            "content_hash": summary.content_hash,
+            "outline": summary.outline,
+        }
+
+    def post_tags(self, blog_id: uuid.UUID) -> List[Dict]:
+        wanted = min(len(self.tag_ids), self.rng.choice([1, 1, 2, 2, 2, 3, 3, 4, 5, 6]))
+        chosen = set()
+        while len(chosen) < wanted:
+            chosen.add(self.tags.sample()[0])
+        return [{"blog_id": blog_id, "tag_id": tag_id} for tag_id in chosen]
+
+    def chunks(self, posts: int, start: int = 0) -> Iterator[tuple]:
+        for offset in range(0, posts, CHUNK_SIZE):
+            rows = [self.post(start + number) for number in range(offset, min(offset + CHUNK_SIZE, posts))]
+            links = [link for row in rows for link in self.post_tags(row["id"])]
+            yield rows, links
+
+
+def ensure_tags(count: int, prefix: str, rng: random.Random) -> List[uuid.UUID]:
+    """Reuse existing tags and create ``{prefix}tag-N`` ones until there are ``count``."""
+    with get_engine().begin() as connection:
+        tag_ids = list(connection.scalars(select(Tag.id).order_by(Tag.name)))
+        missing = [
+            {
+                "id": uuid.uuid4(),
+                "name": f"{prefix}tag-{number}",
+                "description": "Generated benchmark tag",
+                "color_code": "#%06X" % rng.randint(0, 0xFFFFFF),
+                "created_dt": datetime.utcnow(),
+            }
+            for number in range(len(tag_ids), count)
+        ]
+        if missing:
+            connection.execute(insert(Tag), missing)
+            tag_ids.extend(tag["id"] for tag in missing)
+    return tag_ids[:count]
+
+
+def purge(prefix: str) -> int:
+    with get_engine().begin() as connection:
+        deleted = connection.execute(delete(Blog).where(Blog.slug.startswith(prefix))).rowcount
+        connection.execute(delete(Tag).where(Tag.name.startswith(f"{prefix}tag-")))
+    return deleted
+
+
+def main(args) -> None:
+    if args.purge:
+        print(f"purged {purge(args.prefix)} generated posts")
+
+    with get_engine().connect() as connection:
+        start = connection.scalar(
+            select(func.count()).select_from(Blog).where(Blog.slug.startswith(args.prefix))
+        )
+
+    rng = random.Random(args.seed)
+    tag_ids = ensure_tags(args.tags, args.prefix, rng)
+    generator = CorpusGenerator(
+        seed=args.seed + start,
+        tag_ids=tag_ids,
+        prefix=args.prefix,
+        median_words=args.median_words,
+        years=args.years,
+    )
+
+    started, written, links_written = time.perf_counter(), 0, 0
+    for rows, links in generator.chunks(args.posts, start=start):
+        with get_engine().begin() as connection:
+            connection.execute(insert(Blog), rows)
+            connection.execute(insert(blog_tag), links)
+        written += len(rows)
+        links_written += len(links)
+        elapsed = time.perf_counter() - started
+        print(f"\r{written:,d}/{args.posts:,d} posts, {written / elapsed:,.0f} posts/s", end="", flush=True)
+
+    print(f"\nwrote {written:,d} posts and {links_written:,d} tag links over {len(tag_ids)} tags "
+          f"in {time.perf_counter() - started:.1f} s")
+    notify_blog_write(bulk=True)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--posts", type=int, default=10000)
+    parser.add_argument("--tags", type=int, default=100)
+    parser.add_argument("--median-words", type=int, default=900)
+    parser.add_argument("--years", type=int, default=8)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--prefix", default="bench-", help="Slug prefix of generated posts")
+    parser.add_argument("--purge", action="store_true", help="Delete previously generated posts first")
+    main(parser.parse_args())
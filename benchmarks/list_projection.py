@@ -0,0 +1,129 @@
+"""
+Measure what one listing page costs with and without the list projection.
+
+"full" loads whole Blog and Tag rows, as the listing query used to; "projected"
+is the repository's page statement, which loads only the listed columns. For
+each, the page's result set is copied out of Postgres to count the bytes sent
+over the wire (text format, so roughly what the driver receives), and the ORM
+query is run under tracemalloc to measure the Python memory a page needs.
+
+``--posts`` long-form posts with ``--content-kb`` of content are inserted
+first, inside a transaction that is rolled back at the end.
+
+    python -m benchmarks.list_projection --posts 50 --content-kb 64 --page-size 10
+"""
+import argparse
+import io
+import os
+import sys
+import time
+import tracemalloc
+import uuid
+from datetime import datetime, timedelta
+
+from sqlalchemy import desc, select
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import Session, joinedload
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.data.models.blog import Blog
+from app.data.repositories.blog_repository import PublishedBlogsQuery
+from app.data.repositories.session import get_engine
+
+
+def seed(db: Session, posts: int, content_kb: int) -> None:
+    paragraph = "Long-form benchmark paragraph with enough words to look like prose. " * 15
+    content = (paragraph + "\n\n") * max(1, content_kb * 1024 // (len(paragraph) + 2))
+    now = datetime.utcnow()
+    for number in range(posts):
+        db.add(
+            Blog(
+                title=f"Benchmark post {number}",
+                slug=f"benchmark-{uuid.uuid4().hex}",
+                content=content,
+                excerpt=paragraph[:200],
+                seo_description=paragraph[:255],
+                status="published",
+                # Newer than any real post, so they fill the first pages
+                publication_dt=now + timedelta(days=1, minutes=number),
+                reading_time=max(1, len(content.split()) // 200),
+            )
+        )
+    db.flush()
+
+
+def full_statement(page_size: int):
+    return (
+        select(Blog)
+        .options(joinedload(Blog.tags))
+        .where(Blog.status == "published")
+        .order_by(desc(Blog.publication_dt), desc(Blog.id))
+        .limit(page_size + 1)
+    )
+
+
+def projected_statement(page_size: int):
+    return PublishedBlogsQuery(page_size=page_size, include_total=False).page_statement()
+
+
+def wire_bytes(db: Session, stmt) -> int:
+    sql = stmt.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True})
+    buffer = io.BytesIO()
+    db.connection().connection.cursor().copy_expert(f"COPY ({sql}) TO STDOUT", buffer)
+    return buffer.tell()
+
+
+def page_memory(db: Session, stmt, runs: int):
+    """Peak Python memory and mean time to load one page into ORM objects."""
+    peaks, elapsed = [], 0.0
+    for _ in range(runs):
+        # A fresh identity map per run, on the seeding transaction's connection
+        page_db = Session(bind=db.connection())
+        tracemalloc.start()
+        started = time.perf_counter()
+        page_db.execute(stmt).unique().all()
+        elapsed += time.perf_counter() - started
+        peaks.append(tracemalloc.get_traced_memory()[1])
+        tracemalloc.stop()
+        page_db.close()
+    return sorted(peaks)[len(peaks) // 2], elapsed / runs
+
+
+def main(posts: int, content_kb: int, page_size: int, runs: int) -> None:
+    db = Session(bind=get_engine())
+    try:
+        seed(db, posts, content_kb)
+
+        print(f"page of {page_size}, {posts} seeded posts with {content_kb} KB of content, {runs} runs")
+        print(f"  {'':10} {'wire bytes':>12} {'peak memory':>12} {'time':>10}")
+        results = {}
+        for name, stmt in (
+            ("full", full_statement(page_size)),
+            ("projected", projected_statement(page_size)),
+        ):
+            transferred = wire_bytes(db, stmt)
+            memory, seconds = page_memory(db, stmt, runs)
+            results[name] = (transferred, memory, seconds)
+            print(f"  {name:10} {transferred:12,d} {memory:12,d} {seconds * 1000:8.2f} ms")
+
+        full, projected = results["full"], results["projected"]
+        print(
+            f"  reduction: {full[0] / max(projected[0], 1):.1f}x bytes, "
+            f"{full[1] / max(projected[1], 1):.1f}x memory, "
+            f"{full[2] / max(projected[2], 1e-9):.1f}x time"
+        )
+    finally:
+        db.rollback()
+        db.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--posts", type=int, default=50)
+    parser.add_argument("--content-kb", type=int, default=64)
+    parser.add_argument("--page-size", type=int, default=10)
+    parser.add_argument("--runs", type=int, default=20)
+    args = parser.parse_args()
+
+    main(args.posts, args.content_kb, args.page_size, args.runs)
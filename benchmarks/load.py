@@ -0,0 +1,264 @@
+"""
+Drive the API in-process and report latency, throughput and SQL per request.
+
+Requests go through httpx's ASGI transport straight into the FastAPI app (no
+network, no uvicorn) with the app's lifespan running, at a fixed concurrency.
+Rate limiting is switched off. Each scenario reports p50/p95/p99 latency,
+throughput, status codes and SQL statements per request, counted on both
+engines and attributed to the request that ran them.
+
+Scenarios:
+    list        first listing page
+    deep_page   a random offset page deep in the listing
+    cursor      walks the listing with next_cursor
+    search      full-text search for a random topic word
+    tags_any    listing filtered by two random tags (tag_match=any)
+    tags_all    listing filtered by two random tags (tag_match=all)
+    detail      a random published post by slug
+    login       password login (bcrypt), with --email/--password
+
+Run against a corpus from benchmarks.corpus, and set RESPONSE_CACHE_BACKEND=none
+to measure uncached requests:
+
+    python -m benchmarks.load --scenarios list,search,detail --requests 500 \\
+        --concurrency 16 --output results/$(date +%F)-load.json
+"""
+import argparse
+import asyncio
+import contextvars
+import json
+import math
+import os
+import platform
+import random
+import subprocess
+import sys
+import time
+from collections import Counter
+from datetime import datetime
+from typing import Callable, Dict, List, Optional
+
+import httpx
+from sqlalchemy import event, func, select
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.core.config import settings
+from app.core.rate_limiting import limiter
+from app.data.models.blog import Blog
+from app.data.models.tag import Tag
+from app.data.repositories.session import SessionLocal, dispose_engines, init_engines
+from app.main import app
+
+TOPIC_WORDS = ["python", "postgres", "cache", "latency", "search", "database", "async", "design"]
+
+# Statement counter of the request running in the current task
+_statements: contextvars.ContextVar[Optional[List[int]]] = contextvars.ContextVar(
+    "benchmark_statements", default=None
+)
+
+
+def _count_statement(*args) -> None:
+    counter = _statements.get()
+    if counter is not None:
+        counter[0] += 1
+
+
+def percentile(values: List[float], fraction: float) -> float:
+    """Nearest-rank percentile of a sorted list."""
+    if not values:
+        return 0.0
+    rank = max(1, math.ceil(fraction * len(values)))
+    return values[min(rank, len(values)) - 1]
+
+
+class Fixtures:
+    """Slugs, tags and page counts the scenarios draw their parameters from."""
+
+    def __init__(self, rng: random.Random, sample_size: int = 2000):
+        db = SessionLocal()
+        try:
+            self.published = db.scalar(
+                select(func.count()).select_from(Blog).where(Blog.status == "published")
+            )
+            self.slugs = list(db.scalars(
+                select(Blog.slug)
+                .where(Blog.status == "published")
+                .order_by(func.random())
+                .limit(sample_size)
+            ))
+            self.tag_ids = [str(tag_id) for tag_id in db.scalars(select(Tag.id))]
+        finally:
+            db.close()
+        self.rng = rng
+
+
+def build_scenarios(fixtures: Fixtures, email: str, password: str) -> Dict[str, Callable]:
+    rng = fixtures.rng
+    last_page = max(1, fixtures.published // 10)
+
+    def two_tags() -> str:
+        return ",".join(rng.sample(fixtures.tag_ids, min(2, len(fixtures.tag_ids))))
+
+    cursors: List[Optional[str]] = [None]
+
+    async def cursor_walk(client: httpx.AsyncClient) -> httpx.Response:
+        cursor = cursors[-1]
+        response = await client.get("/api/blogs", params={"cursor": cursor} if cursor else {})
+        if response.status_code == 200:
+            cursors.append(response.json().get("next_cursor"))
+        return response
+
+    return {
+        "list": lambda client: client.get("/api/blogs"),
+        "deep_page": lambda client: client.get(
+            "/api/blogs", params={"page": rng.randint(max(1, last_page // 2), last_page)}
+        ),
+        "cursor": cursor_walk,
+        "search": lambda client: client.get(
+            "/api/blogs", params={"search_term": rng.choice(TOPIC_WORDS)}
+        ),
+        "tags_any": lambda client: client.get("/api/blogs", params={"tags": two_tags()}),
+        "tags_all": lambda client: client.get(
+            "/api/blogs", params={"tags": two_tags(), "tag_match": "all"}
+        ),
+        "detail": lambda client: client.get(f"/api/blogs/{rng.choice(fixtures.slugs)}"),
+        "login": lambda client: client.post(
+            "/api/admin/auth/login", data={"username": email, "password": password}
+        ),
+    }
+
+
+async def run_scenario(
+    client: httpx.AsyncClient, request: Callable, total: int, concurrency: int
+) -> Dict:
+    latencies: List[float] = []
+    statements: List[int] = []
+    statuses: Counter = Counter()
+    errors = 0
+    queue = iter(range(total))
+
+    async def worker():
+        nonlocal errors
+        for _ in queue:
+            counter = [0]
+            token = _statements.set(counter)
+            started = time.perf_counter()
+            try:
+                response = await request(client)
+                statuses[str(response.status_code)] += 1
+            except Exception:
+                errors += 1
+            finally:
+                latencies.append((time.perf_counter() - started) * 1000)
+                statements.append(counter[0])
+                _statements.reset(token)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    return {
+        "requests": total,
+        "concurrency": concurrency,
+        "elapsed_s": round(elapsed, 3),
+        "throughput_rps": round(total / elapsed, 1),
+        "errors": errors,
+        "status_codes": dict(statuses),
+        "latency_ms": {
+            "p50": round(percentile(latencies, 0.50), 3),
+            "p95": round(percentile(latencies, 0.95), 3),
+            "p99": round(percentile(latencies, 0.99), 3),
+            "mean": round(sum(latencies) / len(latencies), 3),
+            "max": round(latencies[-1], 3),
+        },
+        "sql_per_request": {
+            "mean": round(sum(statements) / len(statements), 2),
+            "max": max(statements),
+        },
+    }
+
+
+def git_revision() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True, text=True, check=True,
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+async def main(args) -> Dict:
+    limiter.enabled = False
+    engine, async_engine = init_engines()
+    for sync_engine in (engine, async_engine.sync_engine):
+        event.listen(sync_engine, "before_cursor_execute", _count_statement)
+
+    fixtures = Fixtures(random.Random(args.seed))
+    scenarios = build_scenarios(fixtures, args.email, args.password)
+    unknown = set(args.scenarios) - set(scenarios)
+    if unknown:
+        raise SystemExit(f"Unknown scenarios: {', '.join(sorted(unknown))}")
+
+    results = {
+        "timestamp": datetime.utcnow().isoformat(timespec="seconds") + "Z",
+        "git_revision": git_revision(),
+        "python": platform.python_version(),
+        "settings": {
+            "response_cache_backend": settings.RESPONSE_CACHE_BACKEND,
+            "search_backend": settings.SEARCH_BACKEND,
+            "db_pool_size": settings.DB_POOL_SIZE,
+            "db_max_overflow": settings.DB_MAX_OVERFLOW,
+            "db_sync_pool_size": settings.DB_SYNC_POOL_SIZE,
+            "db_sync_max_overflow": settings.DB_SYNC_MAX_OVERFLOW,
+            "password_hash_workers": settings.PASSWORD_HASH_WORKERS,
+        },
+        "corpus": {"published_posts": fixtures.published, "tags": len(fixtures.tag_ids)},
+        "scenarios": {},
+    }
+
+    transport = httpx.ASGITransport(app=app)
+    async with app.router.lifespan_context(app):
+        async with httpx.AsyncClient(transport=transport, base_url="http://benchmark") as client:
+            for name in args.scenarios:
+                request = scenarios[name]
+                # Warm pools and caches so connection setup is not timed
+                await run_scenario(client, request, args.concurrency, args.concurrency)
+                result = await run_scenario(client, request, args.requests, args.concurrency)
+                results["scenarios"][name] = result
+
+                latency = result["latency_ms"]
+                print(
+                    f"{name:10} {result['throughput_rps']:8.1f} req/s  "
+                    f"p50 {latency['p50']:7.2f}  p95 {latency['p95']:7.2f}  p99 {latency['p99']:7.2f} ms  "
+                    f"sql/req {result['sql_per_request']['mean']:5.2f}  {result['status_codes']}"
+                )
+
+    await dispose_engines()
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--scenarios",
+        default="list,deep_page,cursor,search,tags_any,tags_all,detail",
+        type=lambda value: [name.strip() for name in value.split(",") if name.strip()],
+    )
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--email", default="admin@example.com")
+    parser.add_argument("--password", default="password123")
+    parser.add_argument("--output", help="Write the results as JSON to this file")
+    args = parser.parse_args()
+
+    results = asyncio.run(main(args))
+    if args.output:
+        os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+        with open(args.output, "w") as output:
+            json.dump(results, output, indent=2)
+        print(f"results written to {args.output}")
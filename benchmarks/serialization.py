@@ -0,0 +1,133 @@
+"""
+Time the rendering of one blog listing page to JSON bytes.
+
+Compares three ways of turning a page of Blog rows into a response body:
+
+- response_model: build the DTOs by hand, then let FastAPI validate them
+  again against response_model and encode them with jsonable_encoder and
+  json.dumps, as list_published_blogs originally did
+- model_dump_json: build the DTOs and dump them with pydantic
+- fast path: app.api.serialization.render_blog_list (orjson, no DTOs)
+
+All three must produce identical bytes; the benchmark checks that first. No
+database is needed: pages are built from transient Blog and Tag objects.
+
+    python -m benchmarks.serialization --items 50 --tags 3 --runs 2000
+"""
+import argparse
+import os
+import sys
+import time
+import uuid
+from datetime import datetime, timedelta
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.api.schemas.blog import BlogListItemDTO, BlogListResponseDTO, TagDTO
+from app.api.serialization import render_blog_list
+from app.data.models.blog import Blog
+from app.data.models.tag import Tag
+
+
+def build_page(items: int, tags_per_blog: int):
+    tags = [
+        Tag(id=uuid.uuid4(), name=f"Tag {number}", color_code="#3776AB")
+        for number in range(tags_per_blog * 2)
+    ]
+    now = datetime.utcnow()
+    blogs = []
+    for number in range(items):
+        blog = Blog(
+            id=uuid.uuid4(),
+            title=f"Post {number}: notes on “typography” and caching",
+            slug=f"post-{number}",
+            excerpt="A short excerpt with a quote \" and a backslash \\ in it. " * 3,
+            publication_dt=now - timedelta(days=number, microseconds=number * 137),
+            reading_time=number % 12 + 1 if number % 5 else None,
+        )
+        blog.tags = tags[number % 2::2][:tags_per_blog]
+        blogs.append(blog)
+
+    return {
+        "items": blogs,
+        "total": items * 7,
+        "page": 1,
+        "page_size": items,
+        "total_pages": 7,
+        "next_cursor": "eyJzIjoicHVibGljYXRpb25fZHQifQ",
+        "prev_cursor": None,
+    }
+
+
+def build_dtos(result) -> BlogListResponseDTO:
+    return BlogListResponseDTO(
+        items=[
+            BlogListItemDTO(
+                uuid=blog.id,
+                title=blog.title,
+                slug=blog.slug,
+                excerpt=blog.excerpt,
+                publication_date=blog.publication_dt,
+                reading_time=blog.reading_time,
+                tags=[TagDTO(uuid=tag.id, name=tag.name, color_code=tag.color_code) for tag in blog.tags]
+            )
+            for blog in result["items"]
+        ],
+        total=result["total"],
+        page=result["page"],
+        page_size=result["page_size"],
+        total_pages=result["total_pages"],
+        next_cursor=result["next_cursor"],
+        prev_cursor=result["prev_cursor"]
+    )
+
+
+def render_response_model(result) -> bytes:
+    # What FastAPI does with a returned model: dump, re-validate, encode, json.dumps
+    content = build_dtos(result).model_dump(by_alias=True)
+    validated = BlogListResponseDTO.model_validate(content)
+    return JSONResponse(jsonable_encoder(validated, by_alias=True)).body
+
+
+def render_model_dump_json(result) -> bytes:
+    return build_dtos(result).model_dump_json(by_alias=True).encode("utf-8")
+
+
+def timed(render, result, runs: int) -> float:
+    started = time.perf_counter()
+    for _ in range(runs):
+        render(result)
+    return (time.perf_counter() - started) / runs
+
+
+def main(items: int, tags_per_blog: int, runs: int) -> None:
+    result = build_page(items, tags_per_blog)
+
+    expected = render_response_model(result)
+    for render in (render_model_dump_json, render_blog_list):
+        if render(result) != expected:
+            raise SystemExit(f"{render.__name__} output differs from the response_model rendering")
+
+    print(f"{items} items with {tags_per_blog} tags each, {len(expected):,d} bytes, {runs} runs")
+    baseline = None
+    for name, render in (
+        ("response_model", render_response_model),
+        ("model_dump_json", render_model_dump_json),
+        ("fast path", render_blog_list),
+    ):
+        seconds = timed(render, result, runs)
+        baseline = baseline or seconds
+        print(f"  {name:16} {seconds * 1e6:9.1f} us/page  {baseline / seconds:6.1f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--items", type=int, default=50)
+    parser.add_argument("--tags", type=int, default=3)
+    parser.add_argument("--runs", type=int, default=2000)
+    args = parser.parse_args()
+
+    main(args.items, args.tags, args.runs)
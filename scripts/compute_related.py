@@ -0,0 +1,17 @@
+import os
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.domain.services.related_posts import related_posts_service
+
+
+def compute_related():
+    started = time.perf_counter()
+    rows = related_posts_service.rebuild()
+    print(f"Wrote {rows} related post rows in {time.perf_counter() - started:.1f} s.")
+
+
+if __name__ == "__main__":
+    compute_related()
@@ -64,8 +64,7 @@ Thanks for reading my first blog post. More content coming soon!
             publication_dt=datetime.now(timezone.utc),
             status="published",
             featured_image="https://via.placeholder.com/800x400?text=My+First+Blog+Post",
-            seo_description="My first blog post about getting started with blogging and creating content",
-            reading_time=5
+            seo_description="My first blog post about getting started with blogging and creating content"
         )
 
         new_blog.tags = [tag1, tag2]
@@ -148,7 +147,6 @@ def read_root():
 This creates a simple API that returns a JSON response.""",
                 "excerpt": "Learn how to build modern APIs with FastAPI, a high-performance Python web framework.",
                 "tags": [tech_tag, python_tag, created_tags[0]] if tech_tag and python_tag else [],
-                "reading_time": 8
             },
             {
                 "title": "Database Design Best Practices",
@@ -173,7 +171,6 @@ Good database design is crucial for application performance and maintainability.
 Following these principles will help you build robust, scalable databases.""",
                 "excerpt": "Essential principles and best practices for designing efficient and scalable databases.",
                 "tags": [tech_tag, created_tags[1]] if tech_tag else [],
-                "reading_time": 12
             },
             {
                 "title": "Why I Switched to Python",
@@ -198,7 +195,6 @@ The Python community is welcoming and helpful, with excellent documentation and
 From web development to data science, Python handles it all.""",
                 "excerpt": "My personal journey and reasons for choosing Python as my primary programming language.",
                 "tags": [python_tag, created_tags[2]] if python_tag else [],
-                "reading_time": 6
             }
         ]
 
@@ -217,7 +213,6 @@ From web development to data science, Python handles it all.""",
                 excerpt=blog_data["excerpt"],
                 publication_dt=datetime.now(timezone.utc),
                 status="published",
-                reading_time=blog_data["reading_time"],
                 seo_description=blog_data["excerpt"]
             )
 
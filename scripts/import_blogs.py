@@ -0,0 +1,368 @@
+"""
+Import blog posts in bulk from Markdown files or JSONL.
+
+Sources:
+
+- a directory of ``*.md`` files (searched recursively, in path order), each
+  with YAML front matter between ``---`` lines and the post as the body
+- a ``.jsonl`` file with one post object per line, the post in ``content``
+
+Recognised fields: title, slug, status, date (or publication_date), updated,
+excerpt, description (or seo_description), featured_image and tags (a list
+or a comma-separated string). Only title and the content are required; the
+slug defaults to the slugified title and the status to published. Word
+count, reading time, content hash and outline are derived from the content
+as for ORM writes, as are the excerpt and description when not given.
+
+Posts are written in chunks, one transaction per chunk. Each chunk resolves
+its tags with one INSERT ... ON CONFLICT DO NOTHING and one SELECT, then
+writes blog and blog_tag rows with multi-row INSERT ... ON CONFLICT. Posts
+whose slug exists are skipped, or overwritten with ``--update``, so an
+interrupted import can simply be run again; with ``--checkpoint`` it also
+skips the chunks that were already committed.
+
+    python scripts/import_blogs.py posts/ --chunk-size 500 --checkpoint .import-checkpoint
+"""
+import argparse
+import json
+import os
+import re
+import sys
+import time
+import unicodedata
+from datetime import date, datetime, timezone
+from typing import Dict, Iterator, List, Optional, Set, Tuple
+from uuid import UUID
+
+import yaml
+from sqlalchemy import delete, literal_column, select
+from sqlalchemy.dialects.postgresql import insert
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.data.content import summarize_content
+from app.data.events import notify_blog_write
+from app.data.models.blog import Blog, blog_tag
+from app.data.models.tag import Tag
+from app.data.repositories.session import get_engine
+
+STATUSES = {"draft", "published", "archived"}
+
+# Blog columns an import writes, and overwrites with --update
+BLOG_COLUMNS = [
+    "title", "slug", "content", "excerpt", "seo_description", "featured_image",
+    "status", "publication_dt", "updated_dt", "reading_time", "word_count",
+    "content_hash", "outline",
+]
+
+# Limits of the String(255) columns an import writes
+MAX_LENGTH = 255
+
+_FRONT_MATTER = re.compile(r"\A---\s*\n(.*?)\n---\s*(?:\n|\Z)", re.DOTALL)
+
+
+class InvalidPost(ValueError):
+    pass
+
+
+def slugify(value: str) -> str:
+    value = unicodedata.normalize("NFKD", value).encode("ascii", "ignore").decode("ascii")
+    return re.sub(r"[^a-z0-9]+", "-", value.lower()).strip("-")
+
+
+def read_markdown(directory: str) -> Iterator[Tuple[str, Dict]]:
+    paths = sorted(
+        os.path.join(root, name)
+        for root, _, names in os.walk(directory)
+        for name in names
+        if name.endswith(".md")
+    )
+    for path in paths:
+        with open(path, encoding="utf-8") as source:
+            text = source.read()
+        match = _FRONT_MATTER.match(text)
+        if not match:
+            yield path, {"content": text}
+            continue
+        try:
+            fields = yaml.safe_load(match.group(1)) or {}
+        except yaml.YAMLError as e:
+            yield path, {"error": f"invalid front matter: {e}"}
+            continue
+        if not isinstance(fields, dict):
+            yield path, {"error": "front matter is not a mapping"}
+            continue
+        fields["content"] = text[match.end():]
+        yield path, fields
+
+
+def read_jsonl(path: str) -> Iterator[Tuple[str, Dict]]:
+    with open(path, encoding="utf-8") as source:
+        for number, line in enumerate(source, start=1):
+            if not line.strip():
+                continue
+            location = f"{path}:{number}"
+            try:
+                fields = json.loads(line)
+            except json.JSONDecodeError as e:
+                yield location, {"error": f"invalid JSON: {e}"}
+                continue
+            yield location, fields if isinstance(fields, dict) else {"error": "not an object"}
+
+
+def parse_datetime(value) -> Optional[datetime]:
+    """Accept YAML dates and datetimes and ISO 8601 strings; store naive UTC."""
+    if value is None or value == "":
+        return None
+    if isinstance(value, str):
+        try:
+            value = datetime.fromisoformat(value.strip().replace("Z", "+00:00"))
+        except ValueError:
+            raise InvalidPost(f"invalid date: {value!r}")
+    elif isinstance(value, date) and not isinstance(value, datetime):
+        value = datetime(value.year, value.month, value.day)
+    elif not isinstance(value, datetime):
+        raise InvalidPost(f"invalid date: {value!r}")
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
+
+def parse_tags(value) -> List[str]:
+    if value is None:
+        return []
+    if isinstance(value, str):
+        value = value.split(",")
+    if not isinstance(value, list):
+        raise InvalidPost(f"invalid tags: {value!r}")
+    names = []
+    for name in value:
+        name = str(name).strip()
+        if len(name) > 50:
+            raise InvalidPost(f"tag name longer than 50 characters: {name!r}")
+        if "\x00" in name:
+            raise InvalidPost("tag name contains a NUL character")
+        if name and name not in names:
+            names.append(name)
+    return names
+
+
+def to_row(fields: Dict, now: datetime) -> Tuple[Dict, List[str]]:
+    """Turn a source record into a blog row and its tag names."""
+    if "error" in fields:
+        raise InvalidPost(fields["error"])
+
+    title = str(fields.get("title") or "").strip()
+    content = str(fields.get("content") or "").strip()
+    if not title:
+        raise InvalidPost("missing title")
+    if not content:
+        raise InvalidPost("missing content")
+
+    if fields.get("slug"):
+        slug = slugify(str(fields["slug"]))
+        if len(slug) > MAX_LENGTH:
+            raise InvalidPost(f"slug longer than {MAX_LENGTH} characters: {slug[:40]!r}...")
+    else:
+        # A title-derived slug is cut at a word boundary where possible
+        slug = slugify(title)[:MAX_LENGTH].rstrip("-")
+    if not slug:
+        raise InvalidPost("empty slug")
+
+    featured_image = fields.get("featured_image")
+    if featured_image is not None:
+        if not isinstance(featured_image, str):
+            raise InvalidPost(f"invalid featured_image: {featured_image!r}")
+        featured_image = featured_image.strip() or None
+        if featured_image and len(featured_image) > MAX_LENGTH:
+            raise InvalidPost(f"featured_image longer than {MAX_LENGTH} characters")
+
+    status = str(fields.get("status") or "published").lower()
+    if status not in STATUSES:
+        raise InvalidPost(f"invalid status: {status!r}")
+
+    published = parse_datetime(
+        fields.get("date") or fields.get("publication_date") or fields.get("publication_dt")
+    )
+    if published is None and status != "draft":
+        published = now
+    updated = parse_datetime(fields.get("updated") or fields.get("updated_dt"))
+
+    summary = summarize_content(content)
+    description = fields.get("description") or fields.get("seo_description")
+    excerpt = fields.get("excerpt")
+    row = {
+        "title": title[:MAX_LENGTH],
+        "slug": slug,
+        "content": content,
+        "excerpt": str(excerpt) if excerpt else summary.excerpt,
+        "seo_description": str(description)[:MAX_LENGTH] if description else summary.seo_description,
+        "featured_image": featured_image,
+        "status": status,
+        "publication_dt": published,
+        "updated_dt": updated or published or now,
+        "created_dt": published or now,
+        "reading_time": summary.reading_time,
+        "word_count": summary.word_count,
+        "content_hash": summary.content_hash,
+        "outline": summary.outline,
+    }
+    # Postgres text cannot hold NUL; one such value would fail the whole chunk
+    for name in ("title", "content", "excerpt", "seo_description"):
+        if row[name] and "\x00" in row[name]:
+            raise InvalidPost(f"{name} contains a NUL character")
+    return row, parse_tags(fields.get("tags"))
+
+
+class BlogImporter:
+    """Writes chunks of posts, resolving tag names to ids as it goes."""
+
+    def __init__(self, update: bool = False):
+        self.update = update
+        self.tag_ids: Dict[str, UUID] = {}
+        self.created_tag_ids: Set[UUID] = set()
+        self.inserted = 0
+        self.updated = 0
+        self.skipped = 0
+        self.links = 0
+
+    def resolve_tags(self, connection, names: Set[str]) -> None:
+        missing = sorted(names - self.tag_ids.keys())
+        if not missing:
+            return
+        created = connection.execute(
+            insert(Tag)
+            .values([{"name": name, "created_dt": datetime.utcnow()} for name in missing])
+            .on_conflict_do_nothing(index_elements=[Tag.name])
+            .returning(Tag.id)
+        )
+        self.created_tag_ids.update(created.scalars())
+        self.tag_ids.update(
+            (row.name, row.id)
+            for row in connection.execute(select(Tag.id, Tag.name).where(Tag.name.in_(missing)))
+        )
+
+    def write_chunk(self, posts: List[Tuple[Dict, List[str]]]) -> None:
+        with get_engine().begin() as connection:
+            self.resolve_tags(connection, {name for _, names in posts for name in names})
+
+            stmt = insert(Blog).values([row for row, _ in posts])
+            if self.update:
+                stmt = stmt.on_conflict_do_update(
+                    index_elements=[Blog.slug],
+                    set_={column: stmt.excluded[column] for column in BLOG_COLUMNS},
+                )
+            else:
+                stmt = stmt.on_conflict_do_nothing(index_elements=[Blog.slug])
+            # xmax is 0 for freshly inserted rows and set on rows the upsert updated
+            written = connection.execute(
+                stmt.returning(Blog.id, Blog.slug, literal_column("xmax = 0").label("inserted"))
+            ).all()
+
+            blog_ids = {row.slug: row.id for row in written}
+            replaced = [row.id for row in written if not row.inserted]
+            if replaced:
+                connection.execute(delete(blog_tag).where(blog_tag.c.blog_id.in_(replaced)))
+
+            links = [
+                {"blog_id": blog_ids[row["slug"]], "tag_id": self.tag_ids[name]}
+                for row, names in posts
+                if row["slug"] in blog_ids
+                for name in names
+            ]
+            if links:
+                connection.execute(insert(blog_tag).values(links).on_conflict_do_nothing())
+
+        self.updated += len(replaced)
+        self.inserted += len(written) - len(replaced)
+        self.skipped += len(posts) - len(written)
+        self.links += len(links)
+
+
+def read_checkpoint(path: Optional[str], source: str) -> int:
+    if not path or not os.path.exists(path):
+        return 0
+    with open(path) as checkpoint:
+        state = json.load(checkpoint)
+    if state.get("source") != source:
+        raise SystemExit(f"Checkpoint {path} belongs to {state.get('source')}, not {source}")
+    return state["records"]
+
+
+def write_checkpoint(path: Optional[str], source: str, records: int) -> None:
+    if path:
+        with open(path, "w") as checkpoint:
+            json.dump({"source": source, "records": records}, checkpoint)
+
+
+def import_blogs(source: str, chunk_size: int, update: bool, checkpoint: Optional[str]) -> None:
+    source = os.path.abspath(source)
+    records = read_markdown(source) if os.path.isdir(source) else read_jsonl(source)
+    done = read_checkpoint(checkpoint, source)
+    if done:
+        print(f"Resuming after {done:,d} records")
+
+    importer = BlogImporter(update=update)
+    now = datetime.utcnow()
+    chunk: Dict[str, Tuple[Dict, List[str]]] = {}
+    position, invalid = 0, 0
+    started = time.perf_counter()
+
+    def flush() -> None:
+        importer.write_chunk(list(chunk.values()))
+        chunk.clear()
+        write_checkpoint(checkpoint, source, position)
+        elapsed = time.perf_counter() - started
+        written = importer.inserted + importer.updated + importer.skipped
+        print(
+            f"\r{position:,d} records, {importer.inserted:,d} inserted, "
+            f"{written / elapsed:,.0f} posts/s",
+            end="",
+            flush=True,
+        )
+
+    try:
+        for location, fields in records:
+            position += 1
+            if position <= done:
+                continue
+            try:
+                row, tag_names = to_row(fields, now)
+            except InvalidPost as e:
+                invalid += 1
+                print(f"\n{location}: skipped, {e}")
+                continue
+            if row["slug"] in chunk:
+                print(f"\n{location}: slug {row['slug']!r} repeats an earlier post in the chunk, keeping the last one")
+            chunk[row["slug"]] = (row, tag_names)
+            if len(chunk) >= chunk_size:
+                flush()
+        if chunk:
+            flush()
+        elapsed = time.perf_counter() - started
+    finally:
+        if importer.inserted or importer.updated or importer.created_tag_ids:
+            # Logged for the API workers, which refresh caches, search and related posts
+            notify_blog_write(bulk=True)
+
+    if checkpoint and os.path.exists(checkpoint):
+        os.remove(checkpoint)
+
+    written = importer.inserted + importer.updated + importer.skipped
+    print(
+        f"\nImported {position - done:,d} records in {elapsed:.1f} s ({written / max(elapsed, 1e-9):,.0f} posts/s): "
+        f"{importer.inserted:,d} inserted, {importer.updated:,d} updated, "
+        f"{importer.skipped:,d} already present, {invalid:,d} invalid, "
+        f"{len(importer.created_tag_ids):,d} new tags, {importer.links:,d} tag links"
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("source", help="Directory of Markdown files or a .jsonl file")
+    parser.add_argument("--chunk-size", type=int, default=500)
+    parser.add_argument("--update", action="store_true", help="Overwrite posts whose slug exists")
+    parser.add_argument("--checkpoint", help="File recording progress, to resume an interrupted import")
+    args = parser.parse_args()
+
+    import_blogs(args.source, args.chunk_size, args.update, args.checkpoint)
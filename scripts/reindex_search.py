@@ -0,0 +1,29 @@
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.core.config import settings
+from app.data.repositories.session import SessionLocal
+from app.domain.services.search import get_search_service
+
+
+def reindex():
+    service = get_search_service()
+    if service is None:
+        print("SEARCH_BACKEND is 'postgres'; there is no search index to build.")
+        return
+    if settings.SEARCH_BACKEND == "memory":
+        print("SEARCH_BACKEND is 'memory'; every API worker builds its own index at startup.")
+        return
+
+    db = SessionLocal()
+    try:
+        indexed = service.reindex_all(db)
+        print(f"Indexed {indexed} published blogs.")
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    reindex()